@@ -57,6 +57,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'web.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -234,4 +235,143 @@ CORS_ALLOW_HEADERS = [
 
 # INTERNAL_IPS = [
 #     "127.0.0.1",
-# ]
\ No newline at end of file
+# ]
+
+# 뉴스 목록 API page_size 최대값 (더 크게 요청하면 이 값으로 제한)
+NEWS_PAGE_SIZE_MAX = 100
+
+# 키워드 역색인 사용 여부 (False면 keyword__icontains 검색만 사용)
+# build_keyword_index로 기존 뉴스를 색인한 뒤 켠다 (꺼 둔 동안 들어온 뉴스는 --start-id로 보충)
+KEYWORD_INDEX_ENABLED = os.getenv('KEYWORD_INDEX_ENABLED', 'false').lower() == 'true'
+# 검색어를 포함하는 키워드가 이보다 많으면 색인 대신 LIKE 검색
+KEYWORD_INDEX_MAX_MATCHES = 500
+
+# 검색 백엔드: 'keyword'(키워드 역색인/LIKE) 또는 'fulltext'(프로세스 내 n-gram BM25 엔진)
+# fulltext 엔진은 프로세스마다 색인 파일을 메모리에 올리고 그 프로세스에서 저장/삭제한 뉴스만 반영하므로
+# 여러 프로세스로 서비스할 때는 build_search_index로 색인을 주기적으로 다시 만들어야 함 (기본값은 꺼짐)
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'keyword')
+SEARCH_INDEX_PATH = os.getenv('SEARCH_INDEX_PATH', str(BASE_DIR / 'search_index.bin'))
+SEARCH_FULLTEXT_MAX_RESULTS = 5000
+
+# 키워드 일별 집계(KeywordDailyCount) 사용 여부 - 키워드 색인이 켜져 있어야 하며 켜기 전에 rebuild_news_rollup 실행
+# 켜면 차트는 검색어와 이름이 정확히 같은 키워드의 기사 수 (부분 일치 키워드는 합치지 않음, 집계 행이 없으면 원본에서 센다)
+NEWS_ROLLUP_ENABLED = os.getenv('NEWS_ROLLUP_ENABLED', 'false').lower() == 'true'
+
+# 검색어 자동완성 색인 (키워드 + 최근 뉴스 제목 + 검색 기록, 초성/자모 접두어 매칭)
+AUTOCOMPLETE_ENABLED = True
+AUTOCOMPLETE_REBUILD_SECONDS = 600
+# 최근 뉴스 제목은 이 건수까지, 앞부분 AUTOCOMPLETE_TITLE_DEPTH 자모(약 5음절)까지만 색인
+AUTOCOMPLETE_TITLE_LIMIT = 5000
+AUTOCOMPLETE_TITLE_DEPTH = 12
+# 제목을 어절마다 그 어절부터 시작하는 키로도 색인 (제목 중간 단어로 검색, 메모리는 약 2배)
+AUTOCOMPLETE_TITLE_WORD_STARTS = True
+# 키워드 색인(KEYWORD_INDEX_ENABLED)이 꺼져 있으면 최근 뉴스 이 건수의 keyword로 키워드 후보를 만듦
+AUTOCOMPLETE_KEYWORD_NEWS_LIMIT = 50000
+# 트라이 최대 깊이 (자모 수) - 더 긴 질의는 마지막 노드의 후보를 걸러 답함
+AUTOCOMPLETE_MAX_DEPTH = 30
+AUTOCOMPLETE_HISTORY_WEIGHT = 10
+
+# 요약 비동기 작업 큐 (True면 요약이 없을 때 202 + job id 반환, run_summary_worker 필요)
+SUMMARY_ASYNC_JOBS = os.getenv('SUMMARY_ASYNC_JOBS', 'false').lower() == 'true'
+SUMMARY_JOB_TIMEOUT_SECONDS = 300
+SUMMARY_JOB_MAX_ATTEMPTS = 3
+# 실패한 작업은 10초, 20초, 40초... (최대 300초) 후 다시 시도
+SUMMARY_JOB_RETRY_SECONDS = 10
+SUMMARY_JOB_RETRY_MAX_SECONDS = 300
+SUMMARY_JOB_POLL_SECONDS = 1.0
+
+# 요약 생성 single-flight 리스 (캐시 기반, 워커/노드 간 중복 LLM 호출 방지)
+SINGLE_FLIGHT_LEASE_SECONDS = 120
+SINGLE_FLIGHT_WAIT_SECONDS = 90
+# 리더를 기다리는 요청의 캐시 확인 간격 상한 (0.05초부터 두 배씩)
+SINGLE_FLIGHT_MAX_POLL_SECONDS = 1.0
+
+# 요약 조회 2단 캐시 (프로세스 내 LRU + Redis)
+SUMMARY_CACHE_LOCAL_MAX_ENTRIES = 2048
+SUMMARY_CACHE_LOCAL_TTL = 30
+SUMMARY_CACHE_TTL = 6 * 60 * 60
+
+# 호버 요약 사전 생성 (차트 첫 조회 시 / precompute_hover_summaries 명령)
+HOVER_PRECOMPUTE_ON_CHART = True
+HOVER_PRECOMPUTE_INTERVAL_SECONDS = 60 * 60
+HOVER_PRECOMPUTE_WORKERS = 4
+# 차트 조회로 예약된 사전 생성 작업을 처리하는 프로세스당 스레드 수
+HOVER_PRECOMPUTE_QUEUE_WORKERS = 2
+HOVER_PRECOMPUTE_RATE_PER_SECOND = 2
+HOVER_SUMMARY_CONTENT_CHARS = 500
+
+# 3단 요약 기사 샘플링 (기사당 본문 길이 / 전체 프롬프트 문자 예산 / 기간 분할 수)
+SUMMARY_SAMPLE_CONTENT_CHARS = 500
+SUMMARY_SAMPLE_MAX_CHARS = 60000
+SUMMARY_SAMPLE_STRATA = 10
+
+# 프롬프트 구성 (토큰 예산 / 중복 기사 판정 MinHash 유사도 기준)
+SUMMARY_PROMPT_TOKEN_BUDGET = 16000
+HOVER_PROMPT_TOKEN_BUDGET = 1500
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# 유사 기사 클러스터 (MinHash LSH, 수집 시 story_cluster 배정 / 기존 뉴스는 assign_story_clusters)
+STORY_CLUSTER_ENABLED = True
+STORY_CLUSTER_BANDS = 16
+STORY_CLUSTER_CONTENT_CHARS = 300
+STORY_CLUSTER_THRESHOLD = 0.5
+STORY_CLUSTER_COLLAPSE_SUMMARIES = True
+
+# 요약 증분 갱신 (새 뉴스가 걸린 요약만 stale 표시, 조회 시 이전 요약 + 새 기사로 백그라운드 갱신)
+SUMMARY_REFRESH_ENABLED = True
+SUMMARY_REFRESH_LEASE_SECONDS = 300
+
+# 계층 요약 (주/월 요약은 일별 요약, 전체 요약은 월별 요약을 합쳐서 생성)
+# 저장된 하위 요약이 MIN_CACHED_RATIO 이상이거나 없는 것이 MAX_GENERATE개 이하일 때만 계층 요약을 쓰고
+# (요청 안에서는 최대 MAX_GENERATE개만 병렬 생성), 아니면 기사 샘플 요약으로 대신함
+# SUMMARY_ASYNC_JOBS가 켜져 있으면(작업 워커 실행 중) 요청에서 만들지 않은 하위 요약을 작업 큐에 등록
+SUMMARY_HIERARCHICAL = True
+SUMMARY_HIERARCHY_WORKERS = 4
+SUMMARY_HIERARCHY_MAX_CHILDREN = 31
+SUMMARY_HIERARCHY_MIN_CACHED_RATIO = 0.8
+SUMMARY_HIERARCHY_MAX_GENERATE = 3
+
+# LLM 호출 (프로세스 공용 클라이언트 - 커넥션 풀, 타임아웃/기한, 분당 요청·토큰 제한, 재시도, hedged request)
+LLM_TIMEOUT_SECONDS = 30
+LLM_DEADLINE_SECONDS = 60
+LLM_MAX_RETRIES = 3
+LLM_BACKOFF_BASE_SECONDS = 0.5
+LLM_BACKOFF_MAX_SECONDS = 8
+LLM_REQUESTS_PER_MINUTE = 500
+LLM_TOKENS_PER_MINUTE = 200000
+LLM_MAX_CONNECTIONS = 100
+LLM_HEDGE_AFTER_SECONDS = None  # 예: 8 - 이 시간 안에 응답이 없으면 같은 요청을 한 번 더 보냄
+LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4o-mini')
+
+# LLM 백엔드 (openai | fake | 점 경로 클래스) - fake는 API 없이 부하 테스트/프로파일링용
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'openai')
+LLM_FAKE = {
+    'seed': 0,
+    'latency': 'lognormal',  # fixed | uniform | lognormal
+    'median_seconds': 0.8,
+    'min_seconds': 0.2,
+    'max_seconds': 2.0,
+    'sigma': 0.5,
+    'tokens_per_second': 80,
+    'throughput_sigma': 0.2,
+    'completion_tokens': 120,
+    'error_rate': 0.0,
+}
+# 녹화/재생 (record: 실제 응답 저장, replay: 저장된 응답만 사용, auto: 없으면 녹화)
+LLM_RECORD_MODE = os.getenv('LLM_RECORD_MODE', '')
+LLM_RECORD_DIR = os.getenv('LLM_RECORD_DIR', str(BASE_DIR / 'llm_recordings'))
+LLM_REPLAY_LATENCY = os.getenv('LLM_REPLAY_LATENCY', 'true').lower() == 'true'
+
+# 메트릭 (/metrics, Prometheus 텍스트 형식) - 워커가 여러 개면 METRICS_DIR에 프로세스별 스냅샷을 모아 합산
+# (배포/재시작 시 디렉터리를 비울 것)
+# /metrics는 METRICS_ALLOWED_IPS(REMOTE_ADDR 기준)에서 오거나 Authorization: Bearer METRICS_TOKEN이 맞을 때만 응답
+# (프록시 뒤에서는 REMOTE_ADDR가 프록시 주소이므로 토큰을 쓸 것)
+METRICS_ENABLED = True
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip.strip()]
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_DIR = os.getenv('METRICS_DIR', '')
+METRICS_FLUSH_SECONDS = 5
+
+# 검색 횟수(SearchHistory) 쓰기 버퍼 - 요청마다 DB에 쓰지 않고 주기적으로 합산 반영
+SEARCH_COUNTER_BUFFERED = True
+SEARCH_COUNTER_FLUSH_SECONDS = 5
@@ -10,6 +10,8 @@ class NewsListHandler {
         this.groupBy = '1day';
         this.currentPage = 1;
         this.pageSize = 10;
+        // 목록에는 본문이 필요 없으므로 표시하는 컬럼만 요청 (본문은 news_detail_api로 조회)
+        this.listFields = 'id,title,press,date,link';
         this.loading = false;
         this.hasNextPage = true;
         this.cache = {};
@@ -91,7 +93,7 @@ class NewsListHandler {
         this.resetList();
 
         try {
-            const response = await fetch(`/api/v2/news/?query=${encodeURIComponent(query)}&date=${this.currentDate}`);
+            const response = await fetch(`/api/v2/news/?query=${encodeURIComponent(query)}&date=${this.currentDate}&fields=${this.listFields}`);
             const data = await response.json();
 
             if (!response.ok) {
@@ -142,7 +144,8 @@ class NewsListHandler {
                 query: this.searchQuery,
                 page: this.currentPage.toString(),
                 page_size: this.pageSize.toString(),
-                group_by: this.groupBy
+                group_by: this.groupBy,
+                fields: this.listFields
             });
 
             if (this.startDate && this.endDate) {
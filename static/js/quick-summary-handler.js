@@ -15,13 +15,31 @@ class QuickSummaryHandler {
         try {
             this.showLoading();
 
+            // 스트리밍으로 받을 수 있으면 글자가 도착하는 대로 표시하고, 실패하면 기존 API로 요청
+            if (window.ReadableStream && window.TextDecoder) {
+                try {
+                    const streamed = await this.streamSummary();
+                    if (streamed) {
+                        this.updateUI(streamed);
+                        return;
+                    }
+                } catch (error) {
+                    console.error('간단 요약 스트리밍 오류:', error);
+                }
+            }
+
             const response = await fetch(`/api/v2/news/quick-summary/?query=${encodeURIComponent(this.searchQuery)}`);
-            const data = await response.json();
+            let data = await response.json();
 
             if (!response.ok) {
                 throw new Error(data.error || '요약을 불러오는데 실패했습니다.');
             }
 
+            // 비동기 모드: 작업이 등록되면 완료될 때까지 상태 API 폴링
+            if (response.status === 202) {
+                data = await this.waitForJob(data.status_url);
+            }
+
             this.updateUI(data);
         } catch (error) {
             console.error('Error fetching summary:', error);
@@ -29,6 +47,64 @@ class QuickSummaryHandler {
         }
     }
 
+    async streamSummary() {
+        const response = await fetch(
+            `/api/v2/news/quick-summary/stream/?query=${encodeURIComponent(this.searchQuery)}`,
+            { headers: { Accept: 'text/event-stream' } }
+        );
+        if (!response.ok || !response.body) return null;
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let text = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) return null;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const raw = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                const type = (raw.match(/^event:\s*(.*)$/m) || [])[1];
+                const dataLine = (raw.match(/^data:\s*(.*)$/m) || [])[1];
+                if (!dataLine) continue;
+                const data = JSON.parse(dataLine);
+
+                if (type === 'delta') {
+                    text += data.text;
+                    this.contentElement.textContent = text;
+                } else if (type === 'done') {
+                    reader.cancel();
+                    return data;
+                } else if (type === 'error') {
+                    reader.cancel();
+                    return null;
+                }
+            }
+        }
+    }
+
+    async waitForJob(statusUrl, interval = 1000, timeout = 60000) {
+        const startedAt = Date.now();
+
+        while (Date.now() - startedAt < timeout) {
+            await new Promise(resolve => setTimeout(resolve, interval));
+
+            const response = await fetch(statusUrl);
+            const job = await response.json();
+
+            if (job.status === 'done') return job.result;
+            if (job.status === 'failed' || !response.ok) {
+                throw new Error(job.error || '요약을 생성하는데 실패했습니다.');
+            }
+        }
+        throw new Error('요약 생성 시간이 초과되었습니다.');
+    }
+
     updateUI(data) {
         // 키워드와 요약 내용 업데이트
         this.keywordElement.textContent = this.searchQuery;
@@ -17,6 +17,13 @@ class SummaryHandler {
         this.isLoading = false;
         this.currentRequest = null;
         this.summaryCache = new Map();
+        // 스트리밍 응답을 읽을 수 있는 브라우저면 SSE 엔드포인트로 요약을 받아 바로 그림
+        this.useStreaming = Boolean(window.ReadableStream && window.TextDecoder);
+        this.fieldContainers = {
+            background: 'background',
+            core_content: 'mainContent',
+            conclusion: 'currentStatus'
+        };
         this.initialLoadComplete = false;
 
         this.setupEventListeners();
@@ -142,11 +149,24 @@ class SummaryHandler {
             }
 
             this.currentRequest = new AbortController();
-            
-            const summary = await this.fetchSummaryWithRetry(
-                this.buildSummaryUrl(),
-                this.currentRequest.signal
-            );
+
+            let summary = null;
+            if (this.useStreaming) {
+                try {
+                    summary = await this.streamSummary(this.currentRequest.signal);
+                } catch (error) {
+                    if (error.name === 'AbortError') throw error;
+                    console.error('요약 스트리밍 오류:', error);
+                }
+            }
+
+            // 스트리밍이 실패하면 기존 API(재시도/비동기 작업 폴링)로 다시 요청
+            if (!summary) {
+                summary = await this.fetchSummaryWithRetry(
+                    this.buildSummaryUrl(),
+                    this.currentRequest.signal
+                );
+            }
             
             if (summary) {
                 this.summaryCache.set(requestKey, summary);
@@ -173,7 +193,13 @@ class SummaryHandler {
                 const response = await fetch(url, { signal });
                 const data = await response.json();
 
-                if (response.ok && !data.is_error) {
+                // 비동기 모드: 작업이 등록되면 완료될 때까지 상태 API 폴링
+                if (response.status === 202) {
+                    const result = await this.waitForJob(data.status_url, signal);
+                    if (result && !result.is_error) {
+                        return result;
+                    }
+                } else if (response.ok && !data.is_error) {
                     return data;
                 }
             } catch (error) {
@@ -193,8 +219,85 @@ class SummaryHandler {
         return null;
     }
 
-    buildSummaryUrl() {
-        const url = new URL('/api/v2/news/summary/', window.location.origin);
+    async streamSummary(signal) {
+        const response = await fetch(this.buildSummaryUrl(true), {
+            signal,
+            headers: { Accept: 'text/event-stream' }
+        });
+        if (!response.ok || !response.body) return null;
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const texts = {};
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) return null;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const event = this.parseEvent(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                if (!event) continue;
+
+                if (event.type === 'delta') {
+                    const { field, text } = event.data;
+                    texts[field] = (texts[field] || '') + text;
+                    this.renderPartial(field, texts[field]);
+                } else if (event.type === 'done') {
+                    reader.cancel();
+                    return event.data.is_error ? null : event.data;
+                } else if (event.type === 'error') {
+                    reader.cancel();
+                    return null;
+                }
+            }
+        }
+    }
+
+    parseEvent(raw) {
+        let type = 'message';
+        let data = '';
+        raw.split('\n').forEach(line => {
+            if (line.startsWith('event:')) type = line.slice(6).trim();
+            else if (line.startsWith('data:')) data += line.slice(5).trim();
+        });
+        if (!data) return null;
+        try {
+            return { type, data: JSON.parse(data) };
+        } catch (error) {
+            console.error('SSE 이벤트 파싱 오류:', error);
+            return null;
+        }
+    }
+
+    renderPartial(field, text) {
+        const container = this.summaryContainers[this.fieldContainers[field]];
+        if (container) {
+            container.innerHTML = this.formatSummaryText(text);
+        }
+    }
+
+    async waitForJob(statusUrl, signal, interval = 1000, timeout = 120000) {
+        const startedAt = Date.now();
+
+        while (Date.now() - startedAt < timeout) {
+            await new Promise(resolve => setTimeout(resolve, interval));
+
+            const response = await fetch(statusUrl, { signal });
+            const job = await response.json();
+
+            if (job.status === 'done') return job.result;
+            if (job.status === 'failed' || !response.ok) return null;
+        }
+        return null;
+    }
+
+    buildSummaryUrl(stream = false) {
+        const path = stream ? '/api/v2/news/summary/stream/' : '/api/v2/news/summary/';
+        const url = new URL(path, window.location.origin);
         const params = new URLSearchParams({
             query: this.query,
             group_by: this.groupBy
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from .models import News
 from import_export.admin import ImportExportMixin
-from .models import SearchHistory
+from .models import SearchHistory, SummaryJob
 
 
 class NewsAdmin(ImportExportMixin, admin.ModelAdmin):
@@ -14,4 +14,10 @@ class SearchHistoryAdmin(admin.ModelAdmin):
     list_display = ['keyword', 'count', 'last_searched']
     list_filter = ['last_searched']
     search_fields = ['keyword']
-    ordering = ['-count', '-last_searched']
\ No newline at end of file
+    ordering = ['-count', '-last_searched']
+
+@admin.register(SummaryJob)
+class SummaryJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'attempts', 'locked_by', 'created_at', 'updated_at']
+    list_filter = ['kind', 'status']
+    search_fields = ['key']
@@ -0,0 +1,52 @@
+import time
+from django.core.management.base import BaseCommand
+from web.models import News, StoryBand, StorySketch
+from web.services.story_cluster_service import StoryClusterService
+
+
+class Command(BaseCommand):
+    help = '기존 뉴스에 MinHash LSH 유사 기사 클러스터(story_cluster)를 배정(backfill)합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--rebuild', action='store_true', help='기존 클러스터와 밴드/서명 테이블을 지우고 다시 배정')
+        parser.add_argument('--start-id', type=int, default=0, help='이 id 이후의 뉴스부터 배정')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        service = StoryClusterService(batch_size=batch_size)
+
+        if options['rebuild']:
+            StoryBand.objects.all().delete()
+            StorySketch.objects.all().delete()
+            News.objects.exclude(story_cluster=None).update(story_cluster=None)
+            self.stdout.write('기존 클러스터를 삭제했습니다.')
+
+        last_id = options['start_id']
+        total_news = 0
+        cluster_ids = set()
+        started = time.perf_counter()
+
+        # id 순서대로 배정해야 클러스터 id가 스토리의 첫 기사 id가 됨
+        while True:
+            batch = list(
+                News.objects.filter(id__gt=last_id)
+                .only('id', 'title', 'content')
+                .order_by('id')[:batch_size]
+            )
+            if not batch:
+                break
+
+            cluster_ids.update(service.assign(batch).values())
+            total_news += len(batch)
+            last_id = batch[-1].id
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{total_news}건 배정 (last_id={last_id}, '
+                f'{total_news / elapsed:.0f} rows/s)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: 뉴스 {total_news}건, 클러스터 {len(cluster_ids)}개'
+        ))
@@ -0,0 +1,119 @@
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from web.services.endpoint_benchmark import EndpointBenchmark, LLM_ENDPOINTS
+
+
+class Command(BaseCommand):
+    help = ('web/urls.py의 엔드포인트를 동시 호출해 p50/p95/p99 지연시간, 처리량, SQL 쿼리 수, 최대 RSS를 측정합니다. '
+            '--output으로 결과를 저장하고 --compare로 이전 결과와 비교합니다.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('endpoints', nargs='*', help='측정할 URL 이름 (없으면 전체)')
+        parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+        parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 측정 요청 수')
+        parser.add_argument('--warmup', type=int, default=10, help='엔드포인트별 측정 전 요청 수')
+        parser.add_argument('--seed', type=int, default=0, help='요청 파라미터 시드 (같으면 같은 요청 순서)')
+        parser.add_argument('--hot-ratio', type=float, default=0.8, help='상위 키워드로 보내는 요청 비율')
+        parser.add_argument('--base-url', help='실행 중인 서버로 HTTP 요청 (예: http://127.0.0.1:8000)')
+        parser.add_argument('--include-llm', action='store_true',
+                            help='LLM_BACKEND=openai여도 요약 엔드포인트 포함 (실제 API 비용 발생)')
+        parser.add_argument('--cold', action='store_true',
+                            help='시작 전에 저장된 요약과 캐시를 삭제 (벤치마크 전용 DB에서만 사용)')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+        parser.add_argument('--threshold', type=float, default=0.1, help='이 비율보다 나빠지면 regression')
+        parser.add_argument('--fail-on-regression', action='store_true', help='regression이 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        benchmark = EndpointBenchmark(
+            concurrency=options['concurrency'],
+            requests=options['requests'],
+            warmup=options['warmup'],
+            seed=options['seed'],
+            hot_ratio=options['hot_ratio'],
+            base_url=options['base_url']
+        )
+        names = self._endpoint_names(benchmark, options)
+        if settings.DEBUG and not options['base_url']:
+            self.stdout.write(self.style.WARNING(
+                'DEBUG=True - 쿼리 기록/디버그 미들웨어 때문에 운영보다 느리게 측정됩니다.'
+            ))
+
+        if options['cold']:
+            EndpointBenchmark.reset_summaries()
+            self.stdout.write('저장된 요약과 캐시를 삭제했습니다.')
+
+        samples = benchmark.load_samples()
+        if not samples['hot']:
+            self.stdout.write(self.style.WARNING(
+                '색인된 키워드가 없습니다. generate_news_corpus나 build_keyword_index를 먼저 실행하세요.'
+            ))
+
+        self.stdout.write(
+            f"{'endpoint':<30}{'req':>6}{'err':>5}{'rps':>9}{'p50_ms':>10}{'p95_ms':>10}{'p99_ms':>10}"
+            f"{'queries':>9}{'rss_mb':>9}"
+        )
+        result = benchmark.run(names, progress=self._write_row)
+        result['meta']['cold'] = options['cold']
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과를 저장했습니다: {options['output']}"))
+
+        if options['compare']:
+            self._compare(result, options)
+
+    def _write_row(self, name, stats):
+        queries = '-' if stats['queries_mean'] is None else f"{stats['queries_mean']:.1f}"
+        rss = '-' if stats['peak_rss_mb'] is None else f"{stats['peak_rss_mb']:.0f}"
+        self.stdout.write(
+            f"{name:<30}{stats['requests']:>6}{stats['errors']:>5}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{queries:>9}{rss:>9}"
+        )
+
+    def _endpoint_names(self, benchmark, options):
+        registered = EndpointBenchmark.url_names()
+        scenarios = set(benchmark.scenarios())
+        missing = [name for name in registered if name not in scenarios]
+        if missing:
+            self.stdout.write(self.style.WARNING(f"벤치마크 시나리오가 없는 엔드포인트: {', '.join(missing)}"))
+
+        names = options['endpoints'] or [name for name in registered if name in scenarios]
+        unknown = [name for name in names if name not in scenarios]
+        if unknown:
+            raise CommandError(f"알 수 없는 엔드포인트: {', '.join(unknown)}")
+
+        llm_allowed = options['include_llm'] or getattr(settings, 'LLM_BACKEND', 'openai') != 'openai' \
+            or getattr(settings, 'LLM_RECORD_MODE', '') == 'replay'
+        if not llm_allowed and not options['base_url']:
+            skipped = [name for name in names if name in LLM_ENDPOINTS]
+            if skipped:
+                self.stdout.write(self.style.WARNING(
+                    f"LLM_BACKEND=openai라 요약 엔드포인트는 건너뜁니다 (LLM_BACKEND=fake 또는 --include-llm): "
+                    f"{', '.join(skipped)}"
+                ))
+            names = [name for name in names if name not in LLM_ENDPOINTS]
+        return names
+
+    def _compare(self, result, options):
+        with open(options['compare'], encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = EndpointBenchmark.compare(baseline, result, options['threshold'])
+        baseline_meta = baseline.get('meta') or {}
+        self.stdout.write(
+            f"\n비교 기준: {options['compare']} (commit {baseline_meta.get('git_commit')}, "
+            f"뉴스 {baseline_meta.get('news_count')}건)"
+        )
+        self.stdout.write(f"{'endpoint':<30}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>10}")
+        for row in rows:
+            line = (
+                f"{row['endpoint']:<30}{row['metric']:<16}{row['baseline']:>12.2f}{row['current']:>12.2f}"
+                f"{row['change'] * 100:>9.1f}%"
+            )
+            self.stdout.write(self.style.ERROR(line) if row['regression'] else line)
+
+        regressions = [row for row in rows if row['regression']]
+        if regressions and options['fail_on_regression']:
+            raise CommandError(f"{len(regressions)}개 지표가 {options['threshold'] * 100:.0f}% 이상 나빠졌습니다.")
@@ -0,0 +1,57 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Q, Count
+from web.models import News, Keyword
+from web.services.keyword_index_service import KeywordIndexService
+
+
+class Command(BaseCommand):
+    help = 'keyword__icontains(LIKE) 검색과 Keyword 역색인 검색의 지연시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('queries', nargs='*', help='비교할 검색어 (없으면 posting이 많은 상위 키워드 사용)')
+        parser.add_argument('--top', type=int, default=5)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        queries = options['queries'] or self._top_keywords(options['top'])
+        if not queries:
+            self.stdout.write(self.style.WARNING('색인된 키워드가 없습니다. build_keyword_index를 먼저 실행하세요.'))
+            return
+
+        repeat = options['repeat']
+        self.stdout.write(f"{'query':<20}{'like_ms':>12}{'index_ms':>12}{'like_n':>10}{'index_n':>10}{'speedup':>10}")
+
+        for query in queries:
+            keyword_ids = KeywordIndexService.lookup(query)
+            like_ms, like_n = self._measure(
+                lambda: News.objects.filter(Q(keyword__icontains=query)).count(), repeat
+            )
+            if keyword_ids is None:
+                self.stdout.write(f'{query:<20}{like_ms:>12.2f}{"-":>12}{like_n:>10}{"-":>10}{"-":>10}')
+                continue
+            index_ms, index_n = self._measure(
+                lambda: KeywordIndexService.filter_news(keyword_ids).count(), repeat
+            )
+            speedup = like_ms / index_ms if index_ms else float('inf')
+            self.stdout.write(
+                f'{query:<20}{like_ms:>12.2f}{index_ms:>12.2f}{like_n:>10}{index_n:>10}{speedup:>9.1f}x'
+            )
+
+    def _measure(self, func, repeat):
+        """repeat회 실행한 지연시간의 중앙값(ms)과 결과를 반환"""
+        timings = []
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), result
+
+    def _top_keywords(self, top):
+        return list(
+            Keyword.objects.annotate(num_news=Count('news'))
+            .order_by('-num_news')
+            .values_list('name', flat=True)[:top]
+        )
@@ -0,0 +1,139 @@
+import random
+import time
+from collections import OrderedDict
+from itertools import accumulate
+from multiprocessing import Pool
+from django.core.management.base import BaseCommand
+from web.services.story_cluster_service import MinHashLSH, StoryClusterService
+
+PRESSES = ['연합뉴스', '뉴시스', '뉴스1', '한국경제', '매일경제', '조선일보', '한겨레', '경향신문']
+
+
+def _build_vocabulary(size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(600)]
+    return [''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+
+_VOCABULARY = _build_vocabulary(20000, seed=7)
+_CUM_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(_VOCABULARY) + 1)))  # Zipf 분포
+
+
+def _story_text(story_id: int) -> tuple:
+    rng = random.Random(story_id)
+    title = ' '.join(rng.choices(_VOCABULARY, cum_weights=_CUM_WEIGHTS, k=8))
+    content = ' '.join(rng.choices(_VOCABULARY, cum_weights=_CUM_WEIGHTS, k=120))
+    return title, content
+
+
+def _article_text(article_id: int, story_id: int) -> tuple:
+    """원문 기사 또는 재배포 기사(언론사 표기, 단어 일부, 문장 끝이 바뀐 본문)"""
+    title, content = _story_text(story_id)
+    if article_id == story_id:
+        return title, content
+    rng = random.Random(-article_id)
+    words = content.split(' ')
+    for _ in range(len(words) // 20):
+        words[rng.randrange(len(words))] = rng.choice(_VOCABULARY)
+    words = words[:len(words) - rng.randint(0, 10)]
+    return f"[{rng.choice(PRESSES)}] {title}", ' '.join(words) + f" {rng.choice(PRESSES)} 기자"
+
+
+def _signatures(chunk: list) -> list:
+    lsh = MinHashLSH()
+    items = []
+    for article_id, story_id in chunk:
+        signature = lsh.signature(*_article_text(article_id, story_id))
+        items.append((article_id, signature, lsh.band_hashes(signature)))
+    return items
+
+
+class Command(BaseCommand):
+    help = '합성 기사 코퍼스로 story_cluster 배정 처리량과 정확도를 측정합니다 (DB 사용 안 함).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=1000000, help='합성 기사 수')
+        parser.add_argument('--duplicate-rate', type=float, default=0.3, help='재배포 기사 비율')
+        parser.add_argument('--processes', type=int, default=1, help='서명 계산 프로세스 수')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+        parser.add_argument('--window', type=int, default=200000,
+                            help='메모리에 유지할 최근 기사 수 (오래된 밴드 해시는 버림)')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        count = options['count']
+        story_of = self._assign_stories(count, options['duplicate_rate'], options['seed'])
+        chunk_size = options['chunk_size']
+        chunks = (
+            [(article_id, story_of[article_id]) for article_id in range(start, min(start + chunk_size, count))]
+            for start in range(0, count, chunk_size)
+        )
+
+        service = StoryClusterService(lsh=MinHashLSH())
+        band_table = OrderedDict()
+        sketches = OrderedDict()
+        window = options['window']
+        max_entries = window * service.lsh.bands
+        hash_seconds = 0.0
+        assign_seconds = 0.0
+        duplicates = found = false_merges = 0
+        started = time.perf_counter()
+
+        pool = Pool(options['processes']) if options['processes'] > 1 else None
+        results = pool.imap(_signatures, chunks) if pool else map(_signatures, chunks)
+        try:
+            processed = 0
+            while True:
+                hash_started = time.perf_counter()
+                items = next(results, None)
+                hash_seconds += time.perf_counter() - hash_started
+                if items is None:
+                    break
+
+                assign_started = time.perf_counter()
+                assignments = service.assign_clusters(band_table, sketches, items)
+                while len(band_table) > max_entries:
+                    band_table.popitem(last=False)
+                while len(sketches) > window:
+                    sketches.popitem(last=False)
+                assign_seconds += time.perf_counter() - assign_started
+
+                for article_id, cluster_id in assignments.items():
+                    story_id = story_of[article_id]
+                    if story_of[cluster_id] != story_id:
+                        false_merges += 1
+                    if article_id != story_id:
+                        duplicates += 1
+                        found += story_of[cluster_id] == story_id
+                processed += len(items)
+                if processed % (chunk_size * 50) == 0:
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(f'{processed}건 ({processed / elapsed:.0f} articles/s)')
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: 기사 {count}건, {elapsed:.1f}s ({count / elapsed:.0f} articles/s)\n'
+            f'  서명 계산 {hash_seconds:.1f}s, 클러스터 배정 {assign_seconds:.1f}s\n'
+            f'  재배포 기사 재현율 {found / duplicates if duplicates else 0:.4f} ({found}/{duplicates}), '
+            f'잘못 합쳐진 기사 {false_merges}건 ({false_merges / count:.4%})'
+        ))
+
+    @staticmethod
+    def _assign_stories(count: int, duplicate_rate: float, seed: int) -> list:
+        """기사별 원문 스토리 id (원문 기사는 자기 id, 재배포 기사는 최근 원문 중 하나)"""
+        rng = random.Random(seed)
+        story_of = []
+        recent = []
+        for article_id in range(count):
+            if recent and rng.random() < duplicate_rate:
+                story_of.append(rng.choice(recent))
+            else:
+                story_of.append(article_id)
+                recent.append(article_id)
+                if len(recent) > 1000:
+                    recent.pop(0)
+        return story_of
@@ -0,0 +1,54 @@
+import time
+from django.core.management.base import BaseCommand
+from web.models import News, Keyword
+from web.services.keyword_index_service import KeywordIndexService
+
+
+class Command(BaseCommand):
+    help = 'News.keyword 컬럼으로 Keyword 역색인을 구축(backfill)합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--rebuild', action='store_true', help='기존 색인을 모두 지우고 다시 구축')
+        parser.add_argument('--start-id', type=int, default=0, help='이 id 이후의 뉴스부터 색인')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        service = KeywordIndexService(batch_size=batch_size)
+
+        if options['rebuild']:
+            Keyword.news.through.objects.all().delete()
+            Keyword.objects.all().delete()
+            self.stdout.write('기존 키워드 색인을 삭제했습니다.')
+
+        last_id = options['start_id']
+        total_news = 0
+        total_postings = 0
+        started = time.perf_counter()
+
+        # id 기준 keyset 순회로 OFFSET 스캔 없이 일정한 비용으로 진행
+        while True:
+            batch = list(
+                News.objects.filter(id__gt=last_id)
+                .only('id', 'keyword')
+                .order_by('id')[:batch_size]
+            )
+            if not batch:
+                break
+
+            total_postings += service.index_batch(batch)
+            total_news += len(batch)
+            last_id = batch[-1].id
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{total_news}건 색인 (last_id={last_id}, '
+                f'{total_news / elapsed:.0f} rows/s)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: 뉴스 {total_news}건, posting {total_postings}개, '
+            f'키워드 {Keyword.objects.count()}개'
+        ))
+        if not KeywordIndexService.is_enabled():
+            self.stdout.write(self.style.WARNING('검색에 색인을 사용하려면 KEYWORD_INDEX_ENABLED를 켜세요.'))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+from web.models import Keyword
+from web.services.rollup_service import NewsRollupService
+
+
+class Command(BaseCommand):
+    help = 'KeywordDailyCount 집계가 News 원본 집계와 일치하는지 검사합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keyword', action='append', default=[], help='검사할 키워드 (없으면 집계가 큰 상위 키워드)')
+        parser.add_argument('--top', type=int, default=100)
+        parser.add_argument('--fix', action='store_true', help='불일치 키워드는 재구축')
+
+    def handle(self, *args, **options):
+        keywords = Keyword.objects.all()
+        if options['keyword']:
+            keywords = keywords.filter(name__in=options['keyword'])
+        else:
+            keywords = keywords.annotate(total=Sum('daily_counts__count')).order_by('-total')[:options['top']]
+
+        service = NewsRollupService()
+        mismatched = 0
+        for keyword_id, name in keywords.values_list('id', 'name'):
+            diff = service.diff(keyword_id)
+            if not diff:
+                continue
+            mismatched += 1
+            for day, (rollup, live) in sorted(diff.items())[:5]:
+                self.stdout.write(f'{name} {day}: rollup={rollup} live={live}')
+            if options['fix']:
+                service.rebuild(keyword_id)
+                self.stdout.write(f'{name}: 재구축 완료')
+
+        if mismatched:
+            self.stdout.write(self.style.WARNING(f'불일치 키워드 {mismatched}개'))
+        else:
+            self.stdout.write(self.style.SUCCESS('모든 집계가 일치합니다.'))
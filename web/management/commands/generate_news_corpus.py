@@ -0,0 +1,67 @@
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from web.services.news_ingest_service import NewsIngestService
+from web.services.synthetic_corpus import SyntheticCorpus
+
+
+class Command(BaseCommand):
+    help = ('벤치마크용 합성 뉴스를 적재합니다 (한국어 형태 어휘, Zipf 키워드 인기도, 이슈 시점에 몰리는 날짜). '
+            '같은 --seed면 같은 코퍼스가 만들어지고, 이미 있는 link는 건너뜁니다.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=100000, help='생성할 기사 수')
+        parser.add_argument('--start', type=int, default=0, help='기사 번호 시작값 (이어서 생성할 때)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--keywords', type=int, default=5000, help='키워드 종류 수')
+        parser.add_argument('--zipf', type=float, default=1.1, help='키워드 인기도 Zipf 지수')
+        parser.add_argument('--days', type=int, default=730, help='기사 날짜 범위 (end-date 이전 일수)')
+        parser.add_argument('--end-date', type=date.fromisoformat, help='가장 최근 날짜 (기본: 오늘)')
+        parser.add_argument('--burst-ratio', type=float, default=0.7, help='이슈 시점 주변에 몰리는 기사 비율')
+        parser.add_argument('--duplicate-rate', type=float, default=0.2, help='재배포(유사) 기사 비율')
+        parser.add_argument('--content-words', type=int, default=120, help='본문 단어 수 중앙값')
+        parser.add_argument('--batch-size', type=int, default=2000, help='트랜잭션 하나에 넣을 행 수')
+        parser.add_argument('--skip-clusters', action='store_true',
+                            help='유사 기사 클러스터 배정을 건너뜀 (대량 생성 후 assign_story_clusters로 배정)')
+
+    def handle(self, *args, **options):
+        if options['skip_clusters']:
+            with override_settings(STORY_CLUSTER_ENABLED=False):
+                self._generate(options)
+        else:
+            self._generate(options)
+
+    def _generate(self, options):
+        corpus = SyntheticCorpus(
+            seed=options['seed'],
+            keywords=options['keywords'],
+            end_date=options['end_date'],
+            days=options['days'],
+            zipf_exponent=options['zipf'],
+            burst_ratio=options['burst_ratio'],
+            duplicate_rate=options['duplicate_rate'],
+            content_words=options['content_words']
+        )
+        service = NewsIngestService(batch_size=options['batch_size'])
+        count = options['count']
+        started = time.perf_counter()
+        report_every = max(count // 20, options['batch_size'])
+        next_report = report_every
+
+        rows = service.normalize(corpus.rows(count, options['start']))
+        for stats in service.ingest(rows):
+            if stats['read'] >= next_report or stats['read'] == count:
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{stats['read']}/{count} 생성, 추가 {stats['created']}, 중복 {stats['duplicates']} "
+                    f"({stats['read'] / elapsed:.0f} rows/s)"
+                )
+                next_report += report_every
+
+        elapsed = time.perf_counter() - started
+        stats = service.stats
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {count}건을 {elapsed:.1f}s에 처리 ({count / elapsed:.0f} rows/s) - "
+            f"추가 {stats['created']}, 중복 {stats['duplicates']}, 오류 {stats['invalid']}"
+        ))
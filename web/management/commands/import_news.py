@@ -0,0 +1,35 @@
+import time
+from django.core.management.base import BaseCommand
+from web.services.news_ingest_service import NewsIngestService
+
+
+class Command(BaseCommand):
+    help = 'JSONL/CSV 뉴스 파일을 대량 적재합니다 (link 기준 중복 제외, 키워드 색인/집계/유사 기사 클러스터 동시 갱신).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="적재할 파일 경로 ('-'는 표준 입력)")
+        parser.add_argument('--format', choices=['jsonl', 'csv'], help='파일 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='트랜잭션 하나에 넣을 행 수')
+
+    def handle(self, *args, **options):
+        service = NewsIngestService(batch_size=options['batch_size'])
+        started = time.perf_counter()
+
+        for path in options['paths']:
+            rows = service.normalize(service.read_rows(path, options['format']))
+            for stats in service.ingest(rows):
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{path}: 읽음 {stats['read']}, 추가 {stats['created']}, 중복 {stats['duplicates']}, "
+                    f"오류 {stats['invalid']} ({stats['read'] / elapsed:.0f} rows/s)"
+                )
+
+        for error in service.errors:
+            self.stderr.write(f'건너뛴 행 {error}')
+
+        elapsed = time.perf_counter() - started
+        stats = service.stats
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {stats['read']}행을 {elapsed:.1f}s에 처리 ({stats['read'] / elapsed:.0f} rows/s) - "
+            f"추가 {stats['created']}, 중복 {stats['duplicates']}, 오류 {stats['invalid']}"
+        ))
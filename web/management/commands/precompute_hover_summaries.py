@@ -0,0 +1,39 @@
+import time
+from django.core.management.base import BaseCommand
+from web.models import SearchHistory
+from web.services.daily_issue_service import DailyIssueService
+
+
+class Command(BaseCommand):
+    help = '뉴스가 많은 상위 기간의 차트 호버 요약(DailySummary)을 미리 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--query', action='append', default=[], help='대상 키워드 (여러 번 지정 가능)')
+        parser.add_argument('--trending', type=int, default=0, help='검색 상위 N개 키워드도 대상에 포함')
+        parser.add_argument('--group-by', action='append', default=[], choices=['1day', '1week', '1month'])
+        parser.add_argument('--start-date')
+        parser.add_argument('--end-date')
+        parser.add_argument('--top', type=int, default=10, help='키워드/그룹별로 생성할 상위 기간 수')
+
+    def handle(self, *args, **options):
+        queries = list(options['query'])
+        if options['trending']:
+            queries += list(
+                SearchHistory.objects.order_by('-count')
+                .values_list('keyword', flat=True)[:options['trending']]
+            )
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            self.stdout.write(self.style.WARNING('--query 또는 --trending을 지정하세요.'))
+            return
+
+        service = DailyIssueService()
+        for query in queries:
+            for group_by in options['group_by'] or ['1day']:
+                started = time.perf_counter()
+                created = service.prepare_daily_summaries(
+                    query, group_by, options['start_date'], options['end_date'], top_n=options['top']
+                )
+                self.stdout.write(
+                    f'{query} ({group_by}): {created}건 생성 ({time.perf_counter() - started:.1f}s)'
+                )
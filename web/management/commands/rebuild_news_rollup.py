@@ -0,0 +1,26 @@
+import time
+from django.core.management.base import BaseCommand
+from web.models import Keyword
+from web.services.rollup_service import NewsRollupService
+
+
+class Command(BaseCommand):
+    help = 'Keyword 역색인 기준으로 KeywordDailyCount 일별 집계를 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keyword', action='append', default=[], help='특정 키워드만 재구축 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        keywords = Keyword.objects.order_by('id')
+        if options['keyword']:
+            keywords = keywords.filter(name__in=options['keyword'])
+
+        service = NewsRollupService()
+        started = time.perf_counter()
+        total_rows = 0
+        for i, (keyword_id, name) in enumerate(keywords.values_list('id', 'name').iterator(), start=1):
+            total_rows += service.rebuild(keyword_id)
+            if i % 1000 == 0:
+                self.stdout.write(f'{i}개 키워드 처리 ({time.perf_counter() - started:.1f}s)')
+
+        self.stdout.write(self.style.SUCCESS(f'완료: 집계 행 {total_rows}개'))
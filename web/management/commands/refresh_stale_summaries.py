@@ -0,0 +1,32 @@
+import time
+from django.core.management.base import BaseCommand
+from web.models import NewsSummary, DailySummary, QuickSummary
+from web.services.daily_issue_service import DailyIssueService
+from web.services.summary_service import SummaryService
+
+
+class Command(BaseCommand):
+    help = 'stale로 표시된 요약을 이전 요약 + 새 기사만으로 갱신합니다 (조회를 기다리지 않고 주기 실행용).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100, help='종류별로 갱신할 최대 요약 수')
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        summary_service = SummaryService()
+        daily_service = DailyIssueService()
+        started = time.perf_counter()
+        refreshed = 0
+
+        for summary in NewsSummary.objects.filter(is_stale=True).order_by('-date')[:limit]:
+            refreshed += summary_service.refresh_summary(
+                summary.keyword, summary.date, summary.group_by, summary.is_overall
+            )
+        for summary in QuickSummary.objects.filter(is_stale=True).order_by('-updated_at')[:limit]:
+            refreshed += summary_service.refresh_quick_summary(summary.keyword)
+        for summary_id in DailySummary.objects.filter(is_stale=True).order_by('-date').values_list('id', flat=True)[:limit]:
+            refreshed += daily_service.refresh_summary(summary_id)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료: 요약 {refreshed}개 갱신 ({time.perf_counter() - started:.1f}s)'
+        ))
@@ -0,0 +1,33 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from web.services.summary_job_service import SummaryJobService
+
+
+class Command(BaseCommand):
+    help = 'DB 요약 작업 큐(SummaryJob)를 처리하는 워커를 실행합니다. 여러 프로세스를 동시에 띄울 수 있습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 작업을 모두 처리하면 종료')
+        parser.add_argument('--poll-interval', type=float, default=getattr(settings, 'SUMMARY_JOB_POLL_SECONDS', 1.0))
+
+    def handle(self, *args, **options):
+        service = SummaryJobService()
+        worker_id = service.worker_id()
+        self.stdout.write(f'요약 워커 시작: {worker_id}')
+
+        while True:
+            close_old_connections()
+            job = service.claim(worker_id)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            started = time.perf_counter()
+            job = service.run(job)
+            self.stdout.write(
+                f'작업 #{job.id} {job.kind} -> {job.status} ({time.perf_counter() - started:.1f}s)'
+            )
@@ -0,0 +1,58 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from .services.metrics import (
+    db_queries_per_request, db_query_duration_per_request, http_request_duration, http_requests, request_queries
+)
+
+
+class MetricsMiddleware:
+    """요청마다 뷰(URL 이름)별 처리 시간, 상태 코드, SQL 쿼리 수/시간을 기록
+
+    동기/비동기 양쪽을 지원해야 ASGI에서 비동기 뷰가 스레드로 밀려나지 않는다.
+    SQL 쿼리는 DB 연결마다 설치한 execute wrapper가 request_queries(ContextVar)에 누적한다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        totals = [0, 0.0]
+        token = request_queries.set(totals)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, totals)
+        return response
+
+    async def __acall__(self, request):
+        totals = [0, 0.0]
+        token = request_queries.set(totals)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, totals)
+        return response
+
+    @staticmethod
+    def _record(request, response, elapsed, totals):
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unmatched'
+        http_requests.inc(view=view, method=request.method, status=response.status_code)
+        http_request_duration.observe(elapsed, view=view, method=request.method)
+        db_queries_per_request.observe(totals[0], view=view)
+        db_query_duration_per_request.observe(totals[1], view=view)
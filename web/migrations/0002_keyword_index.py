@@ -0,0 +1,22 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='keyword',
+            name='web_keyword_name_f94d53_idx',
+        ),
+        migrations.AlterField(
+            model_name='keyword',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
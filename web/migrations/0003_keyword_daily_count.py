@@ -0,0 +1,26 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0002_keyword_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('keyword', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_counts', to='web.keyword')),
+            ],
+            options={
+                'unique_together': {('keyword', 'date')},
+            },
+        ),
+    ]
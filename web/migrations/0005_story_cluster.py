@@ -0,0 +1,34 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0004_summary_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band_hash', models.BigIntegerField(unique=True)),
+                ('cluster_id', models.BigIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StorySketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_id', models.BigIntegerField(unique=True)),
+                ('signature', models.BinaryField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='story_cluster',
+            field=models.BigIntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
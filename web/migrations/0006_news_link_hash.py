@@ -0,0 +1,40 @@
+# Generated by Django 5.0.7 on 2026-10-18 07:25
+
+import hashlib
+from django.db import migrations, models
+
+
+def fill_link_hash(apps, schema_editor):
+    """기존 뉴스의 link_hash 채우기 - 같은 link가 여러 건이면 가장 먼저 저장된 뉴스에만 설정"""
+    News = apps.get_model('web', 'News')
+    seen = set()
+    last_id = 0
+    while True:
+        batch = list(News.objects.filter(id__gt=last_id).order_by('id').only('id', 'link')[:2000])
+        if not batch:
+            break
+        updated = []
+        for news in batch:
+            link_hash = hashlib.sha1((news.link or '').strip().encode('utf-8')).hexdigest()
+            if news.link and link_hash not in seen:
+                seen.add(link_hash)
+                news.link_hash = link_hash
+                updated.append(news)
+        News.objects.bulk_update(updated, ['link_hash'])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0005_story_cluster'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='link_hash',
+            field=models.CharField(blank=True, editable=False, max_length=40, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_link_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-18 08:18
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+
+def merge_duplicate_keywords(apps, schema_editor):
+    """같은 keyword 행을 가장 먼저 저장된 행 하나로 합침 (횟수는 합산, 마지막 검색 시각은 최신값)"""
+    SearchHistory = apps.get_model('web', 'SearchHistory')
+    duplicates = (
+        SearchHistory.objects.values('keyword')
+        .annotate(rows=Count('id'), first_id=Min('id'), total=Sum('count'), latest=Max('last_searched'))
+        .filter(rows__gt=1)
+    )
+    for row in duplicates:
+        SearchHistory.objects.filter(keyword=row['keyword']).exclude(id=row['first_id']).delete()
+        SearchHistory.objects.filter(id=row['first_id']).update(count=row['total'], last_searched=row['latest'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0007_summary_staleness'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_keywords, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='searchhistory',
+            name='keyword',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
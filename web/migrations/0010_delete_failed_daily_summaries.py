@@ -0,0 +1,20 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:02
+
+from django.db import migrations
+
+
+def delete_failed_summaries(apps, schema_editor):
+    """LLM 호출 실패로 저장된 호버 요약 삭제 (다음 조회 때 다시 생성)"""
+    DailySummary = apps.get_model('web', 'DailySummary')
+    DailySummary.objects.filter(title_summary='요약 실패').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0009_summary_job_run_after'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_failed_summaries, migrations.RunPython.noop),
+    ]
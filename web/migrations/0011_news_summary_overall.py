@@ -0,0 +1,31 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0010_delete_failed_daily_summaries'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='newssummary',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='newssummary',
+            name='end_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='newssummary',
+            name='is_overall',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterUniqueTogether(
+            name='newssummary',
+            unique_together={('keyword', 'date', 'group_by', 'is_overall')},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+def fill_active_key(apps, schema_editor):
+    """대기/실행 중인 작업에 active_key 채우기 (같은 key가 여러 개면 가장 먼저 만든 작업만)"""
+    SummaryJob = apps.get_model('web', 'SummaryJob')
+    seen = set()
+    active = SummaryJob.objects.filter(status__in=['pending', 'running']).order_by('id')
+    for job in active.only('id', 'key').iterator():
+        if job.key in seen:
+            continue
+        seen.add(job.key)
+        SummaryJob.objects.filter(id=job.id).update(active_key=job.key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0011_news_summary_overall'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='summaryjob',
+            name='web_summary_key_e97408_idx',
+        ),
+        migrations.AddField(
+            model_name='summaryjob',
+            name='active_key',
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_active_key, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+import hashlib
 from django.db import models
 from datetime import datetime
 
@@ -10,11 +11,19 @@ class News(models.Model):
     keyword = models.CharField(max_length=1000000)
     image = models.TextField()
     link = models.TextField()
+    # 거의 같은 기사 묶음 id (스토리 첫 기사의 id, StoryClusterService가 배정)
+    story_cluster = models.BigIntegerField(null=True, blank=True, db_index=True)
+    # link의 SHA-1 - 중복 수집 방지용 유니크 인덱스 (TextField인 link는 직접 인덱싱 불가)
+    link_hash = models.CharField(max_length=40, null=True, blank=True, unique=True, editable=False)
 
     class Meta:
         indexes = [
             models.Index(fields=['date']),
         ]
+
+    @staticmethod
+    def hash_link(link: str) -> str:
+        return hashlib.sha1(link.strip().encode('utf-8')).hexdigest()
         
     @classmethod
     def get_search_index(cls):
@@ -35,19 +44,44 @@ class News(models.Model):
         return f"[{self.press}] {self.title}"
     
 class Keyword(models.Model):
-    name = models.CharField(max_length=100)
+    """News.keyword 토큰 단위 역색인 (name -> news posting list)"""
+    name = models.CharField(max_length=100, unique=True)
     news = models.ManyToManyField(News, related_name='keywords')
-    
+
+    def __str__(self):
+        return self.name
+
+class KeywordDailyCount(models.Model):
+    """(키워드, 날짜)별 뉴스 수 집계 테이블 - 차트 API용"""
+    keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE, related_name='daily_counts')
+    date = models.DateField()
+    count = models.IntegerField(default=0)
+
     class Meta:
-        indexes = [
-            models.Index(fields=['name']),
-        ]
+        unique_together = ['keyword', 'date']
 
     def __str__(self):
-        return f"{self.keyword} ({self.count})"
+        return f"{self.keyword_id} - {self.date} ({self.count})"
+
+class StoryBand(models.Model):
+    """MinHash LSH 밴드 해시 -> 스토리 클러스터 (유사 기사 후보 조회용)"""
+    band_hash = models.BigIntegerField(unique=True)
+    cluster_id = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.band_hash} -> {self.cluster_id}"
+
+class StorySketch(models.Model):
+    """스토리 클러스터 대표 기사의 MinHash 서명 - LSH 후보 검증용"""
+    cluster_id = models.BigIntegerField(unique=True)
+    signature = models.BinaryField()
+
+    def __str__(self):
+        return str(self.cluster_id)
 
 class SearchHistory(models.Model):
-    keyword = models.CharField(max_length=100)
+    # 검색 횟수는 SearchCounter가 모아서 keyword 기준 upsert로 반영
+    keyword = models.CharField(max_length=100, unique=True)
     count = models.IntegerField(default=1)
     last_searched = models.DateTimeField(auto_now=True)
 
@@ -73,10 +107,16 @@ class NewsSummary(models.Model):
     background = models.TextField()
     core_content = models.TextField()
     conclusion = models.TextField()
+    # 전체 요약(date 없이 start_date~end_date 범위로 요청)이면 date는 범위 시작일, end_date는 범위 끝
+    is_overall = models.BooleanField(default=False)
+    end_date = models.DateField(null=True, blank=True)
+    # 새 뉴스 적재로 다시 요약해야 하는지, 요약에 반영된 마지막 뉴스 id (증분 갱신 기준)
+    is_stale = models.BooleanField(default=False)
+    last_news_id = models.BigIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        unique_together = ['keyword', 'date', 'group_by']
+        unique_together = ['keyword', 'date', 'group_by', 'is_overall']
         # indexes = [
         #     models.Index(fields=['keyword', 'date', 'group_by']),
         # ]
@@ -102,6 +142,8 @@ class DailySummary(models.Model):
     content_summary = models.TextField()
     news_count = models.IntegerField()
     representative_image = models.ImageField(upload_to='daily_summaries/', null=True, blank=True)
+    is_stale = models.BooleanField(default=False)
+    last_news_id = models.BigIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -119,9 +161,59 @@ class QuickSummary(models.Model):
     summary = models.CharField(max_length=100)
     news_count = models.IntegerField(default=0)  # 요약 생성에 사용된 뉴스 수
     date_range = models.CharField(max_length=50)  # 뉴스 기간 (예: "2022-01-01~2024-03-01")
+    is_stale = models.BooleanField(default=False)
+    last_news_id = models.BigIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.keyword}: {self.summary}"
-    
+
+
+class SummaryJob(models.Model):
+    """요약 생성 비동기 작업 (DB 기반 큐, run_summary_worker가 처리)"""
+    KIND_SUMMARY = 'summary'
+    KIND_QUICK_SUMMARY = 'quick_summary'
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    kind = models.CharField(
+        max_length=20,
+        choices=[
+            (KIND_SUMMARY, '3단 요약'),
+            (KIND_QUICK_SUMMARY, '간단 요약')
+        ]
+    )
+    key = models.CharField(max_length=255)
+    # 대기/실행 중인 동안만 key와 같고 끝나면 NULL - 같은 작업이 동시에 두 개 대기하지 않도록 unique로 막음
+    active_key = models.CharField(max_length=255, null=True, blank=True, unique=True)
+    params = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=10,
+        default=PENDING,
+        choices=[
+            (PENDING, '대기'),
+            (RUNNING, '실행 중'),
+            (DONE, '완료'),
+            (FAILED, '실패')
+        ]
+    )
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    attempts = models.IntegerField(default=0)
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    locked_at = models.DateTimeField(null=True, blank=True)
+    run_after = models.DateTimeField(null=True, blank=True)  # 재시도 대기 (이 시각 이후에 선점 가능)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.id} ({self.status})"
@@ -0,0 +1,84 @@
+import math
+from datetime import timedelta
+from typing import Dict, List
+from django.conf import settings
+from django.db.models import Count, Max, Min
+from django.db.models.functions import Substr
+from .story_cluster_service import StoryClusterService
+
+
+class ArticleSampler:
+    """구조화 요약용 기사 샘플러
+
+    기간을 여러 구간으로 나눠 구간마다 LIMIT이 걸린 쿼리로 제목과 잘린 본문만 스트리밍하고,
+    구간을 번갈아 가며 프롬프트 예산(문자 수)이 찰 때까지 기사를 고른다.
+    """
+
+    def __init__(self, content_chars: int = None, max_total_chars: int = None, strata: int = None):
+        self.content_chars = content_chars or getattr(settings, 'SUMMARY_SAMPLE_CONTENT_CHARS', 500)
+        self.max_total_chars = max_total_chars or getattr(settings, 'SUMMARY_SAMPLE_MAX_CHARS', 60000)
+        self.strata = strata or getattr(settings, 'SUMMARY_SAMPLE_STRATA', 10)
+        self.collapse_duplicates = getattr(settings, 'STORY_CLUSTER_COLLAPSE_SUMMARIES', True)
+
+    @staticmethod
+    def article_length(title: str, content: str) -> int:
+        """LLMService가 프롬프트에 넣는 형식('제목: ...\\n내용: ...') 기준 길이"""
+        return len(f"제목: {title}\n내용: {content}")
+
+    def sample(self, news_list) -> List[Dict]:
+        """news_list(QuerySet)에서 예산 안의 기사 {'title', 'content', 'date'}를 날짜순으로 반환"""
+        if self.collapse_duplicates:
+            # 같은 스토리의 재배포 기사는 클러스터별 대표 기사만
+            news_list = StoryClusterService.collapse(news_list)
+        stats = news_list.aggregate(first_date=Min('date'), last_date=Max('date'), total=Count('id'))
+        if not stats['total']:
+            return []
+
+        strata = self._split_range(stats['first_date'], stats['last_date'])
+        # 짧은 기사가 많을 때를 고려해 예상 기사 수의 2배까지만 구간별로 읽음
+        expected_articles = self.max_total_chars / (self.content_chars + 50)
+        per_stratum = max(1, math.ceil(expected_articles * 2 / len(strata)))
+
+        rows = news_list.annotate(
+            content_prefix=Substr('content', 1, self.content_chars)
+        ).values('title', 'content_prefix', 'date')
+        iterators = [
+            rows.filter(date__range=[start, end]).order_by('-date', '-id')[:per_stratum].iterator(chunk_size=100)
+            for start, end in reversed(strata)  # 최근 구간부터
+        ]
+
+        sampled = []
+        total_length = 0
+        while iterators:
+            for iterator in list(iterators):
+                row = next(iterator, None)
+                if row is None:
+                    iterators.remove(iterator)
+                    continue
+                length = self.article_length(row['title'], row['content_prefix'])
+                if total_length + length > self.max_total_chars:
+                    return self._by_date(sampled)
+                sampled.append({
+                    'title': row['title'],
+                    'content': row['content_prefix'],
+                    'date': row['date']
+                })
+                total_length += length
+
+        return self._by_date(sampled)
+
+    def _split_range(self, first_date, last_date) -> List[tuple]:
+        """[first_date, last_date]를 최대 strata개의 연속 구간으로 분할"""
+        days = (last_date - first_date).days + 1
+        count = min(self.strata, days)
+        step = days / count
+        ranges = []
+        for i in range(count):
+            start = first_date + timedelta(days=math.floor(i * step))
+            end = first_date + timedelta(days=math.floor((i + 1) * step) - 1)
+            ranges.append((start, end))
+        return ranges
+
+    @staticmethod
+    def _by_date(sampled: List[Dict]) -> List[Dict]:
+        return sorted(sampled, key=lambda news: news['date'])
@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db.models import Count
+from ..models import News, Keyword, SearchHistory
+from .keyword_index_service import KeywordIndexService
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSUNG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSUNG = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+CHOSUNG_SET = set(CHOSUNG)
+
+# 트라이 노드에서 자식/상위 후보 목록을 담는 키
+CHILDREN = 0
+TOP = 1
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 ('삼성' -> 'ㅅㅏㅁㅅㅓㅇ')"""
+    result = []
+    for char in text.lower():
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            result.append(CHOSUNG[offset // 588])
+            result.append(JUNGSUNG[(offset % 588) // 28])
+            if offset % 28:
+                result.append(JONGSUNG[offset % 28])
+        elif not char.isspace():
+            result.append(char)
+    return ''.join(result)
+
+
+def extract_chosung(text: str) -> str:
+    """초성만 추출 ('삼성전자' -> 'ㅅㅅㅈㅈ'), 한글이 아닌 문자는 그대로"""
+    result = []
+    for char in text.lower():
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSUNG[(code - HANGUL_BASE) // 588])
+        elif not char.isspace():
+            result.append(char)
+    return ''.join(result)
+
+
+def is_chosung_query(query: str) -> bool:
+    return any(char in CHOSUNG_SET for char in query) and all(
+        char in CHOSUNG_SET or char.isspace() for char in query
+    )
+
+
+class AutocompleteIndex:
+    """자모 분해/초성 키 기반 트라이 - 각 노드에 인기도 상위 후보를 미리 보관
+
+    구축이 끝난 색인은 읽기 전용으로만 쓴다 (요청 중에 add하지 않음).
+    키는 max_depth 자모까지만 노드로 만들고, 더 긴 질의는 마지막 노드의 후보를 걸러 답한다.
+    word_starts=True로 추가한 term(뉴스 제목)은 어절마다 그 어절부터 시작하는 키로도 찾을 수 있다.
+    """
+
+    def __init__(self, top_k: int = 10, max_depth: int = 30):
+        self.top_k = top_k
+        self.max_depth = max_depth
+        self.scores: Dict[str, float] = {}
+        self.jamo_root = [{}, []]
+        self.chosung_root = [{}, []]
+
+    def __len__(self):
+        return len(self.scores)
+
+    def add(self, term: str, score: float = 1.0, depth: Optional[int] = None, word_starts: bool = False) -> None:
+        """term의 인기도를 score만큼 올리고 경로상 노드(최대 depth 자모)의 상위 후보를 갱신"""
+        term = term.strip()
+        if not term:
+            return
+        depth = min(depth or self.max_depth, self.max_depth)
+        self.scores[term] = self.scores.get(term, 0.0) + score
+        words = term.split()
+        keys = [''.join(words[i:]) for i in range(len(words))] if word_starts else [term]
+        for key in keys:
+            self._insert(self.jamo_root, decompose(key)[:depth], term)
+            chosung = extract_chosung(key)
+            if chosung != key.lower():
+                self._insert(self.chosung_root, chosung[:depth], term)
+
+    def _insert(self, root: list, key: str, term: str) -> None:
+        node = root
+        for char in key:
+            node = node[CHILDREN].setdefault(char, [{}, []])
+            self._update_top(node[TOP], term)
+
+    def _update_top(self, top: List[str], term: str) -> None:
+        if term in top:
+            top.remove(term)
+        elif len(top) >= self.top_k and self.scores[term] <= self.scores[top[-1]]:
+            return
+        score = self.scores[term]
+        index = len(top)
+        while index > 0 and self.scores[top[index - 1]] < score:
+            index -= 1
+        top.insert(index, term)
+        del top[self.top_k:]
+
+    def complete(self, query: str, limit: int = 5) -> List[str]:
+        query = query.strip()
+        if not query:
+            return []
+        if is_chosung_query(query):
+            root, key, to_key = self.chosung_root, extract_chosung(query), extract_chosung
+        else:
+            root, key, to_key = self.jamo_root, decompose(query), decompose
+
+        node = root
+        for char in key[:self.max_depth]:
+            node = node[CHILDREN].get(char)
+            if node is None:
+                return []
+        if len(key) <= self.max_depth:
+            return list(node[TOP][:limit])
+        return [term for term in node[TOP] if key in to_key(term)][:limit]
+
+
+class AutocompleteService:
+    """키워드/뉴스 제목/검색 기록으로 자동완성 색인을 만들고 주기적으로 백그라운드 재구축
+
+    새 색인은 옆에서 다 만든 뒤 참조만 바꿔 끼우므로 요청은 항상 완성된 색인을 읽는다.
+    뉴스 제목은 최근 기사 일부를 앞부분(AUTOCOMPLETE_TITLE_DEPTH 자모)까지만 색인해 메모리를 제한하고,
+    AUTOCOMPLETE_TITLE_WORD_STARTS면 제목 중간 어절로 시작하는 질의도 찾는다 (어절 중간 부분 문자열은 제외).
+    """
+
+    _index: Optional[AutocompleteIndex] = None
+    _built_at = 0.0
+    _building = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'AUTOCOMPLETE_ENABLED', True)
+
+    @classmethod
+    def build_index(cls) -> AutocompleteIndex:
+        index = AutocompleteIndex(max_depth=getattr(settings, 'AUTOCOMPLETE_MAX_DEPTH', 30))
+
+        for name, total in cls._keyword_counts():
+            index.add(name, total)
+
+        history_weight = getattr(settings, 'AUTOCOMPLETE_HISTORY_WEIGHT', 10)
+        for keyword, count in SearchHistory.objects.values_list('keyword', 'count').iterator():
+            index.add(keyword, count * history_weight)
+
+        title_limit = getattr(settings, 'AUTOCOMPLETE_TITLE_LIMIT', 5000)
+        title_depth = getattr(settings, 'AUTOCOMPLETE_TITLE_DEPTH', 12)
+        if title_limit:
+            recent_titles = News.objects.order_by('-date', '-id').values_list('title', flat=True)[:title_limit]
+            word_starts = getattr(settings, 'AUTOCOMPLETE_TITLE_WORD_STARTS', True)
+            for title in recent_titles.iterator():
+                index.add(title, 1, depth=title_depth, word_starts=word_starts)
+
+        return index
+
+    @staticmethod
+    def _keyword_counts():
+        """(키워드, 뉴스 수) - 키워드 색인을 쓰면 Keyword 테이블, 아니면 최근 뉴스의 keyword 문자열을 직접 집계"""
+        if KeywordIndexService.is_enabled():
+            return (Keyword.objects
+                    .annotate(total=Count('news'))
+                    .values_list('name', 'total')
+                    .iterator())
+        limit = getattr(settings, 'AUTOCOMPLETE_KEYWORD_NEWS_LIMIT', 50000)
+        counts = Counter()
+        recent_keywords = News.objects.order_by('-date', '-id').values_list('keyword', flat=True)[:limit]
+        for raw_keyword in recent_keywords.iterator():
+            counts.update(KeywordIndexService.tokenize(raw_keyword))
+        return counts.items()
+
+    @classmethod
+    def get_index(cls) -> Optional[AutocompleteIndex]:
+        """현재 색인 반환 - TTL이 지났거나 없으면 백그라운드 재구축을 시작 (그동안 기존 색인 사용)"""
+        ttl = getattr(settings, 'AUTOCOMPLETE_REBUILD_SECONDS', 600)
+        if cls._index is None or time.monotonic() - cls._built_at > ttl:
+            cls._start_rebuild()
+        return cls._index
+
+    @classmethod
+    def _start_rebuild(cls) -> None:
+        with cls._lock:
+            if cls._building:
+                return
+            cls._building = True
+        threading.Thread(target=cls._rebuild, daemon=True).start()
+
+    @classmethod
+    def _rebuild(cls) -> None:
+        from django.db import connection
+        try:
+            cls._index = cls.build_index()
+            cls._built_at = time.monotonic()
+        except Exception as e:
+            print(f"자동완성 색인 구축 오류: {e}")
+        finally:
+            connection.close()
+            cls._building = False
+
+    @classmethod
+    def complete(cls, query: str, limit: int = 5) -> Optional[List[str]]:
+        """자동완성 후보 반환 - 색인이 아직 준비되지 않았으면 None"""
+        index = cls.get_index()
+        if index is None:
+            return None
+        return index.complete(query, limit)
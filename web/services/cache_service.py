@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+
+
+class TwoTierCache:
+    """프로세스 내 LRU(1차) + 공유 Redis 캐시(2차) read-through 캐시
+
+    1차 캐시는 다른 프로세스의 무효화를 알 수 없으므로 TTL을 짧게 유지한다.
+    """
+
+    def __init__(self, namespace: str, local_max_entries: Optional[int] = None,
+                 local_ttl: Optional[float] = None, shared_ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.local_max_entries = local_max_entries or getattr(settings, 'SUMMARY_CACHE_LOCAL_MAX_ENTRIES', 2048)
+        self.local_ttl = local_ttl or getattr(settings, 'SUMMARY_CACHE_LOCAL_TTL', 30)
+        self.shared_ttl = shared_ttl or getattr(settings, 'SUMMARY_CACHE_TTL', 6 * 60 * 60)
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        # loads: 캐시 miss 뒤 get_or_load의 loader(DB)가 값을 찾은 횟수
+        self.stats = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'loads': 0, 'evictions': 0}
+
+    def make_key(self, *parts) -> str:
+        raw = '|'.join('' if part is None else str(part) for part in parts)
+        return f"tiercache:{self.namespace}:{hashlib.md5(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._local.move_to_end(key)
+                    self.stats['local_hits'] += 1
+                    return value
+                del self._local[key]
+
+        try:
+            value = cache.get(key)
+        except Exception as e:
+            print(f"공유 캐시 조회 오류: {e}")
+            value = None
+
+        if value is not None:
+            self._set_local(key, value)
+            self._count('shared_hits')
+        else:
+            self._count('misses')
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if value is None:
+            return
+        self._set_local(key, value)
+        try:
+            cache.set(key, value, self.shared_ttl)
+        except Exception as e:
+            print(f"공유 캐시 저장 오류: {e}")
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시에 없으면 loader(DB 조회) 결과를 두 계층에 채워 넣음 (None은 캐시하지 않음)"""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self._count('loads')
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._local.pop(key, None)
+        try:
+            cache.delete(key)
+        except Exception as e:
+            print(f"공유 캐시 삭제 오류: {e}")
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def _set_local(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._local[key] = (value, time.monotonic() + self.local_ttl)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['local_size'] = len(self._local)
+        lookups = stats['local_hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_ratio'] = (stats['local_hits'] + stats['shared_hits']) / lookups if lookups else 0.0
+        return stats
+
+
+# 요약 종류별 캐시 (프로세스당 하나)
+news_summary_cache = TwoTierCache('news_summary')
+quick_summary_cache = TwoTierCache('quick_summary')
+daily_summary_cache = TwoTierCache('daily_summary')
@@ -1,18 +1,49 @@
-from django.db.models import Count
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from openai import OpenAI
-from ..models import News, DailySummary
-from typing import List, Dict
-import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Max
+from django.db.models.functions import Substr
+from asgiref.sync import sync_to_async
+from ..models import DailySummary
+from typing import List, Dict, Optional
+from .llm_client import get_llm_client
+from .llm_service import LLMService
+from .single_flight import SingleFlight
+from .cache_service import daily_summary_cache
+from .news_filter import get_news_filter
+from .rate_limiter import RateLimiter
+from .story_cluster_service import StoryClusterService
+from .summary_refresh_service import SummaryRefreshService
+
+EMPTY_HOVER_SUMMARY = {
+    'title_summary': '요약 없음',
+    'content_summary': '해당 기간의 뉴스가 없습니다.',
+    'news_count': 0
+}
+
+# 호버 요약 사전 생성은 프로세스 전체에서 하나의 초당 요청 수 제한과 제한된 스레드 풀을 공유
+precompute_rate_limiter = RateLimiter(getattr(settings, 'HOVER_PRECOMPUTE_RATE_PER_SECOND', 2))
+precompute_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'HOVER_PRECOMPUTE_QUEUE_WORKERS', 2),
+    thread_name_prefix='hover-precompute'
+)
+
+
+class HoverSummaryError(Exception):
+    """LLM 호출 실패로 호버 요약을 만들지 못함 (실패 결과는 저장하지 않음)"""
+
 
 class DailyIssueService:
     def __init__(self):
-        self.client = OpenAI()
-        self.model = "gpt-4o-mini"
+        self.client = get_llm_client()
+        self.model = getattr(settings, 'LLM_MODEL', 'gpt-4o-mini')
         self.min_news_count = 20
         self.batch_size = 5
 
-    def get_period_range(self, date: datetime.date, group_by: str) -> tuple:
+    @staticmethod
+    def get_period_range(date: datetime.date, group_by: str) -> tuple:
         """주어진 날짜와 그룹 기준에 따라 시작일과 종료일을 반환"""
         if group_by == '1week':
             start_date = date - timedelta(days=date.weekday())
@@ -29,56 +60,133 @@ class DailyIssueService:
 
         return start_date, end_date
 
-    def prepare_daily_summaries(self, query: str, news_list, group_by: str = '1day') -> None:
-        """차트 데이터 준비 시 호출되는 메서드 - 상위 10일 정도만 미리 처리"""
-        news_by_period = {}
-        for news in news_list:
-            period_start, _ = self.get_period_range(news.date, group_by)
-            period_key = period_start.strftime('%Y-%m-%d')
-            
-            if period_key not in news_by_period:
-                news_by_period[period_key] = []
-            news_by_period[period_key].append(news)
-        
-        # 뉴스가 많은 상위 10일만 선택
+    def prepare_daily_summaries(self, query: str, group_by: str = '1day', start_date=None, end_date=None,
+                                top_n: int = 10) -> int:
+        """뉴스가 많은 상위 기간의 호버 요약을 미리 생성 - 생성한 요약 수 반환
+
+        기간별 건수는 DB GROUP BY(또는 일별 집계)로 구하고, LLM 호출은
+        제한된 스레드 풀에서 초당 요청 수 제한을 지키며 병렬로 실행한다.
+        """
+        period_counts = get_news_filter(
+            query=query,
+            group_by=group_by,
+            start_date=start_date,
+            end_date=end_date,
+            for_chart=True
+        )
+
+        # 뉴스가 많은 상위 기간만 선택
         important_periods = sorted(
             [
-                (period, news_group) 
-                for period, news_group in news_by_period.items() 
-                if len(news_group) >= self.min_news_count
+                (self._as_date(item['period']), item['count'])
+                for item in period_counts
+                if item['count'] >= self.min_news_count
             ],
-            key=lambda x: len(x[1]),
+            key=lambda x: x[1],
             reverse=True
-        )[:10]
-
-        # 배치 처리
-        for period_str, period_news_list in important_periods:
-            # 이미 요약이 있는지 확인
-            period_start = datetime.strptime(period_str, '%Y-%m-%d').date()
-            if DailySummary.objects.filter(
-                date=period_start,
-                query=query,
-                group_by=group_by
-            ).exists():
-                continue
+        )[:top_n]
+        if not important_periods:
+            return 0
+
+        # 이미 요약이 있는 기간 제외
+        existing = set(DailySummary.objects.filter(
+            query=query,
+            group_by=group_by,
+            date__in=[period for period, _ in important_periods]
+        ).values_list('date', flat=True))
+        pending = [(period, count) for period, count in important_periods if period not in existing]
+
+        max_workers = getattr(settings, 'HOVER_PRECOMPUTE_WORKERS', 4)
+
+        def create(period_start, news_count):
+            try:
+                precompute_rate_limiter.acquire()
+                _, period_end = self.get_period_range(period_start, group_by)
+                SingleFlight('daily_summary').run(
+                    f"{query}_{period_start}_{group_by}",
+                    generate=lambda: self._create_period_summary(query, group_by, period_start, period_end, news_count),
+                    fetch=lambda: self._find_cached_summary(query, group_by, period_start, period_end)
+                )
+                return True
+            except Exception as e:
+                print(f"호버 요약 사전 생성 오류 ({query}, {period_start}): {e}")
+                return False
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda item: create(*item), pending))
+        return sum(results)
+
+    @classmethod
+    def schedule_precompute(cls, query: str, group_by: str = '1day', start_date=None, end_date=None) -> bool:
+        """차트 첫 조회 시 호버 요약 사전 생성을 백그라운드 풀에 등록 (키워드/그룹당 한 번)
+
+        요청마다 스레드를 만들지 않고 HOVER_PRECOMPUTE_QUEUE_WORKERS개 스레드가 차례로 처리한다.
+        """
+        if not query or not getattr(settings, 'HOVER_PRECOMPUTE_ON_CHART', True):
+            return False
+        try:
+            ttl = getattr(settings, 'HOVER_PRECOMPUTE_INTERVAL_SECONDS', 60 * 60)
+            if not cache.add(f"hover_precompute:{group_by}:{query}", True, ttl):
+                return False
+        except Exception as e:
+            print(f"호버 요약 사전 생성 예약 오류: {e}")
+            return False
 
-            self._create_summary(period_start, query, period_news_list, group_by)
-            time.sleep(0.5)  # API 요청 간 간격 조절
+        def run():
+            try:
+                cls().prepare_daily_summaries(query, group_by, start_date, end_date)
+            except Exception as e:
+                print(f"호버 요약 사전 생성 오류 ({query}): {e}")
+            finally:
+                connection.close()
 
-    def _create_summary(self, date: datetime.date, query: str, news_list: List[News], group_by: str) -> DailySummary:
-        """요약을 생성하고 저장"""
+        precompute_executor.submit(run)
+        return True
+
+    @staticmethod
+    def _as_date(value):
+        return value.date() if isinstance(value, datetime) else value
+
+    def _create_period_summary(self, query: str, group_by: str, period_start, period_end,
+                               news_count: int) -> DailySummary:
+        """기간의 최신 뉴스 10건(필요한 컬럼만)으로 요약 생성"""
+        news_list = get_news_filter(query=query, start_date=period_start, end_date=period_end, group_by=group_by)
+        last_news_id = news_list.aggregate(last_id=Max('id'))['last_id']
+        return self._create_summary(period_start, query, self._fetch_top_news(news_list), group_by, news_count,
+                                    last_news_id)
+
+    def _fetch_top_news(self, news_list, limit: int = 10) -> List[Dict]:
+        """최신 뉴스 limit건의 제목/본문 앞부분/이미지만 DB에서 잘라서 조회"""
+        content_chars = getattr(settings, 'HOVER_SUMMARY_CONTENT_CHARS', 500)
+
+        def fetch(queryset):
+            return list(
+                queryset.order_by('-date', '-id')
+                .annotate(content_prefix=Substr('content', 1, content_chars))
+                .values('title', 'content_prefix', 'image')[:limit]
+            )
+
+        # 재배포 기사는 클러스터별 대표 기사만
+        if getattr(settings, 'STORY_CLUSTER_COLLAPSE_SUMMARIES', True):
+            return fetch(StoryClusterService.collapse(news_list))
+        return fetch(news_list)
+
+    def _create_summary(self, date: datetime.date, query: str, news_rows: List[Dict], group_by: str,
+                        news_count: int, last_news_id: Optional[int] = None) -> DailySummary:
+        """요약을 생성하고 저장 (생성 실패 시 저장하지 않고 HoverSummaryError)"""
         # 대표 이미지 선택
-        representative_image = next(
-            (news.image for news in news_list if news.image),
-            None
-        )
+        representative_image = self._representative_image(news_rows)
 
         # 요약 생성
         summary = self._generate_summary(
-            [news.title for news in news_list[:10]],
-            [news.content for news in news_list[:10]],
+            [news['title'] for news in news_rows[:10]],
+            [news['content_prefix'] for news in news_rows[:10]],
             group_by
         )
+        if summary is None:
+            raise HoverSummaryError(f"{query} {date} 요약 생성 실패")
 
         # DB에 저장
         return DailySummary.objects.create(
@@ -87,115 +195,209 @@ class DailyIssueService:
             group_by=group_by,
             title_summary=summary['title'],
             content_summary=summary['content'],
-            news_count=len(news_list),
-            representative_image=representative_image
+            news_count=news_count,
+            representative_image=representative_image,
+            last_news_id=last_news_id
+        )
+
+    async def _acreate_summary(self, date: datetime.date, query: str, news_rows: List[Dict], group_by: str,
+                               news_count: int, last_news_id: Optional[int] = None) -> DailySummary:
+        """_create_summary의 비동기 버전"""
+        summary = await self._agenerate_summary(
+            [news['title'] for news in news_rows[:10]],
+            [news['content_prefix'] for news in news_rows[:10]],
+            group_by
+        )
+        if summary is None:
+            raise HoverSummaryError(f"{query} {date} 요약 생성 실패")
+        return await DailySummary.objects.acreate(
+            date=date,
+            query=query,
+            group_by=group_by,
+            title_summary=summary['title'],
+            content_summary=summary['content'],
+            news_count=news_count,
+            representative_image=self._representative_image(news_rows),
+            last_news_id=last_news_id
+        )
+
+    @staticmethod
+    def _representative_image(news_rows: List[Dict]) -> Optional[str]:
+        return next(
+            (news['image'] for news in news_rows if news['image']),
+            None
         )
 
     def get_cached_summary(self, date: datetime.date, query: str, group_by: str, news_list) -> Dict:
-        """캐시된 요약 정보 반환 또는 새로운 요약 생성"""
+        """캐시된 요약 정보 반환 또는 새로운 요약 생성
+
+        news_list(QuerySet)는 메모리로 읽지 않고 기간 필터/COUNT/LIMIT 10을 모두 DB에서 처리한다.
+        """
         # 1. 기간 계산
         period_start, period_end = self.get_period_range(date, group_by)
 
-        # 2. 해당 기간의 뉴스 필터링
-        period_news = [
-            news for news in news_list 
-            if period_start <= news.date <= period_end
-        ]
+        # 2. 해당 기간의 뉴스 수와 마지막 id (SQL 집계 한 번)
+        period_news = news_list.filter(date__range=[period_start, period_end])
+        stats = period_news.aggregate(count=Count('id'), last_id=Max('id'))
+        news_count = stats['count']
 
         # 3. DailySummary 캐시 확인 - group_by 기준으로 검색
-        cached_summary = DailySummary.objects.filter(
-            query=query,
-            group_by=group_by,
-        ).filter(
-            date__range=[period_start, period_end]
-        ).first()
+        cached_summary = self._find_cached_summary(query, group_by, period_start, period_end)
 
-        if cached_summary and period_news:  # 캐시가 있고 뉴스도 있는 경우
-            return {
-                'title_summary': cached_summary.title_summary,
-                'content_summary': cached_summary.content_summary,
-                'news_count': len(period_news)  # 항상 현재 필터링된 뉴스 수 사용
-            }
+        if cached_summary and news_count:  # 캐시가 있고 뉴스도 있는 경우 (stale이면 응답 후 백그라운드 갱신)
+            return self._cached_response(cached_summary, news_count)
 
         # 4. 뉴스가 없거나 적은 경우
-        if not period_news:
+        if not news_count:
+            return dict(EMPTY_HOVER_SUMMARY)
+
+        # 5. 새로운 요약 생성 - 최신 10건만 조회 (동시 요청은 single-flight로 한 번만 생성)
+        try:
+            daily_summary = SingleFlight('daily_summary').run(
+                f"{query}_{period_start}_{group_by}",
+                generate=lambda: self._create_summary(
+                    period_start, query, self._fetch_top_news(period_news), group_by, news_count, stats['last_id']
+                ),
+                fetch=lambda: self._find_cached_summary(query, group_by, period_start, period_end)
+            )
+
             return {
-                'title_summary': '요약 없음',
-                'content_summary': '해당 기간의 뉴스가 없습니다.',
-                'news_count': 0
+                'title_summary': daily_summary.title_summary,
+                'content_summary': daily_summary.content_summary,
+                'news_count': news_count
+            }
+        except Exception as e:
+            print(f"Error generating summary: {e}")
+            return {
+                'title_summary': '요약 실패',
+                'content_summary': '요약을 생성할 수 없습니다.',
+                'news_count': news_count
             }
 
-        # 5. 새로운 요약 생성 - 전체 기간의 뉴스 사용
-        try:
-            # 시간순으로 정렬하여 최신 뉴스 우선 사용
-            sorted_news = sorted(period_news, key=lambda x: x.date, reverse=True)
-            titles = [news.title for news in sorted_news[:10]]  # 상위 10개만 사용
-            contents = [news.content for news in sorted_news[:10]]
+    async def aget_cached_summary(self, date: datetime.date, query: str, group_by: str, news_list) -> Dict:
+        """get_cached_summary의 비동기 버전 (집계는 async ORM, 요약 생성은 AsyncOpenAI)"""
+        period_start, period_end = self.get_period_range(date, group_by)
+        period_news = news_list.filter(date__range=[period_start, period_end])
+        stats = await period_news.aaggregate(count=Count('id'), last_id=Max('id'))
+        news_count = stats['count']
 
-            summary = self._generate_summary(titles, contents, group_by)
+        cached_summary = await sync_to_async(self._find_cached_summary)(query, group_by, period_start, period_end)
+        if cached_summary and news_count:
+            return await sync_to_async(self._cached_response)(cached_summary, news_count)
 
-            # 6. 요약 저장 - 기간의 시작일로 저장
-            DailySummary.objects.create(
-                date=period_start,
-                query=query,
-                group_by=group_by,
-                title_summary=summary['title'],
-                content_summary=summary['content'],
-                news_count=len(period_news)
+        if not news_count:
+            return dict(EMPTY_HOVER_SUMMARY)
+
+        async def generate():
+            news_rows = await sync_to_async(self._fetch_top_news)(period_news)
+            return await self._acreate_summary(
+                period_start, query, news_rows, group_by, news_count, stats['last_id']
             )
 
+        try:
+            daily_summary = await SingleFlight('daily_summary').arun(
+                f"{query}_{period_start}_{group_by}",
+                generate=generate,
+                fetch=lambda: sync_to_async(self._find_cached_summary)(query, group_by, period_start, period_end)
+            )
             return {
-                'title_summary': summary['title'],
-                'content_summary': summary['content'],
-                'news_count': len(period_news)
+                'title_summary': daily_summary.title_summary,
+                'content_summary': daily_summary.content_summary,
+                'news_count': news_count
             }
         except Exception as e:
             print(f"Error generating summary: {e}")
             return {
                 'title_summary': '요약 실패',
                 'content_summary': '요약을 생성할 수 없습니다.',
-                'news_count': len(period_news)
+                'news_count': news_count
             }
 
-    def _generate_summary(self, titles: List[str], contents: List[str], group_by: str) -> Dict[str, str]:
-        """LLM을 사용해 뉴스 요약 생성"""
-        period_type = {
-            '1day': '하루',
-            '1week': '한 주',
-            '1month': '한 달'
-        }.get(group_by, '기간')
+    @staticmethod
+    def _cached_response(cached_summary: DailySummary, news_count: int) -> Dict:
+        if cached_summary.is_stale:
+            summary_id = cached_summary.id
+            SummaryRefreshService.schedule(
+                'daily_summary', summary_id, lambda: DailyIssueService().refresh_summary(summary_id)
+            )
+        return {
+            'title_summary': cached_summary.title_summary,
+            'content_summary': cached_summary.content_summary,
+            'news_count': news_count  # 항상 현재 필터링된 뉴스 수 사용
+        }
 
-        try:
-            prompt = f"""다음 {period_type} 동안의 뉴스들을 분석해주세요:
+    def refresh_summary(self, summary_id: int) -> bool:
+        """stale 호버 요약을 이전 요약 + 마지막 반영 이후의 새 기사(최신 10건)만으로 갱신"""
+        saved = DailySummary.objects.filter(pk=summary_id, is_stale=True).first()
+        if not saved:
+            return False
+        # 갱신 중에 들어온 뉴스가 다시 stale로 표시할 수 있도록 먼저 해제
+        DailySummary.objects.filter(pk=saved.pk).update(is_stale=False)
 
-제목들:
-{' / '.join(titles)}
+        period_start, period_end = self.get_period_range(saved.date, saved.group_by)
+        news_list = get_news_filter(
+            query=saved.query or '', start_date=period_start, end_date=period_end, group_by=saved.group_by
+        )
+        stats = news_list.aggregate(count=Count('id'), last_id=Max('id'))
+        new_news = news_list.filter(id__gt=saved.last_news_id) if saved.last_news_id else news_list
+        news_rows = self._fetch_top_news(new_news)
 
-내용들:
-{' / '.join(contents[:3])}  # 내용은 처음 3개만 사용하여 토큰 수 제한
+        if news_rows:
+            summary = LLMService().refresh_hover_summary(
+                {'title': saved.title_summary, 'content': saved.content_summary},
+                [news['title'] for news in news_rows],
+                [news['content_prefix'] for news in news_rows],
+                saved.group_by
+            )
+            if summary is None:
+                DailySummary.objects.filter(pk=saved.pk).update(is_stale=True)
+                return False
+            saved.title_summary = summary['title'][:100]
+            saved.content_summary = summary['content']
 
-아래 형식으로 요약해주세요:
-- 제목 요약 (20자 이내)
-- 내용 요약 (50자 이내)"""
+        saved.news_count = stats['count']
+        saved.last_news_id = stats['last_id'] or saved.last_news_id
+        saved.save(update_fields=['title_summary', 'content_summary', 'news_count', 'last_news_id'])
+        return True
 
-            response = self.client.chat.completions.create(
+    def _find_cached_summary(self, query: str, group_by: str, period_start, period_end):
+        """기간의 DailySummary 조회 (LRU/Redis 캐시 경유)"""
+        def load():
+            return DailySummary.objects.filter(
+                query=query,
+                group_by=group_by,
+            ).filter(
+                date__range=[period_start, period_end]
+            ).first()
+
+        cache_key = daily_summary_cache.make_key(query, group_by, period_start, period_end)
+        return daily_summary_cache.get_or_load(cache_key, load)
+
+    def _generate_summary(self, titles: List[str], contents: List[str], group_by: str) -> Optional[Dict[str, str]]:
+        """LLM을 사용해 뉴스 요약 생성 (실패 시 None)"""
+        try:
+            response = self.client.chat(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 뉴스를 간단명료하게 요약하는 전문가입니다."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=LLMService._hover_summary_messages(titles, contents, group_by),
                 temperature=0.7,
                 max_tokens=200
             )
-            
-            summary = response.choices[0].message.content.strip().split('\n')
-            return {
-                'title': summary[0].replace('- 제목 요약: ', ''),
-                'content': summary[1].replace('- 내용 요약: ', '')
-            }
+            return LLMService._parse_hover_summary(response.choices[0].message.content)
         except Exception as e:
             print(f"Error in generate_summary: {e}")
-            return {
-                'title': '요약 실패',
-                'content': '요약을 생성할 수 없습니다.'
-            }
\ No newline at end of file
+            return None
+
+    async def _agenerate_summary(self, titles: List[str], contents: List[str],
+                                 group_by: str) -> Optional[Dict[str, str]]:
+        """_generate_summary의 비동기 버전"""
+        try:
+            response = await self.client.achat(
+                model=self.model,
+                messages=LLMService._hover_summary_messages(titles, contents, group_by),
+                temperature=0.7,
+                max_tokens=200
+            )
+            return LLMService._parse_hover_summary(response.choices[0].message.content)
+        except Exception as e:
+            print(f"Error in generate_summary: {e}")
+            return None
@@ -0,0 +1,378 @@
+import math
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+from django.utils.http import urlencode
+from ..models import DailySummary, Keyword, KeywordDailyCount, News, NewsSummary, QuickSummary, SummaryJob
+from .cache_service import daily_summary_cache, news_summary_cache, quick_summary_cache
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+GROUP_BYS = ['1day', '1week', '1month']
+# LLM을 호출할 수 있는 엔드포인트 (실제 OpenAI 백엔드로는 기본 제외)
+LLM_ENDPOINTS = {
+    'get_summary_api', 'stream_summary_api', 'get_summary_api_async',
+    'get_quick_summary_api', 'stream_quick_summary_api', 'get_quick_summary_api_async',
+    'get_hover_summary', 'get_hover_summary_async',
+}
+# 비교 시 지표별로 어느 쪽이 나빠진 것인지 (1: 커지면 나쁨, -1: 작아지면 나쁨)
+COMPARE_METRICS = [
+    ('p50_ms', 1), ('p95_ms', 1), ('p99_ms', 1), ('throughput_rps', -1), ('queries_mean', 1),
+]
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """nearest-rank 백분위수 (정렬된 목록)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class EndpointBenchmark:
+    """web/urls.py의 엔드포인트를 실제 데이터에서 뽑은 파라미터로 동시 호출해 지연시간을 측정
+
+    - 기본은 프로세스 내 django.test.Client로 호출 (미들웨어 포함 전체 요청 처리, 요청 스레드의 SQL 쿼리 수와
+      최대 RSS도 기록) - base_url을 주면 실행 중인 서버에 HTTP로 호출 (지연시간/처리량만)
+    - concurrency개 스레드가 쉬지 않고 요청을 보내는 closed-loop 부하, 엔드포인트마다 따로 측정
+    - 검색어는 게시 수 상위 키워드(hot)와 임의 키워드(tail)를 섞고, 날짜는 그 키워드에 뉴스가 있는 날짜에서 고름
+    - seed가 같으면 같은 요청 순서가 만들어지므로 결과(JSON)를 실행 간에 비교할 수 있다
+    """
+
+    def __init__(self, concurrency: int = 8, requests: int = 200, warmup: int = 10, seed: int = 0,
+                 hot_keywords: int = 20, tail_keywords: int = 200, hot_ratio: float = 0.8,
+                 base_url: Optional[str] = None, timeout: float = 120):
+        self.concurrency = concurrency
+        self.requests = requests
+        self.warmup = warmup
+        self.seed = seed
+        self.hot_keywords = hot_keywords
+        self.tail_keywords = tail_keywords
+        self.hot_ratio = hot_ratio
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.timeout = timeout
+        self.host = next(
+            (host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')), 'localhost'
+        )
+        self._local = threading.local()
+        self.samples = None
+
+    # 요청 파라미터 샘플
+
+    def load_samples(self) -> Dict:
+        rng = random.Random(f"samples:{self.seed}")
+        hot = list(
+            Keyword.objects.annotate(num_news=Count('news'))
+            .order_by('-num_news')
+            .values_list('id', 'name')[:self.hot_keywords]
+        )
+        max_keyword_id = Keyword.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        tail_ids = {rng.randint(1, max_keyword_id) for _ in range(self.tail_keywords)} if max_keyword_id else set()
+        tail = list(Keyword.objects.filter(id__in=tail_ids).order_by('id').values_list('id', 'name'))
+
+        names = dict(hot + tail)
+        dates = {}
+        for keyword_id, day in KeywordDailyCount.objects.filter(keyword_id__in=list(names)).values_list(
+                'keyword_id', 'date').order_by('keyword_id', 'date'):
+            dates.setdefault(names[keyword_id], []).append(day.isoformat())
+
+        latest_date = News.objects.order_by('-date').values_list('date', flat=True).first()
+        id_range = (
+            News.objects.order_by('id').values_list('id', flat=True).first() or 0,
+            News.objects.order_by('-id').values_list('id', flat=True).first() or 0,
+        )
+        self.samples = {
+            'hot': [name for _, name in hot],
+            'tail': [name for _, name in tail],
+            'dates': dates,
+            'latest_date': latest_date.isoformat() if latest_date else datetime.now().date().isoformat(),
+            'news_ids': id_range,
+            'job_id': SummaryJob.objects.order_by('-id').values_list('id', flat=True).first() or 0,
+        }
+        return self.samples
+
+    def _keyword(self, rng: random.Random) -> str:
+        hot, tail = self.samples['hot'], self.samples['tail']
+        if hot and (not tail or rng.random() < self.hot_ratio):
+            # 상위 키워드 안에서도 순위가 높을수록 자주 검색
+            return hot[min(len(hot) - 1, int(rng.paretovariate(1.2)) - 1)]
+        return rng.choice(tail) if tail else ''
+
+    def _date(self, rng: random.Random, keyword: str) -> str:
+        dates = self.samples['dates'].get(keyword)
+        return rng.choice(dates) if dates else self.samples['latest_date']
+
+    def _period(self, rng: random.Random) -> Tuple[str, str, str]:
+        keyword = self._keyword(rng)
+        return keyword, self._date(rng, keyword), rng.choice(GROUP_BYS)
+
+    # 엔드포인트별 요청 URL
+
+    def scenarios(self) -> Dict[str, Callable[[random.Random], str]]:
+        """URL 이름 -> (rng -> 요청 경로), 경로는 load_samples()로 뽑은 파라미터로 만듦"""
+
+        def url(name: str, params: Optional[Dict] = None, **kwargs) -> str:
+            path = reverse(f'web:{name}', kwargs=kwargs or None)
+            return f"{path}?{urlencode(params)}" if params else path
+
+        def summary(name):
+            def build(rng):
+                keyword, day, group_by = self._period(rng)
+                return url(name, {'query': keyword, 'date': day, 'group_by': group_by})
+            return build
+
+        def quick_summary(name):
+            return lambda rng: url(name, {'query': self._keyword(rng)})
+
+        def hover_summary(name):
+            def build(rng):
+                keyword, day, group_by = self._period(rng)
+                return url(name, {'query': keyword, 'group_by': group_by}, date=day)
+            return build
+
+        def news(rng):
+            keyword, day, group_by = self._period(rng)
+            params = {'query': keyword, 'page_size': 10}
+            if rng.random() < 0.3:
+                params.update({'date': day, 'group_by': group_by})
+            else:
+                params['page'] = min(5, int(rng.paretovariate(1.5)))
+            return url('get_news_api', params)
+
+        def suggestions(rng):
+            keyword = self._keyword(rng)
+            return url('search_suggestions', {'query': keyword[:rng.randint(1, max(1, len(keyword)))]})
+
+        def news_detail(rng):
+            first_id, last_id = self.samples['news_ids']
+            return url('news_detail_api', news_id=rng.randint(first_id, max(first_id, last_id)))
+
+        return {
+            'splash': lambda rng: url('splash'),
+            'home': lambda rng: url('home'),
+            'search': lambda rng: url('search', {'query': self._keyword(rng)}),
+            'news_count_chart_api': lambda rng: url(
+                'news_count_chart_api', {'query': self._keyword(rng), 'group_by': rng.choice(GROUP_BYS)}
+            ),
+            'get_news_api': news,
+            'trending_keywords': lambda rng: url('trending_keywords'),
+            'search_suggestions': suggestions,
+            'news_detail_api': news_detail,
+            'get_summary_job_api': lambda rng: url('get_summary_job_api', job_id=self.samples['job_id']),
+            'metrics': lambda rng: url('metrics'),
+            'get_summary_api': summary('get_summary_api'),
+            'stream_summary_api': summary('stream_summary_api'),
+            'get_summary_api_async': summary('get_summary_api_async'),
+            'get_quick_summary_api': quick_summary('get_quick_summary_api'),
+            'stream_quick_summary_api': quick_summary('stream_quick_summary_api'),
+            'get_quick_summary_api_async': quick_summary('get_quick_summary_api_async'),
+            'get_hover_summary': hover_summary('get_hover_summary'),
+            'get_hover_summary_async': hover_summary('get_hover_summary_async'),
+        }
+
+    @staticmethod
+    def url_names() -> List[str]:
+        """web/urls.py에 등록된 URL 이름 (시나리오가 빠진 엔드포인트를 알려 주기 위해 사용)"""
+        from web.urls import urlpatterns
+        return [pattern.name for pattern in urlpatterns if getattr(pattern, 'name', None)]
+
+    @staticmethod
+    def reset_summaries() -> None:
+        """저장된 요약과 캐시를 지워 LLM 엔드포인트를 캐시 없는 상태(cold)에서 측정"""
+        NewsSummary.objects.all().delete()
+        DailySummary.objects.all().delete()
+        QuickSummary.objects.all().delete()
+        cache.clear()
+        for tier_cache in (news_summary_cache, quick_summary_cache, daily_summary_cache):
+            tier_cache.clear_local()
+
+    # 실행
+
+    def run(self, names: List[str], progress: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """엔드포인트를 하나씩 측정한 결과 (progress는 엔드포인트가 끝날 때마다 호출)"""
+        if self.samples is None:
+            self.load_samples()
+        scenarios = self.scenarios()
+        started_at = datetime.now()
+        endpoints = {}
+        for name in names:
+            endpoints[name] = self.run_endpoint(name, scenarios[name])
+            if progress:
+                progress(name, endpoints[name])
+        return {
+            'meta': self.meta(started_at),
+            'endpoints': endpoints,
+            'peak_rss_mb': None if self.base_url else peak_rss_mb(),
+        }
+
+    def run_endpoint(self, name: str, build: Callable[[random.Random], str]) -> Dict:
+        if self.warmup:
+            self._load(name, build, self.warmup, phase='warmup')
+        started = time.perf_counter()
+        results = self._load(name, build, self.requests, phase='run')
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(result[1] * 1000 for result in results)
+        statuses = {}
+        for status_code, _, _ in results:
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+        queries = sorted(result[2] for result in results if result[2] is not None)
+        return {
+            'requests': len(results),
+            'errors': sum(1 for status_code, _, _ in results if status_code == 0 or status_code >= 500),
+            'status': statuses,
+            'seconds': round(elapsed, 3),
+            'throughput_rps': round(len(results) / elapsed, 2) if elapsed else 0.0,
+            'mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'max_ms': round(latencies[-1], 2) if latencies else 0.0,
+            'queries_mean': round(sum(queries) / len(queries), 2) if queries else None,
+            'queries_max': queries[-1] if queries else None,
+            'peak_rss_mb': None if self.base_url else peak_rss_mb(),
+        }
+
+    def _load(self, name: str, build: Callable, count: int, phase: str) -> List[Tuple[int, float, Optional[int]]]:
+        """concurrency개 스레드로 count개 요청 실행 -> [(status, 초, 쿼리 수)]"""
+        urls = [build(random.Random(f"{self.seed}:{name}:{phase}:{index}")) for index in range(count)]
+        results = [None] * count
+        next_index = iter(range(count))
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                while True:
+                    with lock:
+                        index = next(next_index, None)
+                    if index is None:
+                        return
+                    results[index] = self._request(urls[index])
+            finally:
+                if not self.base_url:
+                    connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(min(self.concurrency, count))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _request(self, path: str) -> Tuple[int, float, Optional[int]]:
+        if self.base_url:
+            return self._http_request(path)
+
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = Client(raise_request_exception=False, HTTP_HOST=self.host)
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_query):
+                response = client.get(path)
+                if response.streaming:
+                    # 스트리밍 응답은 마지막 이벤트까지 받아야 끝난 것
+                    for _ in response.streaming_content:
+                        pass
+            status_code = response.status_code
+        except Exception as e:
+            print(f"벤치마크 요청 오류 ({path}): {e}")
+            status_code = 0
+        return status_code, time.perf_counter() - started, queries
+
+    def _http_request(self, path: str) -> Tuple[int, float, Optional[int]]:
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as response:
+                while response.read(65536):
+                    pass
+                status_code = response.status
+        except urllib.error.HTTPError as e:
+            status_code = e.code
+        except Exception as e:
+            print(f"벤치마크 요청 오류 ({path}): {e}")
+            status_code = 0
+        return status_code, time.perf_counter() - started, None
+
+    def meta(self, started_at: datetime) -> Dict:
+        return {
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'git_commit': self._git_commit(),
+            'mode': 'http' if self.base_url else 'in-process',
+            'base_url': self.base_url,
+            'database': connection.vendor,
+            'news_count': News.objects.count(),
+            'keyword_count': Keyword.objects.count(),
+            'llm_backend': getattr(settings, 'LLM_BACKEND', 'openai'),
+            'debug': settings.DEBUG,
+            'concurrency': self.concurrency,
+            'requests': self.requests,
+            'warmup': self.warmup,
+            'seed': self.seed,
+            'python': platform.python_version(),
+        }
+
+    @staticmethod
+    def _git_commit() -> Optional[str]:
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, timeout=5
+            ).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    @staticmethod
+    def compare(baseline: Dict, current: Dict, threshold: float = 0.1) -> List[Dict]:
+        """두 결과의 엔드포인트별 지표 변화율 (threshold보다 나빠지면 regression)"""
+        rows = []
+        for name, stats in current['endpoints'].items():
+            base = baseline.get('endpoints', {}).get(name)
+            if not base:
+                continue
+            for metric, direction in COMPARE_METRICS:
+                before, after = base.get(metric), stats.get(metric)
+                if before is None or after is None:
+                    continue
+                change = (after - before) / before if before else (0.0 if after == before else math.inf)
+                rows.append({
+                    'endpoint': name,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'change': change,
+                    'regression': change * direction > threshold,
+                })
+        return rows
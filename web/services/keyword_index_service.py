@@ -0,0 +1,115 @@
+import re
+from typing import Iterable, List, Optional
+from django.conf import settings
+from django.db import transaction
+from ..models import News, Keyword
+
+# News.keyword 컬럼은 쉼표(또는 공백)로 구분된 키워드 목록
+KEYWORD_SPLIT_PATTERN = re.compile(r'[,\s]+')
+KEYWORD_MAX_LENGTH = 100
+
+
+class KeywordIndexService:
+    """News.keyword 컬럼을 Keyword 모델(posting list)로 색인하는 서비스"""
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'KEYWORD_INDEX_ENABLED', False)
+
+    @staticmethod
+    def tokenize(raw_keyword: str) -> List[str]:
+        """키워드 문자열을 중복 없는 토큰 목록으로 분리"""
+        if not raw_keyword:
+            return []
+        tokens = []
+        seen = set()
+        for token in KEYWORD_SPLIT_PATTERN.split(raw_keyword):
+            token = token.strip()[:KEYWORD_MAX_LENGTH]
+            if token and token not in seen:
+                seen.add(token)
+                tokens.append(token)
+        return tokens
+
+    @staticmethod
+    def lookup(query: str) -> Optional[List[int]]:
+        """검색어를 포함하는 색인 키워드 id 목록 (keyword__icontains와 같은 부분 일치 의미)
+
+        색인으로 답할 수 없는 경우(색인 꺼짐, 구분자가 들어간 검색어, 너무 많은 키워드와 일치)는
+        None을 반환하고 호출 측은 LIKE 검색을 사용한다.
+        """
+        if not query or not KeywordIndexService.is_enabled():
+            return None
+        # 구분자를 포함하면 여러 토큰에 걸친 일치라 색인 토큰으로는 찾을 수 없음
+        if KEYWORD_SPLIT_PATTERN.search(query) or len(query) > KEYWORD_MAX_LENGTH:
+            return None
+        max_matches = getattr(settings, 'KEYWORD_INDEX_MAX_MATCHES', 500)
+        keyword_ids = list(
+            Keyword.objects.filter(name__icontains=query).values_list('id', flat=True)[:max_matches + 1]
+        )
+        if len(keyword_ids) > max_matches:
+            return None
+        return keyword_ids
+
+    @staticmethod
+    def exact_id(query: str) -> Optional[int]:
+        """검색어와 이름이 정확히 같은 색인 키워드 id (색인이 꺼져 있거나 없으면 None)"""
+        if not query or not KeywordIndexService.is_enabled():
+            return None
+        return Keyword.objects.filter(name=query[:KEYWORD_MAX_LENGTH]).values_list('id', flat=True).first()
+
+    @staticmethod
+    def filter_news(keyword_ids: List[int]):
+        """키워드 id 목록 중 하나라도 가진 뉴스 (posting 조인 중복 없이)"""
+        news_ids = Keyword.news.through.objects.filter(keyword_id__in=keyword_ids).values('news_id')
+        return News.objects.filter(id__in=news_ids)
+
+    def index_news(self, news: News) -> None:
+        """뉴스 한 건의 색인을 현재 keyword 값과 동기화"""
+        through = Keyword.news.through
+        with transaction.atomic():
+            through.objects.filter(news_id=news.id).delete()
+            self.index_batch([news])
+
+    def index_batch(self, news_list: Iterable[News]) -> int:
+        """뉴스 묶음을 색인하고 생성된 posting 수를 반환"""
+        tokens_by_news = {
+            news.id: self.tokenize(news.keyword)
+            for news in news_list
+        }
+        names = {token for tokens in tokens_by_news.values() for token in tokens}
+        if not names:
+            return 0
+
+        keyword_ids = self._get_or_create_keywords(names)
+
+        through = Keyword.news.through
+        postings = [
+            through(keyword_id=keyword_ids[token], news_id=news_id)
+            for news_id, tokens in tokens_by_news.items()
+            for token in tokens
+        ]
+        through.objects.bulk_create(postings, batch_size=self.batch_size, ignore_conflicts=True)
+        return len(postings)
+
+    def _get_or_create_keywords(self, names: set) -> dict:
+        """키워드 이름 -> id 매핑 (없는 키워드는 생성)"""
+        names = list(names)
+        keyword_ids = {}
+        for i in range(0, len(names), self.batch_size):
+            chunk = names[i:i + self.batch_size]
+            keyword_ids.update(Keyword.objects.filter(name__in=chunk).values_list('name', 'id'))
+
+        missing = [name for name in names if name not in keyword_ids]
+        if missing:
+            Keyword.objects.bulk_create(
+                [Keyword(name=name) for name in missing],
+                batch_size=self.batch_size,
+                ignore_conflicts=True
+            )
+            for i in range(0, len(missing), self.batch_size):
+                chunk = missing[i:i + self.batch_size]
+                keyword_ids.update(Keyword.objects.filter(name__in=chunk).values_list('name', 'id'))
+        return keyword_ids
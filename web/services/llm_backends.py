@@ -0,0 +1,357 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import httpx
+import openai
+from django.conf import settings
+from django.utils.module_loading import import_string
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+JSON_FIELD_PATTERN = re.compile(r'"(\w+)"\s*:\s*"')
+KEYWORD_PATTERN = re.compile(r"'([^'\n]{1,50})'")
+
+
+def request_key(kwargs: Dict) -> str:
+    """요청 내용(모델/메시지/옵션)의 해시 - timeout처럼 응답에 영향이 없는 인자는 제외"""
+    payload = {key: value for key, value in kwargs.items() if key != 'timeout'}
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ChunkStream:
+    """(도착까지 대기 초, 텍스트) 목록을 OpenAI 스트림처럼 ChatCompletionChunk로 내보냄"""
+
+    def __init__(self, pieces: List[Tuple[float, str]], model: str):
+        self.pieces = pieces
+        self.model = model
+        self.closed = False
+
+    def __iter__(self) -> Iterator[ChatCompletionChunk]:
+        for delay, text in self.pieces:
+            if self.closed:
+                return
+            if delay > 0:
+                time.sleep(delay)
+            yield ChatCompletionChunk.model_validate({
+                'id': 'chatcmpl-local',
+                'object': 'chat.completion.chunk',
+                'created': 0,
+                'model': self.model,
+                'choices': [{'index': 0, 'delta': {'content': text}, 'finish_reason': None}]
+            })
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class LLMBackend(ABC):
+    """LLMClient가 호출하는 백엔드 - chat.completions.create와 같은 인자를 받음"""
+
+    @abstractmethod
+    def create(self, **kwargs) -> ChatCompletion:
+        ...
+
+    @abstractmethod
+    def stream(self, **kwargs) -> Any:
+        """stream=True 호출 - ChatCompletionChunk를 내보내고 close()가 있는 이터러블 반환"""
+
+    @abstractmethod
+    async def acreate(self, **kwargs) -> ChatCompletion:
+        ...
+
+
+class OpenAIBackend(LLMBackend):
+    """실제 OpenAI API (동기 클라이언트 하나 + 이벤트 루프별 비동기 클라이언트, keep-alive 커넥션 풀)"""
+
+    def __init__(self):
+        self.timeout = getattr(settings, 'LLM_TIMEOUT_SECONDS', 30)
+        self.limits = httpx.Limits(
+            max_connections=getattr(settings, 'LLM_MAX_CONNECTIONS', 100),
+            max_keepalive_connections=getattr(settings, 'LLM_MAX_KEEPALIVE_CONNECTIONS', 20)
+        )
+        self._client = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> OpenAI:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = OpenAI(
+                        timeout=self.timeout,
+                        max_retries=0,  # 재시도는 LLMClient가 버킷을 다시 거치도록 직접 처리
+                        http_client=DefaultHttpxClient(limits=self.limits)
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """현재 이벤트 루프의 공유 클라이언트 (WSGI에서 요청마다 루프가 바뀌어도 안전)"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncOpenAI(
+                timeout=self.timeout,
+                max_retries=0,
+                http_client=DefaultAsyncHttpxClient(limits=self.limits)
+            )
+        return client
+
+    def create(self, **kwargs) -> ChatCompletion:
+        return self.client.chat.completions.create(**kwargs)
+
+    def stream(self, **kwargs) -> Any:
+        return self.client.chat.completions.create(stream=True, **kwargs)
+
+    async def acreate(self, **kwargs) -> ChatCompletion:
+        return await self.async_client.chat.completions.create(**kwargs)
+
+
+class FakeBackend(LLMBackend):
+    """API 없이 부하 테스트/프로파일링을 하기 위한 결정적 가짜 백엔드 (LLM_FAKE 설정)
+
+    같은 요청에는 항상 같은 응답과 같은 지연이 나온다 (seed + 요청 해시로 난수 생성).
+    지연 = 첫 토큰까지 시간(latency 분포) + 응답 토큰 수 / 초당 토큰 수(throughput 분포).
+    JSON 모드면 프롬프트의 JSON 예시에 있는 필드를 채우고, 호버 요약 형식 요청에는 그 형식으로 답한다.
+    """
+
+    def __init__(self, options: Optional[Dict] = None):
+        options = {**getattr(settings, 'LLM_FAKE', {}), **(options or {})}
+        self.seed = options.get('seed', 0)
+        self.latency = options.get('latency', 'lognormal')  # fixed | uniform | lognormal
+        self.median_seconds = options.get('median_seconds', 0.8)
+        self.min_seconds = options.get('min_seconds', 0.2)
+        self.max_seconds = options.get('max_seconds', 2.0)
+        self.sigma = options.get('sigma', 0.5)
+        self.tokens_per_second = options.get('tokens_per_second', 80)
+        self.throughput_sigma = options.get('throughput_sigma', 0.2)
+        self.completion_tokens = options.get('completion_tokens', 120)
+        self.error_rate = options.get('error_rate', 0.0)
+        # 오류는 요청이 아니라 호출 순서로 정해야 재시도가 같은 결과를 반복하지 않음
+        self._error_rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def plan(self, kwargs: Dict) -> Tuple[random.Random, float, float]:
+        """요청별 난수 생성기, 첫 토큰까지 시간, 생성 시간"""
+        rng = random.Random(f"{self.seed}:{request_key({**kwargs, 'stream': False})}")
+        if self.latency == 'fixed':
+            first_token = self.median_seconds
+        elif self.latency == 'uniform':
+            first_token = rng.uniform(self.min_seconds, self.max_seconds)
+        else:
+            first_token = rng.lognormvariate(math.log(self.median_seconds), self.sigma)
+        throughput = self.tokens_per_second * rng.lognormvariate(0, self.throughput_sigma) \
+            if self.tokens_per_second else 0
+        generation = self.completion_tokens / throughput if throughput else 0.0
+        return rng, first_token, generation
+
+    def content(self, rng: random.Random, kwargs: Dict) -> str:
+        messages = kwargs.get('messages', [])
+        prompt = '\n'.join(message['content'] for message in messages)
+        keyword = KEYWORD_PATTERN.search(prompt)
+        subject = keyword.group(1) if keyword else '이슈'
+        tag = f"{rng.randrange(16 ** 6):06x}"
+
+        if (kwargs.get('response_format') or {}).get('type') == 'json_object':
+            fields = list(dict.fromkeys(JSON_FIELD_PATTERN.findall(messages[-1]['content'] if messages else '')))
+            return json.dumps({
+                field: f"{subject} 관련 {field} 요약 {tag} - 부하 테스트용 가짜 응답입니다."
+                for field in fields or ['summary']
+            }, ensure_ascii=False)
+        if '제목 요약' in prompt:
+            return f"- 제목 요약: {subject} 동향 {tag}\n- 내용 요약: {subject} 관련 주요 뉴스 요약 (가짜 응답)"
+        return f"{subject} 관련 가짜 응답 {tag}"
+
+    def _next_error_draw(self) -> float:
+        with self._lock:
+            return self._error_rng.random()
+
+    def _maybe_fail(self, elapsed: float = 0.0, timeout: Optional[float] = None) -> None:
+        """설정한 비율로 5xx 오류, 지연이 시도별 타임아웃을 넘으면 타임아웃 오류 (LLMClient 재시도 경로 확인용)"""
+        if timeout and elapsed > timeout:
+            raise openai.APITimeoutError(request=httpx.Request('POST', 'http://fake-llm/v1/chat/completions'))
+        if self.error_rate and self._next_error_draw() < self.error_rate:
+            raise openai.InternalServerError(
+                'fake backend error',
+                response=httpx.Response(500, request=httpx.Request('POST', 'http://fake-llm/v1/chat/completions')),
+                body=None
+            )
+
+    def _completion(self, kwargs: Dict, content: str) -> ChatCompletion:
+        prompt_tokens = sum(len(message['content']) for message in kwargs.get('messages', [])) // 2
+        return ChatCompletion.model_validate({
+            'id': 'chatcmpl-fake',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': kwargs.get('model', 'fake'),
+            'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': content}}],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'total_tokens': prompt_tokens + self.completion_tokens
+            }
+        })
+
+    def create(self, **kwargs) -> ChatCompletion:
+        rng, first_token, generation = self.plan(kwargs)
+        elapsed = first_token + generation
+        timeout = kwargs.get('timeout')
+        time.sleep(min(elapsed, timeout) if timeout else elapsed)
+        self._maybe_fail(elapsed, timeout)
+        return self._completion(kwargs, self.content(rng, kwargs))
+
+    async def acreate(self, **kwargs) -> ChatCompletion:
+        rng, first_token, generation = self.plan(kwargs)
+        elapsed = first_token + generation
+        timeout = kwargs.get('timeout')
+        await asyncio.sleep(min(elapsed, timeout) if timeout else elapsed)
+        self._maybe_fail(elapsed, timeout)
+        return self._completion(kwargs, self.content(rng, kwargs))
+
+    def stream(self, **kwargs) -> ChunkStream:
+        rng, first_token, generation = self.plan(kwargs)
+        self._maybe_fail()
+        text = self.content(rng, kwargs)
+        pieces = [text[i:i + 4] for i in range(0, len(text), 4)] or ['']
+        interval = generation / len(pieces)
+        return ChunkStream(
+            [(first_token if index == 0 else interval, piece) for index, piece in enumerate(pieces)],
+            kwargs.get('model', 'fake')
+        )
+
+
+class RecordingNotFound(Exception):
+    """replay 모드에서 녹화되지 않은 요청"""
+
+
+class RecordReplayBackend(LLMBackend):
+    """실제 응답을 요청 해시별 JSON 파일로 저장(record)하고 그대로 재생(replay)하는 백엔드
+
+    mode: record(항상 호출 후 저장) | replay(저장된 응답만, 없으면 RecordingNotFound) | auto(있으면 재생, 없으면 녹화)
+    replay_latency가 켜져 있으면 녹화 당시의 응답 시간(스트리밍은 조각별 도착 간격)까지 재현한다.
+    """
+
+    def __init__(self, inner: LLMBackend, directory: str, mode: str = 'auto', replay_latency: bool = True):
+        self.inner = inner
+        self.directory = str(directory)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, kwargs: Dict, stream: bool) -> str:
+        return os.path.join(self.directory, f"{request_key({**kwargs, 'stream': stream})}.json")
+
+    def _load(self, path: str) -> Optional[Dict]:
+        if self.mode == 'record' or not os.path.exists(path):
+            if self.mode == 'replay':
+                raise RecordingNotFound(f'녹화된 응답이 없습니다: {os.path.basename(path)}')
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save(self, path: str, kwargs: Dict, record: Dict) -> None:
+        record['request'] = {key: value for key, value in kwargs.items() if key != 'timeout'}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)  # 동시에 같은 요청을 녹화해도 파일이 깨지지 않도록
+
+    def create(self, **kwargs) -> ChatCompletion:
+        path = self._path(kwargs, stream=False)
+        record = self._load(path)
+        if record is not None:
+            if self.replay_latency:
+                time.sleep(record['elapsed'])
+            return ChatCompletion.model_validate(record['response'])
+
+        started = time.monotonic()
+        response = self.inner.create(**kwargs)
+        self._save(path, kwargs, {
+            'elapsed': time.monotonic() - started,
+            'response': response.model_dump(mode='json')
+        })
+        return response
+
+    async def acreate(self, **kwargs) -> ChatCompletion:
+        path = self._path(kwargs, stream=False)
+        record = self._load(path)
+        if record is not None:
+            if self.replay_latency:
+                await asyncio.sleep(record['elapsed'])
+            return ChatCompletion.model_validate(record['response'])
+
+        started = time.monotonic()
+        response = await self.inner.acreate(**kwargs)
+        self._save(path, kwargs, {
+            'elapsed': time.monotonic() - started,
+            'response': response.model_dump(mode='json')
+        })
+        return response
+
+    def stream(self, **kwargs) -> Any:
+        path = self._path(kwargs, stream=True)
+        record = self._load(path)
+        if record is not None:
+            pieces = [(delay if self.replay_latency else 0.0, text) for delay, text in record['chunks']]
+            return ChunkStream(pieces, kwargs.get('model', 'replay'))
+        return RecordingStream(self, path, kwargs, self.inner.stream(**kwargs))
+
+
+class RecordingStream:
+    """원래 스트림을 그대로 내보내면서 조각별 도착 간격을 기록하고, 끝까지 받으면 저장"""
+
+    def __init__(self, backend: RecordReplayBackend, path: str, kwargs: Dict, stream: Any):
+        self.backend = backend
+        self.path = path
+        self.kwargs = kwargs
+        self.stream = stream
+
+    def __iter__(self) -> Iterator[Any]:
+        chunks = []
+        last = time.monotonic()
+        for chunk in self.stream:
+            now = time.monotonic()
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                chunks.append((now - last, text))
+                last = now
+            yield chunk
+        self.backend._save(self.path, self.kwargs, {'chunks': chunks})
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+BACKENDS = {
+    'openai': OpenAIBackend,
+    'fake': FakeBackend,
+}
+
+
+def build_backend() -> LLMBackend:
+    """LLM_BACKEND(openai | fake | 클래스 경로)로 백엔드를 만들고 LLM_RECORD_MODE가 있으면 녹화/재생으로 감쌈"""
+    name = getattr(settings, 'LLM_BACKEND', 'openai') or 'openai'
+    backend_class = BACKENDS.get(name) or import_string(name)
+    backend = backend_class()
+
+    record_mode = getattr(settings, 'LLM_RECORD_MODE', '')
+    if record_mode:
+        backend = RecordReplayBackend(
+            backend,
+            getattr(settings, 'LLM_RECORD_DIR', 'llm_recordings'),
+            mode=record_mode,
+            replay_latency=getattr(settings, 'LLM_REPLAY_LATENCY', True)
+        )
+    return backend
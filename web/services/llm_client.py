@@ -0,0 +1,251 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Dict, List, Optional
+import openai
+from django.conf import settings
+from .llm_backends import LLMBackend, build_backend
+from .metrics import llm_errors, llm_request_duration, llm_retries, llm_tokens
+from .prompt_packer import PromptPacker
+from .rate_limiter import TokenBucket
+
+
+class LLMClient:
+    """프로세스 공용 LLM 호출기 (LLMService, DailyIssueService, 비동기 뷰가 공유)
+
+    - 실제 호출은 LLM_BACKEND로 고른 백엔드(llm_backends - OpenAI 커넥션 풀, 가짜, 녹화/재생)가 담당
+    - 호출마다 전체 기한(LLM_DEADLINE_SECONDS) 안에서 시도별 타임아웃 적용
+    - 분당 요청 수/토큰 수 토큰 버킷 - 토큰은 호출당 한 번 추정치로 먼저 차감하고 응답의 usage로 보정
+      (재시도는 요청 수만 다시 차감)
+    - 429/5xx/타임아웃/연결 오류는 지수 백오프(jitter, Retry-After 우선)로 재시도
+    - LLM_HEDGE_AFTER_SECONDS가 지나도 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+      (버킷에 여유가 있을 때만, 스트리밍 호출은 제외)
+    """
+
+    def __init__(self, backend: Optional[LLMBackend] = None):
+        self.backend = backend or build_backend()
+        self.timeout = getattr(settings, 'LLM_TIMEOUT_SECONDS', 30)
+        self.deadline = getattr(settings, 'LLM_DEADLINE_SECONDS', 60)
+        self.max_retries = getattr(settings, 'LLM_MAX_RETRIES', 3)
+        self.backoff_base = getattr(settings, 'LLM_BACKOFF_BASE_SECONDS', 0.5)
+        self.backoff_max = getattr(settings, 'LLM_BACKOFF_MAX_SECONDS', 8)
+        self.hedge_after = getattr(settings, 'LLM_HEDGE_AFTER_SECONDS', None)
+        self.completion_tokens = getattr(settings, 'LLM_DEFAULT_COMPLETION_TOKENS', 300)
+        self.requests = TokenBucket(getattr(settings, 'LLM_REQUESTS_PER_MINUTE', 500))
+        self.tokens = TokenBucket(getattr(settings, 'LLM_TOKENS_PER_MINUTE', 200000))
+        self._packer = PromptPacker(token_budget=1)
+        self._hedge_executor = None
+        self._lock = threading.Lock()
+
+    def estimate_tokens(self, messages: List[Dict], max_tokens: Optional[int] = None) -> int:
+        prompt_tokens = sum(self._packer.estimate_tokens(message['content']) + 4 for message in messages)
+        return prompt_tokens + (max_tokens or self.completion_tokens)
+
+    def chat(self, **kwargs) -> Any:
+        """chat.completions.create와 같은 인자로 호출 (제한/재시도/hedge 적용)"""
+        estimated = self.estimate_tokens(kwargs['messages'], kwargs.get('max_tokens'))
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        wait = self._reserve(estimated)
+        while True:
+            time.sleep(wait)
+            started = time.perf_counter()
+            try:
+                response = self._call(
+                    lambda timeout: self.backend.create(timeout=timeout, **kwargs),
+                    estimated, deadline
+                )
+                self._settle(response, estimated, kwargs['model'], 'create', started)
+                return response
+            except Exception as e:
+                self._record_error(e, kwargs['model'], 'create', started)
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+                print(f"LLM 호출 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                llm_retries.inc(model=kwargs['model'])
+                wait = max(delay, self._reserve_retry())
+                attempt += 1
+
+    def stream_chat(self, **kwargs) -> Any:
+        """stream=True 호출 - 스트림 연결까지만 재시도 (응답 도중 끊기면 호출한 쪽에서 처리)"""
+        estimated = self.estimate_tokens(kwargs['messages'], kwargs.get('max_tokens'))
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        wait = self._reserve(estimated)
+        while True:
+            time.sleep(wait)
+            started = time.perf_counter()
+            try:
+                stream = self.backend.stream(timeout=self._attempt_timeout(deadline), **kwargs)
+                llm_request_duration.observe(
+                    time.perf_counter() - started, operation='stream', model=kwargs['model'], outcome='ok'
+                )
+                return stream
+            except Exception as e:
+                self._record_error(e, kwargs['model'], 'stream', started)
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+                print(f"LLM 호출 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                llm_retries.inc(model=kwargs['model'])
+                wait = max(delay, self._reserve_retry())
+                attempt += 1
+
+    async def achat(self, **kwargs) -> Any:
+        """chat()의 비동기 버전 (대기는 asyncio.sleep, hedge에서 늦은 쪽 요청은 취소)"""
+        estimated = self.estimate_tokens(kwargs['messages'], kwargs.get('max_tokens'))
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        wait = self._reserve(estimated)
+        while True:
+            await asyncio.sleep(wait)
+            started = time.perf_counter()
+            try:
+                response = await self._acall(
+                    lambda timeout: self.backend.acreate(timeout=timeout, **kwargs),
+                    estimated, deadline
+                )
+                self._settle(response, estimated, kwargs['model'], 'acreate', started)
+                return response
+            except Exception as e:
+                self._record_error(e, kwargs['model'], 'acreate', started)
+                delay = self._retry_delay(e, attempt, deadline)
+                if delay is None:
+                    raise
+                print(f"LLM 호출 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                llm_retries.inc(model=kwargs['model'])
+                wait = max(delay, self._reserve_retry())
+                attempt += 1
+
+    def _reserve(self, estimated: int) -> float:
+        """두 버킷에서 차감하고 더 긴 대기 시간을 반환 (토큰은 논리적 호출 하나에 한 번만 차감)"""
+        return max(self.requests.reserve(1), self.tokens.reserve(estimated))
+
+    def _reserve_retry(self) -> float:
+        """재시도는 요청 수만 다시 차감 (실패한 시도는 토큰을 쓰지 않으므로 추정 토큰을 또 빼지 않음)"""
+        return self.requests.reserve(1)
+
+    def _settle(self, response: Any, estimated: int, model: str, operation: str, started: float) -> None:
+        """성공한 호출의 지연시간/토큰 기록, 토큰 버킷을 실제 usage로 보정"""
+        llm_request_duration.observe(time.perf_counter() - started, operation=operation, model=model, outcome='ok')
+        usage = getattr(response, 'usage', None)
+        if usage is not None and usage.total_tokens:
+            self.tokens.adjust(usage.total_tokens - estimated)
+            llm_tokens.inc(usage.prompt_tokens, model=model, type='prompt')
+            llm_tokens.inc(usage.completion_tokens, model=model, type='completion')
+
+    @staticmethod
+    def _record_error(error: Exception, model: str, operation: str, started: float) -> None:
+        llm_request_duration.observe(
+            time.perf_counter() - started, operation=operation, model=model, outcome='error'
+        )
+        llm_errors.inc(model=model, error=type(error).__name__)
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        return max(0.1, min(self.timeout, deadline - time.monotonic()))
+
+    def _can_hedge(self, estimated: int) -> bool:
+        """두 버킷 모두 바로 쓸 수 있을 때만 차감 (한쪽이 부족하면 먼저 차감한 토큰을 돌려줌)"""
+        if not self.tokens.try_reserve(estimated):
+            return False
+        if not self.requests.try_reserve(1):
+            self.tokens.adjust(-estimated)
+            return False
+        return True
+
+    def _call(self, create: Callable[[float], Any], estimated: int, deadline: float) -> Any:
+        timeout = self._attempt_timeout(deadline)
+        if not self.hedge_after:
+            return create(timeout)
+
+        executor = self._get_hedge_executor()
+        primary = executor.submit(create, timeout)
+        done, _ = wait([primary], timeout=self.hedge_after)
+        if done or not self._can_hedge(estimated):
+            return primary.result()
+
+        # 동기 호출은 취소할 수 없으므로 늦은 쪽 응답은 버려짐
+        backup = executor.submit(create, self._attempt_timeout(deadline))
+        first_error = None
+        for future in as_completed([primary, backup]):
+            try:
+                return future.result()
+            except Exception as e:
+                first_error = first_error or e
+        raise first_error
+
+    async def _acall(self, create: Callable[[float], Any], estimated: int, deadline: float) -> Any:
+        timeout = self._attempt_timeout(deadline)
+        if not self.hedge_after:
+            return await create(timeout)
+
+        primary = asyncio.ensure_future(create(timeout))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_after)
+        if done or not self._can_hedge(estimated):
+            return await primary
+
+        pending = {primary, asyncio.ensure_future(create(self._attempt_timeout(deadline)))}
+        first_error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            with self._lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=getattr(settings, 'LLM_HEDGE_WORKERS', 64),
+                        thread_name_prefix='llm-hedge'
+                    )
+        return self._hedge_executor
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: float) -> Optional[float]:
+        """재시도할 오류면 대기 시간(남은 기한을 넘지 않게), 아니면(또는 횟수 초과/기한 소진) None"""
+        if attempt >= self.max_retries or not self.is_retryable(error):
+            return None
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(self.backoff_max, float(retry_after)))
+            except ValueError:
+                pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(delay, remaining)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, openai.APIConnectionError):  # APITimeoutError 포함
+            return True
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code == 429 or error.status_code >= 500
+        return False
+
+
+_llm_client = None
+_llm_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """프로세스 공용 LLMClient"""
+    global _llm_client
+    if _llm_client is None:
+        with _llm_client_lock:
+            if _llm_client is None:
+                _llm_client = LLMClient()
+    return _llm_client
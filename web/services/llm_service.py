@@ -1,38 +1,77 @@
-from typing import List, Dict
-from openai import OpenAI
+from typing import Dict, Iterator, List, Optional
 import json
+from django.conf import settings
+from .llm_client import get_llm_client
+from .prompt_packer import PromptPacker
 
 class LLMService:
     def __init__(self):
-        self.client = OpenAI()
+        self.client = get_llm_client()
+        self.model = getattr(settings, 'LLM_MODEL', 'gpt-4o-mini')
         
+    def stream_completion(self, messages: List[Dict], temperature: float) -> Iterator[str]:
+        """JSON 모드 스트리밍 호출 - 응답 텍스트 조각을 도착하는 대로 반환 (오류는 호출한 쪽에서 처리)"""
+        stream = self.client.stream_chat(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=temperature
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 응답을 받지 않고 HTTP 연결을 닫음
+            stream.close()
+
     def generate_structured_summary(self, news_list: List[Dict], search_keyword: str, is_overall: bool = True) -> Dict:
         try:
-            # 뉴스 데이터 제한
-            news_data = []
-            total_length = 0
-            max_content_length = 500  # 각 뉴스 내용 최대 길이
-            max_total_length = 60000  # 전체 텍스트 최대 길이
-
-            for news in news_list:
-                content = news['content'][:max_content_length]
-                news_text = f"제목: {news['title']}\n내용: {content}"
-                if total_length + len(news_text) > max_total_length:
-                    break
-                news_data.append(news_text)
-                total_length += len(news_text)
-
-            # 뉴스 텍스트 준비
-            news_text = "\n\n".join(news_data)
+            # API 호출
+            response = self.client.chat(
+                model=self.model,
+                messages=self._structured_summary_messages(news_list, search_keyword),
+                response_format={"type": "json_object"},
+                temperature=0.5
+            )
 
-            system_prompt = f"""
+            result = json.loads(response.choices[0].message.content)
+            return result
+
+        except Exception as e:
+            print(f"Error in generate_structured_summary: {e}")
+            return {
+                "background": "요약 생성 중 오류가 발생했습니다.",
+                "core_content": "요약 생성 중 오류가 발생했습니다.",
+                "conclusion": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
+            }
+
+    def stream_structured_summary(self, news_list: List[Dict], search_keyword: str,
+                                  is_overall: bool = True) -> Iterator[str]:
+        """generate_structured_summary의 스트리밍 버전 - JSON 응답 텍스트를 도착하는 대로 반환"""
+        return self.stream_completion(self._structured_summary_messages(news_list, search_keyword), temperature=0.5)
+
+    @staticmethod
+    def _structured_summary_messages(news_list: List[Dict], search_keyword: str) -> List[Dict]:
+        # 뉴스 데이터 제한 - 중복 기사 제거 후 토큰 예산 안에서 정보량이 큰 기사부터 선택
+        max_content_length = 500  # 각 뉴스 내용 최대 길이
+        news_data = PromptPacker().pack(
+            news_list,
+            lambda news: f"제목: {news['title']}\n내용: {news['content'][:max_content_length]}"
+        )
+
+        # 뉴스 텍스트 준비
+        news_text = "\n\n".join(news_data)
+
+        system_prompt = f"""
     당신은 뉴스 분석 전문가입니다.
     현재 '{search_keyword}'와 관련된 뉴스들을 분석하게 됩니다.
     이 키워드를 중심으로 관련 뉴스들의 맥락을 파악하고 구조화된 요약을 제공해주세요.
     반드시 JSON 형식으로 응답해주세요.
     """
 
-            user_prompt = f"""
+        user_prompt = f"""
     '{search_keyword}' 키워드로 검색된 다음 뉴스들을 분석하여 JSON 형식으로 3단계 요약을 생성해주세요.
     요약은 전체 흐름을 간결히 전달할 수 있도록 해주시고 아래 형식으로 응답해주세요.
     각 형식에는 50~80자 내외로 작성해주세요.
@@ -46,13 +85,17 @@ class LLMService:
     분석할 뉴스:
     {news_text}
     """
-            # API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def reduce_summaries(self, child_summaries: List[Dict], search_keyword: str, is_overall: bool = True) -> Dict:
+        """하위 기간(일/월)별 3단 요약들을 하나의 상위 기간 3단 요약으로 합칩니다."""
+        try:
+            response = self.client.chat(
+                model=self.model,
+                messages=self._reduce_summaries_messages(child_summaries, search_keyword, is_overall),
                 response_format={"type": "json_object"},
                 temperature=0.5
             )
@@ -61,24 +104,141 @@ class LLMService:
             return result
 
         except Exception as e:
-            print(f"Error in generate_structured_summary: {e}")
+            print(f"Error in reduce_summaries: {e}")
             return {
                 "background": "요약 생성 중 오류가 발생했습니다.",
                 "core_content": "요약 생성 중 오류가 발생했습니다.",
-                "conclusion": "요약 생성 중 오류가 발생했습니다."
+                "conclusion": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
             }
 
+    def stream_reduce_summaries(self, child_summaries: List[Dict], search_keyword: str,
+                                is_overall: bool = True) -> Iterator[str]:
+        """reduce_summaries의 스트리밍 버전"""
+        return self.stream_completion(
+            self._reduce_summaries_messages(child_summaries, search_keyword, is_overall), temperature=0.5
+        )
+
+    @staticmethod
+    def _reduce_summaries_messages(child_summaries: List[Dict], search_keyword: str, is_overall: bool) -> List[Dict]:
+        children_text = "\n\n".join(
+            f"[{child['period']}]\n" + "\n".join(
+                f"{label}: {child[field]}"
+                for label, field in (('배경', 'background'), ('핵심', 'core_content'), ('결론', 'conclusion'))
+                if child[field]
+            )
+            for child in child_summaries
+        )
+        period_text = '전체 기간' if is_overall else '해당 기간'
+
+        system_prompt = f"""
+    당신은 뉴스 분석 전문가입니다.
+    '{search_keyword}' 관련 뉴스의 기간별 요약들을 종합해 {period_text}의 흐름을 보여주는 요약을 만듭니다.
+    반드시 JSON 형식으로 응답해주세요.
+    """
+
+        user_prompt = f"""
+    다음은 '{search_keyword}' 관련 뉴스의 기간별 요약입니다 (날짜순).
+    기간별 요약을 종합해 {period_text}의 전체 흐름이 드러나도록 3단계 요약을 생성해주세요.
+    각 형식에는 50~80자 내외로 작성해주세요.
+
+    {{
+        "background": "배경 설명",
+        "core_content": "핵심 내용",
+        "conclusion": "결론"
+    }}
+
+    기간별 요약:
+    {children_text}
+    """
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def refresh_structured_summary(self, previous: Dict, news_list: List[Dict], search_keyword: str) -> Optional[Dict]:
+        """기존 3단 요약 + 이후 추가된 뉴스만으로 요약을 갱신 (실패 시 None - 기존 요약 유지)"""
+        try:
+            news_text = "\n\n".join(PromptPacker().pack(
+                news_list,
+                lambda news: f"제목: {news['title']}\n내용: {news['content'][:500]}"
+            ))
+
+            system_prompt = f"""
+    당신은 뉴스 분석 전문가입니다.
+    '{search_keyword}' 관련 뉴스의 기존 요약에 새로 보도된 뉴스 내용을 반영해 요약을 갱신합니다.
+    반드시 JSON 형식으로 응답해주세요.
+    """
+
+            user_prompt = f"""
+    기존 요약:
+    {json.dumps(previous, ensure_ascii=False)}
+
+    기존 요약 이후 추가된 뉴스:
+    {news_text}
+
+    기존 요약의 흐름을 유지하되 새 뉴스로 달라진 내용을 반영해 같은 형식으로 다시 작성해주세요.
+    각 항목은 50~80자 내외로 작성해주세요.
+
+    {{
+        "background": "배경 설명",
+        "core_content": "핵심 내용",
+        "conclusion": "결론"
+    }}
+    """
+            response = self.client.chat(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.5
+            )
+
+            result = json.loads(response.choices[0].message.content)
+            if not all(result.get(field) for field in ('background', 'core_content', 'conclusion')):
+                return None
+            return result
+
+        except Exception as e:
+            print(f"Error in refresh_structured_summary: {e}")
+            return None
+
     def generate_quick_summary(self, news_list: List[Dict], search_keyword: str) -> Dict:
         """뉴스 데이터를 받아 한 문장으로 된 요약을 생성합니다."""
         try:
-            news_text = "\n\n".join([
-                f"날짜: {news['date']}\n"
-                f"제목: {news['title']}\n"
-                f"내용: {news['content']}"
-                for news in news_list
-            ])
+            response = self.client.chat(
+                model=self.model,
+                messages=self._quick_summary_messages(news_list, search_keyword),
+                response_format={"type": "json_object"},
+                temperature=0.3
+            )
 
-            system_prompt = f"""
+            result = json.loads(response.choices[0].message.content)
+            return result
+
+        except Exception as e:
+            print(f"Error in generate_quick_summary: {e}")
+            return {
+                "summary": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
+            }
+
+    def stream_quick_summary(self, news_list: List[Dict], search_keyword: str) -> Iterator[str]:
+        """generate_quick_summary의 스트리밍 버전"""
+        return self.stream_completion(self._quick_summary_messages(news_list, search_keyword), temperature=0.3)
+
+    @staticmethod
+    def _quick_summary_messages(news_list: List[Dict], search_keyword: str) -> List[Dict]:
+        news_text = "\n\n".join([
+            f"날짜: {news['date']}\n"
+            f"제목: {news['title']}\n"
+            f"내용: {news['content']}"
+            for news in news_list
+        ])
+
+        system_prompt = f"""
 당신은 뉴스 분석 전문가입니다.
 '{search_keyword}' 관련 뉴스들을 분석하여 이 이슈의 본질을 한 문장으로 설명해주세요.
 
@@ -88,7 +248,7 @@ class LLMService:
 3. 설명은 30자 내외로 간단명료하게 작성해주세요
 """
 
-            user_prompt = f"""
+        user_prompt = f"""
 다음은 '{search_keyword}' 관련 주요 시점의 뉴스들입니다:
 
 {news_text}
@@ -97,10 +257,44 @@ class LLMService:
 1. 30자 내외로 작성
 2. 이슈의 본질과 맥락을 포함
 3. JSON 형식으로 응답: {{"summary": "요약문"}}
+"""
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def refresh_quick_summary(self, previous_summary: str, news_list: List[Dict],
+                              search_keyword: str) -> Optional[Dict]:
+        """기존 한 문장 요약 + 이후 추가된 뉴스만으로 요약을 갱신 (실패 시 None - 기존 요약 유지)"""
+        try:
+            news_text = "\n\n".join([
+                f"날짜: {news['date']}\n"
+                f"제목: {news['title']}\n"
+                f"내용: {news['content']}"
+                for news in news_list
+            ])
+
+            system_prompt = f"""
+당신은 뉴스 분석 전문가입니다.
+'{search_keyword}' 이슈의 기존 한 문장 요약을 최근 뉴스를 반영해 갱신해주세요.
+설명은 30자 내외로 간단명료하게 작성해주세요.
+"""
+
+            user_prompt = f"""
+기존 요약: {previous_summary}
+
+기존 요약 이후 추가된 뉴스:
+
+{news_text}
+
+요구사항:
+1. 30자 내외로 작성
+2. 최근 전개가 이슈의 본질을 바꿨다면 반영하고, 아니면 기존 요약을 유지
+3. JSON 형식으로 응답: {{"summary": "요약문"}}
 """
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
+            response = self.client.chat(
+                model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -110,10 +304,146 @@ class LLMService:
             )
 
             result = json.loads(response.choices[0].message.content)
-            return result
+            return result if result.get('summary') else None
 
+        except Exception as e:
+            print(f"Error in refresh_quick_summary: {e}")
+            return None
+
+    @staticmethod
+    def _hover_summary_messages(titles: List[str], contents: List[str], group_by: str,
+                                previous: Optional[Dict] = None) -> List[Dict]:
+        """차트 호버 요약 프롬프트 - previous({'title', 'content'})가 있으면 기존 요약에 새 뉴스만 반영"""
+        period_type = {
+            '1day': '하루',
+            '1week': '한 주',
+            '1month': '한 달'
+        }.get(group_by, '기간')
+
+        # 중복 기사를 빼고 토큰 예산 안에서 제목/내용 선택 (내용은 처음 3개만 사용하여 토큰 수 제한)
+        articles = PromptPacker(
+            token_budget=getattr(settings, 'HOVER_PROMPT_TOKEN_BUDGET', 1500)
+        ).select([
+            {'title': title, 'content': content}
+            for title, content in zip(titles, contents)
+        ])
+        titles = [article['title'] for article in articles]
+        contents = [article['content'] for article in articles]
+
+        if previous:
+            prompt = f"""다음은 {period_type} 동안의 뉴스 기존 요약입니다:
+- 제목 요약: {previous['title']}
+- 내용 요약: {previous['content']}
+
+이후 추가된 뉴스 제목들:
+{' / '.join(titles)}
+
+추가된 뉴스 내용들:
+{' / '.join(contents[:3])}
+
+추가된 뉴스를 반영해 아래 형식으로 요약을 갱신해주세요:
+- 제목 요약 (20자 이내)
+- 내용 요약 (50자 이내)"""
+        else:
+            prompt = f"""다음 {period_type} 동안의 뉴스들을 분석해주세요:
+
+제목들:
+{' / '.join(titles)}
+
+내용들:
+{' / '.join(contents[:3])}
+
+아래 형식으로 요약해주세요:
+- 제목 요약 (20자 이내)
+- 내용 요약 (50자 이내)"""
+
+        return [
+            {"role": "system", "content": "당신은 뉴스를 간단명료하게 요약하는 전문가입니다."},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _parse_hover_summary(content: str) -> Dict[str, str]:
+        summary = content.strip().split('\n')
+        return {
+            'title': summary[0].replace('- 제목 요약: ', ''),
+            'content': summary[1].replace('- 내용 요약: ', '')
+        }
+
+    def refresh_hover_summary(self, previous: Dict, titles: List[str], contents: List[str],
+                              group_by: str) -> Optional[Dict]:
+        """기존 호버 요약 + 이후 추가된 뉴스만으로 요약을 갱신 (실패 시 None - 기존 요약 유지)"""
+        try:
+            response = self.client.chat(
+                model=self.model,
+                messages=self._hover_summary_messages(titles, contents, group_by, previous),
+                temperature=0.7,
+                max_tokens=200
+            )
+            return self._parse_hover_summary(response.choices[0].message.content)
+
+        except Exception as e:
+            print(f"Error in refresh_hover_summary: {e}")
+            return None
+
+
+class AsyncLLMService:
+    """LLMService의 asyncio 버전 (ASGI 비동기 뷰용) - 응답을 기다리는 동안 스레드를 점유하지 않음
+
+    프롬프트는 LLMService와 같은 것을 쓰고, 호출은 공용 LLMClient의 비동기 클라이언트(이벤트 루프별 커넥션 풀)로 한다.
+    """
+
+    def __init__(self):
+        self.client = get_llm_client()
+        self.model = getattr(settings, 'LLM_MODEL', 'gpt-4o-mini')
+
+    async def _json_completion(self, messages: List[Dict], temperature: float) -> Dict:
+        response = await self.client.achat(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=temperature
+        )
+        return json.loads(response.choices[0].message.content)
+
+    async def generate_structured_summary(self, news_list: List[Dict], search_keyword: str,
+                                          is_overall: bool = True) -> Dict:
+        try:
+            return await self._json_completion(
+                LLMService._structured_summary_messages(news_list, search_keyword), temperature=0.5
+            )
+        except Exception as e:
+            print(f"Error in generate_structured_summary: {e}")
+            return {
+                "background": "요약 생성 중 오류가 발생했습니다.",
+                "core_content": "요약 생성 중 오류가 발생했습니다.",
+                "conclusion": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
+            }
+
+    async def reduce_summaries(self, child_summaries: List[Dict], search_keyword: str,
+                               is_overall: bool = True) -> Dict:
+        try:
+            return await self._json_completion(
+                LLMService._reduce_summaries_messages(child_summaries, search_keyword, is_overall), temperature=0.5
+            )
+        except Exception as e:
+            print(f"Error in reduce_summaries: {e}")
+            return {
+                "background": "요약 생성 중 오류가 발생했습니다.",
+                "core_content": "요약 생성 중 오류가 발생했습니다.",
+                "conclusion": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
+            }
+
+    async def generate_quick_summary(self, news_list: List[Dict], search_keyword: str) -> Dict:
+        try:
+            return await self._json_completion(
+                LLMService._quick_summary_messages(news_list, search_keyword), temperature=0.3
+            )
         except Exception as e:
             print(f"Error in generate_quick_summary: {e}")
             return {
-                "summary": "요약 생성 중 오류가 발생했습니다."
-            }
\ No newline at end of file
+                "summary": "요약 생성 중 오류가 발생했습니다.",
+                "is_error": True
+            }
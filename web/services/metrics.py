@@ -0,0 +1,309 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+LLM_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+# 현재 요청의 SQL 쿼리 수/시간 누적값 (MetricsMiddleware가 설정, sync_to_async 스레드로도 전달됨)
+request_queries = ContextVar('request_queries', default=None)
+
+
+def _label_key(labelnames: Sequence[str], labels: Dict) -> Tuple[str, ...]:
+    return tuple(str(labels.get(name, '')) for name in labelnames)
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = [
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    ]
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        self.registry.touch()
+
+
+class Histogram:
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 라벨 -> [버킷별 개수(누적 아님)..., +Inf 개수, 합계]
+        self.values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(self.labelnames, labels)
+        index = bisect_left(self.buckets, value)
+        with self.registry.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+        self.registry.touch()
+
+
+class MetricsRegistry:
+    """프로세스 내 카운터/히스토그램 + Prometheus 텍스트 형식 출력
+
+    기록은 락 한 번과 dict 갱신뿐이라 요청 경로에 부담이 거의 없다. METRICS_DIR를 지정하면
+    프로세스마다 METRICS_FLUSH_SECONDS 간격(백그라운드 스레드)으로 <pid>.json 스냅샷을 쓰고,
+    /metrics는 자기 값과 다른 워커 프로세스의 스냅샷을 합산해 보여 준다
+    (배포할 때 디렉터리를 비워야 이전 프로세스 값이 섞이지 않음).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics: List = []
+        self.collectors: List[Callable[[], Iterable[Tuple[Counter, Dict, float]]]] = []
+        self.derived: List[Tuple[str, str, Callable[[Dict], Iterable[Tuple[Dict, float]]]]] = []
+        self._flusher_started = False
+        # fork된 워커는 부모의 스냅샷 스레드를 물려받지 못하므로 다시 띄워야 함
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(self, name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(self, name, documentation, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[Counter, Dict, float]]]) -> None:
+        """스냅샷 시점에 누적값을 읽어 오는 카운터 (기록 경로에 계측을 넣지 않아도 되는 경우)"""
+        self.collectors.append(collector)
+
+    def register_derived_gauge(self, name: str, documentation: str,
+                               compute: Callable[[Dict], Iterable[Tuple[Dict, float]]]) -> None:
+        """프로세스 합산이 끝난 값으로 계산하는 게이지 (예: 캐시 적중률)"""
+        self.derived.append((name, documentation, compute))
+
+    # 프로세스 간 합산
+
+    @staticmethod
+    def metrics_dir() -> Optional[str]:
+        return getattr(settings, 'METRICS_DIR', None) or None
+
+    def touch(self) -> None:
+        """METRICS_DIR가 있으면 이 프로세스의 스냅샷 스레드를 띄움 (프로세스마다 한 번)"""
+        if self._flusher_started:
+            return
+        with self.lock:
+            if self._flusher_started:
+                return
+            self._flusher_started = True
+        if self.metrics_dir():
+            threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+            atexit.register(self.flush)
+
+    def _reset_after_fork(self) -> None:
+        self.lock = threading.Lock()
+        self._flusher_started = False
+
+    def _flush_loop(self) -> None:
+        interval = getattr(settings, 'METRICS_FLUSH_SECONDS', 5)
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception("메트릭 스냅샷 저장 오류: %s", e)
+
+    def flush(self) -> None:
+        directory = self.metrics_dir()
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(temp_path, os.path.join(directory, f'{os.getpid()}.json'))
+
+    def snapshot(self) -> Dict:
+        """{metric name: [[라벨값..., 값 또는 [버킷..., 합계]]]}"""
+        data = {}
+        with self.lock:
+            for metric in self.metrics:
+                data[metric.name] = [
+                    [*key, list(value) if isinstance(value, list) else value]
+                    for key, value in metric.values.items()
+                ]
+        for collector in self.collectors:
+            for metric, labels, value in collector():
+                data.setdefault(metric.name, []).append([*_label_key(metric.labelnames, labels), value])
+        return data
+
+    def collect(self) -> Dict:
+        """이 프로세스 값 + 다른 프로세스 스냅샷 합산 -> {name: {label key: 값}}"""
+        snapshots = [self.snapshot()]
+        directory = self.metrics_dir()
+        if directory and os.path.isdir(directory):
+            own_file = f'{os.getpid()}.json'
+            for filename in os.listdir(directory):
+                if not filename.endswith('.json') or filename == own_file:
+                    continue
+                try:
+                    with open(os.path.join(directory, filename)) as f:
+                        snapshots.append(json.load(f))
+                except (OSError, ValueError) as e:
+                    logger.warning("메트릭 스냅샷 읽기 오류 (%s): %s", filename, e)
+
+        merged = {metric.name: {} for metric in self.metrics}
+        for snapshot in snapshots:
+            for name, rows in snapshot.items():
+                values = merged.get(name)
+                if values is None:
+                    continue
+                for row in rows:
+                    key, value = tuple(row[:-1]), row[-1]
+                    if isinstance(value, list):
+                        current = values.get(key)
+                        values[key] = value if current is None else [a + b for a, b in zip(current, value)]
+                    else:
+                        values[key] = values.get(key, 0) + value
+        return merged
+
+    # 출력
+
+    def render(self) -> str:
+        merged = self.collect()
+        lines = []
+        for metric in self.metrics:
+            values = merged[metric.name]
+            kind = 'histogram' if isinstance(metric, Histogram) else 'counter'
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {kind}')
+            for key in sorted(values):
+                labels = list(zip(metric.labelnames, key))
+                value = values[key]
+                if kind == 'counter':
+                    lines.append(f'{metric.name}{_format_labels(labels)} {_format_value(value)}')
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(metric.buckets) + [float('inf')], value[:-1]):
+                    cumulative += count
+                    bucket_labels = labels + [('le', _format_value(bound))]
+                    lines.append(f'{metric.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}')
+                lines.append(f'{metric.name}_sum{_format_labels(labels)} {_format_value(value[-1])}')
+                lines.append(f'{metric.name}_count{_format_labels(labels)} {_format_value(cumulative)}')
+
+        for name, documentation, compute in self.derived:
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} gauge')
+            for labels, value in compute(merged):
+                lines.append(f'{name}{_format_labels(sorted(labels.items()))} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    'issuebeat_http_requests_total', 'HTTP 요청 수', ['view', 'method', 'status']
+)
+http_request_duration = registry.histogram(
+    'issuebeat_http_request_duration_seconds',
+    'HTTP 요청 처리 시간 (스트리밍 응답은 첫 응답 객체까지)', ['view', 'method']
+)
+db_queries_per_request = registry.histogram(
+    'issuebeat_db_queries_per_request', '요청 하나에서 실행된 SQL 쿼리 수', ['view'], buckets=QUERY_COUNT_BUCKETS
+)
+db_query_duration_per_request = registry.histogram(
+    'issuebeat_db_query_duration_per_request_seconds', '요청 하나의 SQL 실행 시간 합계', ['view']
+)
+db_queries = registry.counter('issuebeat_db_queries_total', '실행된 SQL 쿼리 수 (요청 밖 작업 포함)', ['alias'])
+db_query_duration = registry.histogram(
+    'issuebeat_db_query_duration_seconds', 'SQL 쿼리 하나의 실행 시간', ['alias']
+)
+llm_request_duration = registry.histogram(
+    'issuebeat_llm_request_duration_seconds',
+    'LLM 호출 시도 하나의 시간 (stream은 스트림 연결까지)', ['operation', 'model', 'outcome'],
+    buckets=LLM_LATENCY_BUCKETS
+)
+llm_tokens = registry.counter('issuebeat_llm_tokens_total', 'LLM 응답 usage 토큰 수', ['model', 'type'])
+llm_errors = registry.counter('issuebeat_llm_errors_total', 'LLM 호출 오류 수 (재시도한 시도 포함)', ['model', 'error'])
+llm_retries = registry.counter('issuebeat_llm_retries_total', 'LLM 호출 재시도 수', ['model'])
+summary_cache_lookups = registry.counter(
+    'issuebeat_summary_cache_lookups_total',
+    '요약 캐시 조회 결과 (local_hit/shared_hit: 캐시, db_hit: 저장된 요약, miss: 새로 생성 필요)', ['cache', 'result']
+)
+
+
+def record_query(execute, sql, params, many, context):
+    """모든 DB 연결에 설치하는 execute wrapper - 쿼리 수/시간을 전역과 현재 요청에 누적"""
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        alias = context['connection'].alias
+        db_queries.inc(alias=alias)
+        db_query_duration.observe(elapsed, alias=alias)
+        totals = request_queries.get()
+        if totals is not None:
+            totals[0] += 1
+            totals[1] += elapsed
+
+
+def _summary_cache_stats():
+    from .cache_service import daily_summary_cache, news_summary_cache, quick_summary_cache
+
+    for tier_cache in (news_summary_cache, quick_summary_cache, daily_summary_cache):
+        stats = tier_cache.get_stats()
+        for result, value in (('local_hit', stats['local_hits']), ('shared_hit', stats['shared_hits']),
+                              ('db_hit', stats['loads']), ('miss', stats['misses'] - stats['loads'])):
+            yield summary_cache_lookups, {'cache': tier_cache.namespace, 'result': result}, value
+
+
+def _summary_cache_hit_ratio(merged: Dict):
+    """캐시 또는 저장된 요약으로 응답한 비율 (LLM 생성 없이)"""
+    totals = {}
+    for (cache_name, result), value in merged[summary_cache_lookups.name].items():
+        misses, lookups = totals.get(cache_name, (0, 0))
+        totals[cache_name] = (misses + (value if result == 'miss' else 0), lookups + value)
+    for cache_name, (misses, lookups) in sorted(totals.items()):
+        if lookups:
+            yield {'cache': cache_name}, 1 - misses / lookups
+
+
+registry.register_collector(_summary_cache_stats)
+registry.register_derived_gauge(
+    'issuebeat_summary_cache_hit_ratio', 'LLM 생성 없이 응답한 요약 조회 비율 (전체 프로세스 합산)',
+    _summary_cache_hit_ratio
+)
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db.models import Q, Count
+from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from ..models import News
+from .keyword_index_service import KeywordIndexService
+from .search_engine import get_search_engine
+from .rollup_service import NewsRollupService
+from .story_cluster_service import StoryClusterService
+
+
+def get_news_filter(query, group_by='1day', start_date=None, end_date=None, selected_date=None, for_chart=False,
+                    collapse_duplicates=False):
+    """
+    뉴스 데이터를 필터링하고 집계하는 공통 함수
+    collapse_duplicates=True면 목록에서 유사 기사 클러스터별 대표 기사만 남김 (차트 건수에는 적용 안 함)
+    """
+    # 1. 날짜 파라미터 처리
+    if isinstance(start_date, str) and start_date:  # 빈 문자열 체크 추가
+        try:
+            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+        except ValueError:
+            start_date = None
+            
+    if isinstance(end_date, str) and end_date:  # 빈 문자열 체크 추가
+        try:
+            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+        except ValueError:
+            end_date = None
+            
+    if isinstance(selected_date, str) and selected_date:  # 빈 문자열 체크 추가
+        try:
+            selected_date = datetime.strptime(selected_date, '%Y-%m-%d').date()
+        except ValueError:
+            selected_date = None
+
+    # 2. 기본 날짜 범위 설정
+    if not end_date:
+        end_date = datetime.now().date()
+    if not start_date:
+        start_date = end_date - timedelta(days=365)
+
+    # 3. 선택된 날짜가 있는 경우 날짜 범위 계산
+    if selected_date:
+        if group_by == '1week':
+            start_date = selected_date - timedelta(days=selected_date.weekday())
+            end_date = start_date + timedelta(days=6)
+        elif group_by == '1month':
+            start_date = selected_date.replace(day=1)
+            if selected_date.month == 12:
+                end_date = selected_date.replace(year=selected_date.year + 1, month=1, day=1) - timedelta(days=1)
+            else:
+                end_date = selected_date.replace(month=selected_date.month + 1, day=1) - timedelta(days=1)
+        else:
+            start_date = end_date = selected_date
+
+    # 4. 기본 쿼리셋 생성 (검색어 필터링)
+    #    전문 검색 백엔드 > 키워드 역색인(검색어를 포함하는 키워드의 posting) > 기존 LIKE 검색 순
+    #    전문 검색은 날짜 범위를 엔진 안에서 먼저 거른 뒤 자르므로 목록 앞쪽(최신순)은 잘리지 않음
+    search_engine = get_search_engine() if query else None
+    fulltext_ids = None
+    if search_engine is not None and search_engine.tokenize(query):
+        if for_chart:
+            # 차트 건수는 개수 제한 없이 엔진의 문서 날짜로 바로 집계
+            daily_counts = search_engine.daily_counts(query, start_date, end_date)
+            return NewsRollupService.group_daily_counts(daily_counts.items(), group_by)
+        fulltext_ids = search_engine.recent_ids(
+            query, limit=getattr(settings, 'SEARCH_FULLTEXT_MAX_RESULTS', 5000),
+            start_date=start_date, end_date=end_date
+        )
+
+    keyword_ids = None if fulltext_ids is not None else KeywordIndexService.lookup(query)
+    if fulltext_ids is not None:
+        queryset = News.objects.filter(id__in=fulltext_ids)
+    elif keyword_ids is not None:
+        queryset = KeywordIndexService.filter_news(keyword_ids)
+    else:
+        queryset = News.objects.filter(
+            Q(keyword__icontains=query)
+        )
+
+    # 5. 날짜 필터 적용
+    queryset = queryset.filter(date__range=[start_date, end_date])
+
+    # 6. 차트 데이터를 위한 집계가 필요한 경우
+    #    일별 집계(KeywordDailyCount)를 켜면 차트는 검색어와 이름이 정확히 같은 키워드의 기사 수로 센다
+    #    (부분 일치 키워드들의 집계를 더하면 여러 키워드를 가진 기사가 중복 집계되고, 집계로는 중복을 뺄 수 없음)
+    if for_chart and fulltext_ids is None and NewsRollupService.is_enabled():
+        keyword_id = KeywordIndexService.exact_id(query)
+        if keyword_id is not None:
+            chart_data = NewsRollupService().chart_counts(keyword_id, start_date, end_date, group_by)
+            if chart_data is not None:
+                return chart_data
+
+    if for_chart:
+        trunc_map = {
+            '1day': TruncDay,
+            '1week': TruncWeek,
+            '1month': TruncMonth
+        }
+        trunc_func = trunc_map.get(group_by, TruncDay)
+        return (queryset
+                .annotate(period=trunc_func('date'))
+                .values('period')
+                .annotate(count=Count('id'))
+                .order_by('period'))
+
+    # 7. 일반 쿼리셋 반환 (최신순 정렬, 같은 날짜는 id 역순 - 커서 페이지네이션 기준)
+    if collapse_duplicates:
+        queryset = StoryClusterService.collapse(queryset)
+    return queryset.order_by('-date', '-id')
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import re
+import sys
+from datetime import date, datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+from django.db import IntegrityError, transaction
+from ..models import News
+from .keyword_index_service import KeywordIndexService
+from .rollup_service import NewsRollupService
+from .search_engine import get_loaded_search_engine
+from .story_cluster_service import StoryClusterService
+from .summary_refresh_service import SummaryRefreshService
+
+DATE_SEPARATOR_PATTERN = re.compile(r'[./]')
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class NewsIngestService:
+    """JSONL/CSV 뉴스 대량 적재 파이프라인
+
+    읽기 -> 정규화/검증 -> 배치 단위 중복 제거(link_hash) + bulk_create -> 파생 색인 갱신을
+    제너레이터로 연결해 파일 전체를 메모리에 올리지 않는다. bulk_create는 시그널을 보내지 않으므로
+    키워드 색인, 일별 집계, 유사 기사 클러스터, 요약 stale 표시는 같은 트랜잭션 안에서 직접 갱신한다.
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+        self.stats = {'read': 0, 'invalid': 0, 'duplicates': 0, 'created': 0}
+        self.errors = []
+
+    def read_rows(self, path: str, file_format: Optional[str] = None) -> Iterator[Dict]:
+        """파일(또는 '-' = 표준 입력)에서 행을 하나씩 읽음"""
+        file_format = file_format or ('csv' if path.endswith('.csv') else 'jsonl')
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig') if path == '-' else \
+            open(path, encoding='utf-8-sig', newline='')
+        try:
+            if file_format == 'csv':
+                for row in csv.DictReader(stream):
+                    self.stats['read'] += 1
+                    yield row
+            else:
+                for line_no, line in enumerate(stream, start=1):
+                    if not line.strip():
+                        continue
+                    self.stats['read'] += 1
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        self._reject(line_no, f'JSON 파싱 실패: {e}')
+        finally:
+            if path != '-':
+                stream.close()
+
+    def normalize(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """News 필드에 맞게 정리하고 필수값(date, title, link)이 없는 행은 건너뜀"""
+        for row in rows:
+            try:
+                yield self._normalize_row(row)
+            except (ValueError, TypeError, AttributeError) as e:
+                self._reject(self.stats['read'], str(e))
+
+    def _normalize_row(self, row: Dict) -> Dict:
+        keyword = row.get('keyword') or ''
+        if isinstance(keyword, (list, tuple)):
+            keyword = ','.join(str(token).strip() for token in keyword)
+
+        news = {
+            'date': self.parse_date(row.get('date')),
+            'title': str(row.get('title') or '').strip()[:100],
+            'press': str(row.get('press') or '').strip()[:20],
+            'author': str(row.get('author') or '').strip()[:20],
+            'content': str(row.get('content') or '').strip(),
+            'keyword': str(keyword).strip(),
+            'image': str(row.get('image') or '').strip(),
+            'link': str(row.get('link') or '').strip(),
+        }
+        if not news['title']:
+            raise ValueError('title 없음')
+        if not news['link']:
+            raise ValueError('link 없음')
+        news['link_hash'] = News.hash_link(news['link'])
+        return news
+
+    @staticmethod
+    def parse_date(value) -> date:
+        """'2024-03-01', '2024.03.01', '20240301', '2024-03-01T09:00:00' 형식 지원"""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        text = DATE_SEPARATOR_PATTERN.sub('-', str(value or '').strip())
+        if len(text) == 8 and text.isdigit():
+            text = f"{text[:4]}-{text[4:6]}-{text[6:]}"
+        if not text:
+            raise ValueError('date 없음')
+        return date.fromisoformat(text[:10])
+
+    def ingest(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """정규화된 행을 배치로 적재하고 배치마다 누적 통계를 반환"""
+        for batch in chunked(rows, self.batch_size):
+            self.stats['created'] += len(self.ingest_batch(batch))
+            yield self.stats
+
+    def ingest_batch(self, rows: List[Dict]) -> List[News]:
+        """한 배치를 트랜잭션 하나로 적재 - 이미 있는 link는 건너뛰므로 재실행해도 안전"""
+        unique_rows = {}
+        for row in rows:
+            unique_rows.setdefault(row['link_hash'], row)
+
+        for _ in range(3):
+            existing = set(
+                News.objects.filter(link_hash__in=list(unique_rows)).values_list('link_hash', flat=True)
+            )
+            new_news = [News(**row) for link_hash, row in unique_rows.items() if link_hash not in existing]
+            if not new_news:
+                break
+            try:
+                with transaction.atomic():
+                    News.objects.bulk_create(new_news, batch_size=self.batch_size)
+                    if any(news.id is None for news in new_news):
+                        # MySQL은 bulk_create 후 pk를 채워 주지 않으므로 link_hash로 조회
+                        ids = dict(
+                            News.objects.filter(link_hash__in=[news.link_hash for news in new_news])
+                            .values_list('link_hash', 'id')
+                        )
+                        for news in new_news:
+                            news.id = ids[news.link_hash]
+                    self.update_indexes(new_news)
+                break
+            except IntegrityError:
+                # 다른 적재 프로세스가 같은 link를 먼저 넣음 - 중복을 다시 확인하고 재시도
+                continue
+        else:
+            raise IntegrityError('link 중복 충돌이 반복되어 배치를 적재하지 못했습니다.')
+
+        self.stats['duplicates'] += len(rows) - len(new_news)
+        return new_news
+
+    @staticmethod
+    def update_indexes(news_list: List[News]) -> None:
+        """bulk_create로 건너뛴 post_save 시그널의 색인 작업을 배치 단위로 수행
+
+        DB 색인은 적재 트랜잭션 안에서 함께 롤백되지만 메모리 검색 엔진은 되돌릴 수 없으므로 커밋 후에 추가한다.
+        """
+        if not news_list:
+            return
+        if KeywordIndexService.is_enabled():
+            KeywordIndexService().index_batch(news_list)
+        if NewsRollupService.is_enabled():
+            NewsRollupService().add_news(news_list)
+        if StoryClusterService.is_enabled():
+            StoryClusterService().assign(news_list)
+        SummaryRefreshService().mark_stale(news_list)
+
+        engine = get_loaded_search_engine()
+        if engine is not None:
+            def add_documents():
+                for news in news_list:
+                    engine.add_document(news.id, news.title, news.content, news.date)
+
+            transaction.on_commit(add_documents)
+
+    def _reject(self, position: int, reason: str) -> None:
+        self.stats['invalid'] += 1
+        if len(self.errors) < 20:
+            self.errors.append(f'{position}: {reason}')
@@ -0,0 +1,108 @@
+import heapq
+import re
+from typing import Callable, Dict, List, Optional
+from django.conf import settings
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성 - 없으면 문자 종류별 추정치 사용
+    tiktoken = None
+
+HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㆎ]')
+ASCII_PATTERN = re.compile(r'[\x21-\x7e]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def default_format(article: Dict) -> str:
+    return f"제목: {article['title']}\n내용: {article['content']}"
+
+
+class PromptPacker:
+    """토큰 예산 안에 중복 없는 기사를 정보량 순으로 채워 넣는 프롬프트 구성기
+
+    1. 기사별 토큰 수 추정 (tiktoken이 있으면 사용)
+    2. MinHash(bottom-k) 유사도로 통신사 전재 기사 등 거의 같은 기사 제거
+    3. 아직 다루지 않은 문자 n-gram 비율이 높은 기사부터 lazy greedy로 선택
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, duplicate_threshold: Optional[float] = None,
+                 model: str = 'gpt-4o-mini'):
+        self.token_budget = token_budget or getattr(settings, 'SUMMARY_PROMPT_TOKEN_BUDGET', 16000)
+        self.duplicate_threshold = duplicate_threshold or getattr(settings, 'NEAR_DUPLICATE_THRESHOLD', 0.8)
+        self._encoding = self._load_encoding(model)
+
+    @staticmethod
+    def _load_encoding(model: str):
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(model)
+        except Exception:
+            return None
+
+    def estimate_tokens(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # 한글은 음절당 약 1토큰, 영문/숫자는 4자당 1토큰, 그 외 문자는 2자당 1토큰으로 추정
+        hangul = len(HANGUL_PATTERN.findall(text))
+        ascii_chars = len(ASCII_PATTERN.findall(text))
+        others = len(WHITESPACE_PATTERN.sub('', text)) - hangul - ascii_chars
+        return hangul + (ascii_chars + 3) // 4 + (others + 1) // 2 + 1
+
+    @staticmethod
+    def shingles(text: str, size: int = 3) -> set:
+        text = WHITESPACE_PATTERN.sub(' ', text.lower()).strip()
+        if len(text) <= size:
+            return {text} if text else set()
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    @staticmethod
+    def sketch(shingles: set, size: int = 64) -> set:
+        """bottom-k MinHash 스케치 (해시값이 가장 작은 size개)"""
+        return set(heapq.nsmallest(size, (hash(shingle) for shingle in shingles)))
+
+    @staticmethod
+    def similarity(sketch_a: set, sketch_b: set, size: int = 64) -> float:
+        """두 스케치로 추정한 Jaccard 유사도"""
+        union = heapq.nsmallest(size, sketch_a | sketch_b)
+        if not union:
+            return 1.0
+        return sum(1 for value in union if value in sketch_a and value in sketch_b) / len(union)
+
+    def select(self, articles: List[Dict], format_article: Callable[[Dict], str] = default_format) -> List[Dict]:
+        """예산 안에서 고른 기사들을 원래 순서대로 반환"""
+        candidates = []
+        sketches = []
+        for index, article in enumerate(articles):
+            text = format_article(article)
+            shingles = self.shingles(f"{article.get('title', '')} {article.get('content', '')}")
+            sketch = self.sketch(shingles)
+            if any(self.similarity(sketch, other) >= self.duplicate_threshold for other in sketches):
+                continue
+            sketches.append(sketch)
+            candidates.append((index, text, shingles, self.estimate_tokens(text)))
+
+        # lazy greedy: (새로 다루는 n-gram 수 / 토큰 수)가 큰 기사부터 선택
+        covered = set()
+        heap = [(-len(shingles) / tokens, index, i) for i, (index, _, shingles, tokens) in enumerate(candidates)]
+        heapq.heapify(heap)
+        selected = []
+        used_tokens = 0
+        while heap:
+            _, index, i = heapq.heappop(heap)
+            _, _, shingles, tokens = candidates[i]
+            gain = len(shingles - covered) / tokens
+            if heap and gain < -heap[0][0]:
+                heapq.heappush(heap, (-gain, index, i))  # 점수가 낮아졌으면 다시 넣고 재평가
+                continue
+            if used_tokens + tokens > self.token_budget:
+                continue
+            selected.append(index)
+            covered |= shingles
+            used_tokens += tokens
+
+        return [articles[index] for index in sorted(selected)]
+
+    def pack(self, articles: List[Dict], format_article: Callable[[Dict], str] = default_format) -> List[str]:
+        """선택한 기사를 프롬프트용 문자열 목록으로 반환"""
+        return [format_article(article) for article in self.select(articles, format_article)]
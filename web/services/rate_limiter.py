@@ -0,0 +1,72 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """초당 요청 수 제한 - 여러 스레드가 공유하며 acquire()가 다음 허용 시점까지 대기"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class TokenBucket:
+    """분당 허용량만큼 연속으로 채워지는 토큰 버킷 (요청 수/토큰 수 제한, 스레드와 이벤트 루프가 공유)
+
+    reserve()는 토큰을 먼저 차감(부족하면 음수)하고 기다릴 시간을 반환하므로 동기 코드는 time.sleep,
+    비동기 코드는 asyncio.sleep으로 기다린다. per_minute가 0 이하면 제한하지 않는다.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            # 용량보다 큰 요청도 버킷이 가득 찰 때까지만 기다리면 통과하도록
+            self._tokens -= min(amount, self.capacity)
+            return max(0.0, -self._tokens / self.rate)
+
+    def try_reserve(self, amount: float = 1) -> bool:
+        """기다리지 않고 바로 쓸 수 있을 때만 차감 (hedged request처럼 생략 가능한 요청용)"""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+
+    def adjust(self, amount: float) -> None:
+        """추정치와 실제 사용량의 차이를 반영 (양수면 추가 차감, 음수면 반환)"""
+        if self.rate <= 0 or not amount:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+    def acquire(self, amount: float = 1) -> None:
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,132 @@
+from collections import Counter, defaultdict
+from datetime import date as date_type, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from ..models import News, Keyword, KeywordDailyCount
+from .keyword_index_service import KeywordIndexService
+
+
+class NewsRollupService:
+    """KeywordDailyCount 일별 집계를 유지하고 주/월 단위 차트 데이터를 만드는 서비스"""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """집계는 키워드 색인(posting)에서 계산하므로 색인이 켜져 있어야 유지/사용 가능"""
+        return getattr(settings, 'NEWS_ROLLUP_ENABLED', False) and KeywordIndexService.is_enabled()
+
+    @staticmethod
+    def period_start(day: date_type, group_by: str) -> date_type:
+        """TruncWeek(월요일 시작)/TruncMonth와 같은 기준의 기간 시작일"""
+        if group_by == '1week':
+            return day - timedelta(days=day.weekday())
+        if group_by == '1month':
+            return day.replace(day=1)
+        return day
+
+    def collect_deltas(self, news_list: Iterable[News], sign: int = 1) -> Counter:
+        """뉴스 묶음의 현재 posting 기준으로 (keyword_id, date) 증감량 계산"""
+        dates = {news.id: news.date for news in news_list}
+        deltas = Counter()
+        if not dates:
+            return deltas
+        postings = Keyword.news.through.objects.filter(
+            news_id__in=list(dates)
+        ).values_list('news_id', 'keyword_id')
+        for news_id, keyword_id in postings:
+            deltas[(keyword_id, dates[news_id])] += sign
+        return deltas
+
+    def add_news(self, news_list: Iterable[News]) -> None:
+        """색인이 끝난 뉴스 묶음을 집계에 반영"""
+        self.apply_deltas(self.collect_deltas(news_list))
+
+    def apply_deltas(self, deltas: Dict[Tuple[int, date_type], int]) -> None:
+        """F() 증감으로 동시성 안전하게 집계 갱신 (없는 행은 0으로 먼저 생성)
+
+        (날짜, 증감량)이 같은 키워드들은 UPDATE 한 번으로 묶어 대량 적재 시 쿼리 수를 줄인다.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        KeywordDailyCount.objects.bulk_create(
+            [
+                KeywordDailyCount(keyword_id=keyword_id, date=day, count=0)
+                for (keyword_id, day), delta in deltas.items()
+                if delta > 0
+            ],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
+
+        groups = defaultdict(list)
+        for (keyword_id, day), delta in deltas.items():
+            groups[(day, delta)].append(keyword_id)
+        for (day, delta), keyword_ids in groups.items():
+            for i in range(0, len(keyword_ids), 1000):
+                KeywordDailyCount.objects.filter(
+                    date=day, keyword_id__in=keyword_ids[i:i + 1000]
+                ).update(count=F('count') + delta)
+
+    def chart_counts(self, keyword_id: int, start_date: date_type, end_date: date_type,
+                     group_by: str = '1day') -> Optional[List[Dict]]:
+        """일별 집계 행을 group_by 기간으로 합쳐 차트 형식({'period', 'count'})으로 반환
+
+        키워드의 집계 행이 하나도 없으면(아직 rebuild_news_rollup 전) None - 호출 측은 원본에서 센다.
+        """
+        daily_rows = list(KeywordDailyCount.objects
+                          .filter(keyword_id=keyword_id, date__range=[start_date, end_date], count__gt=0)
+                          .order_by('date')
+                          .values_list('date', 'count'))
+        if not daily_rows and not KeywordDailyCount.objects.filter(keyword_id=keyword_id).exists():
+            return None
+        return self.group_daily_counts(daily_rows, group_by)
+
+    @classmethod
+    def group_daily_counts(cls, daily_rows: Iterable[Tuple[date_type, int]], group_by: str = '1day') -> List[Dict]:
+        """날짜순 (date, count) 목록을 group_by 기간별 차트 형식으로 합침"""
+        buckets = {}
+        for day, count in daily_rows:
+            period = cls.period_start(day, group_by)
+            buckets[period] = buckets.get(period, 0) + count
+
+        return [{'period': period, 'count': count} for period, count in buckets.items()]
+
+    def live_counts(self, keyword_id: int, start_date: Optional[date_type] = None,
+                    end_date: Optional[date_type] = None) -> Dict[date_type, int]:
+        """News 원본 기준 일별 집계 (정합성 검사/재구축용)"""
+        queryset = News.objects.filter(keywords__id=keyword_id)
+        if start_date and end_date:
+            queryset = queryset.filter(date__range=[start_date, end_date])
+        return dict(queryset.values('date').annotate(count=Count('id')).values_list('date', 'count'))
+
+    def rollup_counts(self, keyword_id: int, start_date: Optional[date_type] = None,
+                      end_date: Optional[date_type] = None) -> Dict[date_type, int]:
+        queryset = KeywordDailyCount.objects.filter(keyword_id=keyword_id, count__gt=0)
+        if start_date and end_date:
+            queryset = queryset.filter(date__range=[start_date, end_date])
+        return dict(queryset.values_list('date', 'count'))
+
+    def rebuild(self, keyword_id: int) -> int:
+        """키워드 하나의 일별 집계를 원본 기준으로 다시 만든다"""
+        live = self.live_counts(keyword_id)
+        with transaction.atomic():
+            KeywordDailyCount.objects.filter(keyword_id=keyword_id).delete()
+            KeywordDailyCount.objects.bulk_create([
+                KeywordDailyCount(keyword_id=keyword_id, date=day, count=count)
+                for day, count in live.items()
+            ])
+        return len(live)
+
+    def diff(self, keyword_id: int, start_date: Optional[date_type] = None,
+             end_date: Optional[date_type] = None) -> Dict[date_type, Tuple[int, int]]:
+        """집계와 원본이 다른 날짜 -> (rollup, live)"""
+        live = self.live_counts(keyword_id, start_date, end_date)
+        rollup = self.rollup_counts(keyword_id, start_date, end_date)
+        return {
+            day: (rollup.get(day, 0), live.get(day, 0))
+            for day in set(live) | set(rollup)
+            if rollup.get(day, 0) != live.get(day, 0)
+        }
@@ -0,0 +1,108 @@
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from ..models import SearchHistory
+from .news_ingest_service import chunked
+
+KEYWORD_MAX_LENGTH = SearchHistory._meta.get_field('keyword').max_length
+
+
+class SearchCounter:
+    """SearchHistory 검색 횟수 쓰기 버퍼
+
+    요청 경로에서는 프로세스 메모리의 카운터만 올리고(DB 쓰기 없음), 백그라운드 스레드가
+    SEARCH_COUNTER_FLUSH_SECONDS마다 모인 증가분을 DB에 반영한다. 반영할 때는 없는 키워드만
+    count=0으로 만들고(keyword 유니크, 충돌 무시) F('count') + n 으로 올리므로 여러 워커가 동시에
+    반영해도 증가분이 사라지거나 행이 중복되지 않는다.
+    정상 종료 시에는 atexit로 남은 증가분을 반영하지만, 프로세스가 강제 종료되면 마지막 주기분은 잃을 수 있다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flusher_started = False
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    @staticmethod
+    def is_buffered() -> bool:
+        return getattr(settings, 'SEARCH_COUNTER_BUFFERED', True)
+
+    def record(self, keyword: str) -> None:
+        keyword = keyword[:KEYWORD_MAX_LENGTH]
+        if not self.is_buffered():
+            self.apply({keyword: 1})
+            return
+        with self._lock:
+            self._pending[keyword] = self._pending.get(keyword, 0) + 1
+        self._start_flusher()
+
+    def flush(self) -> int:
+        """모인 증가분을 DB에 반영하고 반영한 검색 수를 반환 (실패하면 다음 주기에 다시 시도)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self.apply(pending)
+        except Exception as e:
+            print(f"검색 횟수 반영 오류: {e}")
+            with self._lock:
+                for keyword, count in pending.items():
+                    self._pending[keyword] = self._pending.get(keyword, 0) + count
+            return 0
+        return sum(pending.values())
+
+    @staticmethod
+    def apply(increments: Dict[str, int]) -> None:
+        """키워드별 증가분을 upsert (같은 증가량끼리 UPDATE 한 번)"""
+        keywords = sorted(increments)  # 동시에 반영하는 워커끼리 같은 순서로 잠금
+        by_amount = defaultdict(list)
+        for keyword in keywords:
+            by_amount[increments[keyword]].append(keyword)
+        now = timezone.now()
+
+        with transaction.atomic():
+            SearchHistory.objects.bulk_create(
+                [SearchHistory(keyword=keyword, count=0) for keyword in keywords],
+                batch_size=500, ignore_conflicts=True
+            )
+            for amount, amount_keywords in by_amount.items():
+                for batch in chunked(amount_keywords, 500):
+                    SearchHistory.objects.filter(keyword__in=batch).update(
+                        count=F('count') + amount, last_searched=now
+                    )
+
+    def _start_flusher(self) -> None:
+        if self._flusher_started:
+            return
+        with self._lock:
+            if self._flusher_started:
+                return
+            self._flusher_started = True
+        threading.Thread(target=self._flush_loop, name='search-counter-flush', daemon=True).start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        interval = getattr(settings, 'SEARCH_COUNTER_FLUSH_SECONDS', 5)
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            self.flush()
+
+    def _reset_after_fork(self) -> None:
+        # 부모의 미반영 증가분은 부모가 반영하므로 자식은 비운 상태로 시작
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flusher_started = False
+
+
+# 프로세스당 하나
+search_counter = SearchCounter()
@@ -0,0 +1,318 @@
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date as date_type
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from django.conf import settings
+
+# 한글/영문/숫자 외 문자는 모두 구분자로 취급
+WORD_PATTERN = re.compile(r'[0-9a-z가-힣ㄱ-ㆎ]+')
+TF_MAX = 0xffff
+
+
+class _Posting:
+    """term 하나의 posting list - 문서 번호 오름차순 배열과 같은 위치의 tf 배열
+
+    파이썬 루프로 varint를 푸는 대신 array를 그대로 set()/bisect에 넘겨 C 수준에서 처리한다.
+    (varint 압축보다 posting당 메모리는 늘지만 질의마다 전체 posting을 복원하지 않음)
+    """
+    __slots__ = ('docs', 'tfs')
+
+    def __init__(self):
+        self.docs = array('I')
+        self.tfs = array('H')
+
+    @property
+    def df(self) -> int:
+        return len(self.docs)
+
+    def matches(self, candidates: Set[int]) -> Iterator[Tuple[int, int]]:
+        """후보 문서 중 이 term을 가진 (doc, tf) - 후보가 적으면 이진 탐색, 많으면 순차 비교"""
+        docs, tfs = self.docs, self.tfs
+        if len(candidates) * 4 < len(docs):
+            for doc in candidates:
+                i = bisect_left(docs, doc)
+                if i < len(docs) and docs[i] == doc:
+                    yield doc, tfs[i]
+        else:
+            for doc, tf in zip(docs, tfs):
+                if doc in candidates:
+                    yield doc, tf
+
+
+class _ReadWriteLock:
+    """검색끼리는 동시에, 문서 추가/삭제는 단독으로 (쓰기가 기다리는 동안 새 검색은 대기)"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class NGramSearchEngine:
+    """한글 문자 bigram/trigram 기반 BM25 전문 검색 엔진 (프로세스 내 메모리 색인)
+
+    날짜 범위는 색인에 함께 저장한 문서 날짜로 후보를 거른 뒤에 개수 제한을 적용한다.
+    수정/삭제된 뉴스는 내부 문서 번호를 삭제 표시(deleted)만 하고 posting은 그대로 두므로,
+    삭제 문서는 build_search_index로 색인을 다시 만들 때까지 메모리와 df에 남는다.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, title_boost: int = 2, content_chars: int = 1000):
+        self.k1 = k1
+        self.b = b
+        self.title_boost = title_boost
+        self.content_chars = content_chars
+        self.doc_ids = array('q')        # 내부 문서 번호 -> News.id
+        self.doc_dates = array('I')      # 내부 문서 번호 -> News.date 서수 (date.toordinal)
+        self.doc_lengths = array('I')
+        self.total_length = 0
+        self.postings = {}
+        self.deleted = set()             # 수정/삭제로 더 이상 쓰지 않는 내부 문서 번호
+        self._docs_by_id = {}            # News.id -> 현재 내부 문서 번호
+        self._lock = _ReadWriteLock()
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """단어별 문자 bigram + trigram (한 글자 단어는 그대로)"""
+        text = unicodedata.normalize('NFC', text or '').lower()
+        tokens = []
+        for word in WORD_PATTERN.findall(text):
+            if len(word) == 1:
+                tokens.append(word)
+                continue
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+            tokens.extend(word[i:i + 3] for i in range(len(word) - 2))
+        return tokens
+
+    def __len__(self):
+        return len(self.doc_ids) - len(self.deleted)
+
+    def add_document(self, news_id: int, title: str, content: str, date: Optional[date_type] = None) -> None:
+        """문서 추가 (이미 색인된 News.id면 이전 문서를 삭제 표시하고 새로 색인)"""
+        term_freqs = Counter(self.tokenize(content[:self.content_chars]))
+        for term in self.tokenize(title):
+            term_freqs[term] += self.title_boost
+        length = sum(term_freqs.values())
+        if isinstance(date, str):
+            date = date_type.fromisoformat(date[:10])
+
+        with self._lock.write():
+            self._remove(news_id)
+            doc = len(self.doc_ids)
+            self._docs_by_id[news_id] = doc
+            self.doc_ids.append(news_id)
+            self.doc_dates.append(date.toordinal() if date else 0)
+            self.doc_lengths.append(length)
+            self.total_length += length
+            for term, tf in term_freqs.items():
+                posting = self.postings.get(term)
+                if posting is None:
+                    posting = self.postings[term] = _Posting()
+                posting.docs.append(doc)
+                posting.tfs.append(min(tf, TF_MAX))
+
+    def remove_document(self, news_id: int) -> bool:
+        with self._lock.write():
+            return self._remove(news_id)
+
+    def _remove(self, news_id: int) -> bool:
+        doc = self._docs_by_id.pop(news_id, None)
+        if doc is None:
+            return False
+        self.deleted.add(doc)
+        self.total_length -= self.doc_lengths[doc]
+        return True
+
+    def _candidates(self, query_terms: Counter, start_date: Optional[date_type],
+                    end_date: Optional[date_type]) -> Set[int]:
+        """질의의 모든 bigram(과 한 글자 단어)을 포함하고 날짜 범위에 드는 내부 문서 번호
+
+        df가 작은 term부터 교집합을 구해 후보 집합을 빨리 좁힌다. (self._lock.read() 안에서 호출)
+        """
+        required = sorted(
+            (term for term in query_terms if len(term) <= 2),
+            key=lambda t: self.postings[t].df if t in self.postings else 0
+        )
+        if not required or any(term not in self.postings for term in required):
+            return set()
+
+        candidates = set(self.postings[required[0]].docs)
+        for term in required[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(self.postings[term].docs)
+        candidates -= self.deleted
+
+        if candidates and (start_date or end_date):
+            low = start_date.toordinal() if start_date else 0
+            high = end_date.toordinal() if end_date else date_type.max.toordinal()
+            dates = self.doc_dates
+            candidates = {doc for doc in candidates if low <= dates[doc] <= high}
+        return candidates
+
+    def search(self, query: str, top_k: Optional[int] = 10, start_date: Optional[date_type] = None,
+               end_date: Optional[date_type] = None) -> List[Tuple[int, float]]:
+        """질의의 모든 bigram을 포함하는 문서를 BM25 점수 순으로 (News.id, score) 반환"""
+        query_terms = Counter(self.tokenize(query))
+        if not query_terms:
+            return []
+
+        with self._lock.read():
+            num_docs = len(self)
+            if not num_docs:
+                return []
+            candidates = self._candidates(query_terms, start_date, end_date)
+            if not candidates:
+                return []
+            avg_length = self.total_length / num_docs
+
+            # 후보 문서만 점수 계산
+            scores = dict.fromkeys(candidates, 0.0)
+            for term, query_tf in query_terms.items():
+                posting = self.postings.get(term)
+                if posting is None:
+                    continue
+                idf = math.log(1 + (num_docs - posting.df + 0.5) / (posting.df + 0.5))
+                weight = idf * query_tf
+                for doc, tf in posting.matches(candidates):
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc] / avg_length)
+                    scores[doc] += weight * tf * (self.k1 + 1) / (tf + norm)
+
+            if top_k is None:
+                ranked = sorted(candidates, key=scores.__getitem__, reverse=True)
+            else:
+                ranked = heapq.nlargest(top_k, candidates, key=scores.__getitem__)
+            return [(self.doc_ids[doc], scores[doc]) for doc in ranked]
+
+    def search_ids(self, query: str, limit: Optional[int] = None, start_date: Optional[date_type] = None,
+                   end_date: Optional[date_type] = None) -> List[int]:
+        return [news_id for news_id, _ in self.search(query, top_k=limit, start_date=start_date,
+                                                      end_date=end_date)]
+
+    def recent_ids(self, query: str, limit: Optional[int] = None, start_date: Optional[date_type] = None,
+                   end_date: Optional[date_type] = None) -> List[int]:
+        """날짜 범위 안의 일치 문서를 목록 정렬 순서(날짜, News.id 역순)로 최대 limit건 반환"""
+        query_terms = Counter(self.tokenize(query))
+        if not query_terms:
+            return []
+        with self._lock.read():
+            candidates = self._candidates(query_terms, start_date, end_date)
+            dates, doc_ids = self.doc_dates, self.doc_ids
+
+            def key(doc):
+                return dates[doc], doc_ids[doc]
+
+            if limit is None:
+                ranked = sorted(candidates, key=key, reverse=True)
+            else:
+                ranked = heapq.nlargest(limit, candidates, key=key)
+            return [doc_ids[doc] for doc in ranked]
+
+    def daily_counts(self, query: str, start_date: Optional[date_type] = None,
+                     end_date: Optional[date_type] = None) -> Dict[date_type, int]:
+        """날짜 범위 안의 일치 문서 수를 날짜별로 (개수 제한 없음)"""
+        query_terms = Counter(self.tokenize(query))
+        if not query_terms:
+            return {}
+        with self._lock.read():
+            candidates = self._candidates(query_terms, start_date, end_date)
+            counts = Counter(self.doc_dates[doc] for doc in candidates)
+        return {date_type.fromordinal(day): count for day, count in sorted(counts.items()) if day}
+
+    def save(self, path: str) -> None:
+        tmp_path = f'{path}.tmp'
+        with self._lock.read(), open(tmp_path, 'wb') as f:
+            pickle.dump(self.__getstate__(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'NGramSearchEngine':
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        engine = cls.__new__(cls)
+        engine.__setstate__(state)
+        return engine
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        state.pop('_docs_by_id', None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault('deleted', set())
+        self.__dict__.update(state)
+        self._docs_by_id = {
+            news_id: doc for doc, news_id in enumerate(self.doc_ids) if doc not in self.deleted
+        }
+        self._lock = _ReadWriteLock()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def is_fulltext_enabled() -> bool:
+    return getattr(settings, 'SEARCH_BACKEND', 'keyword') == 'fulltext'
+
+
+def get_search_engine() -> Optional[NGramSearchEngine]:
+    """전문 검색 백엔드가 켜져 있고 색인 파일이 있으면 프로세스 공용 엔진을 반환"""
+    global _engine
+    if not is_fulltext_enabled():
+        return None
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                path = str(getattr(settings, 'SEARCH_INDEX_PATH', ''))
+                if not path or not os.path.exists(path):
+                    return None
+                try:
+                    _engine = NGramSearchEngine.load(path)
+                except Exception as e:
+                    print(f"검색 색인 로드 오류: {e}")
+                    return None
+    return _engine
+
+
+def get_loaded_search_engine() -> Optional[NGramSearchEngine]:
+    """이미 메모리에 로드된 엔진만 반환 (색인 파일을 새로 읽지 않음)"""
+    return _engine
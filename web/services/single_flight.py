@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+
+# 리스 토큰이 내 것일 때만 지우는 compare-and-delete (Redis에서 원자적으로 실행)
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def new_token() -> int:
+    # 정수는 Redis 캐시에 직렬화 없이 문자열 그대로 저장되므로 Lua 스크립트에서 바로 비교 가능
+    return uuid.uuid4().int >> 65
+
+
+class SingleFlight:
+    """공유 캐시(Redis) 리스로 같은 키의 생성 작업을 워커/노드 전체에서 한 번만 실행
+
+    리스를 얻은 요청만 generate를 실행하고, 나머지는 리더의 결과를 기다린다.
+    기다리는 동안에는 캐시만 점점 긴 간격으로 확인하고, DB(fetch)는 리스가 풀렸을 때 한 번만 읽는다.
+    생성 실패 결과({'is_error': True, ...})는 공유하지 않으므로 기다리던 요청은 리스가 풀리면 다시 생성한다.
+    """
+
+    def __init__(self, namespace: str, lease_seconds: Optional[int] = None,
+                 wait_seconds: Optional[int] = None, poll_interval: float = 0.05):
+        self.namespace = namespace
+        self.lease_seconds = lease_seconds or getattr(settings, 'SINGLE_FLIGHT_LEASE_SECONDS', 120)
+        self.wait_seconds = wait_seconds or getattr(settings, 'SINGLE_FLIGHT_WAIT_SECONDS', 90)
+        self.poll_interval = poll_interval
+        self.max_poll_interval = getattr(settings, 'SINGLE_FLIGHT_MAX_POLL_SECONDS', 1.0)
+        self.result_ttl = 60
+
+    def _cache_key(self, kind: str, key: str) -> str:
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return f"singleflight:{self.namespace}:{kind}:{digest}"
+
+    def run(self, key: str, generate: Callable[[], Any],
+            fetch: Optional[Callable[[], Any]] = None) -> Any:
+        """key에 대한 결과를 반환 - 이미 있으면 fetch 결과, 없으면 한 요청만 generate 실행"""
+        lock_key = self._cache_key('lock', key)
+        result_key = self._cache_key('result', key)
+        token = new_token()
+        deadline = time.monotonic() + self.wait_seconds
+
+        while True:
+            # 처음과 리더가 리스를 놓은 뒤에만 DB까지 확인
+            result = self._lookup(result_key, fetch)
+            if result is not None:
+                return result
+
+            if self._acquire(lock_key, token):
+                try:
+                    # 리스를 얻는 사이에 다른 리더가 끝냈을 수 있으므로 한 번 더 확인 (리더는 해제 전에 캐시에 씀)
+                    result = self._lookup(result_key, None)
+                    if result is not None:
+                        return result
+                    result = generate()
+                    self._publish(result_key, result)
+                    return result
+                finally:
+                    self._release(lock_key, token)
+
+            delay = self.poll_interval
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_poll_interval)
+                result = self._lookup(result_key, None)
+                if result is not None:
+                    return result
+                if not self._is_locked(lock_key):
+                    break
+            else:
+                # 리더가 너무 오래 걸리면 대기를 포기하고 직접 생성
+                print(f"single-flight 대기 시간 초과, 직접 생성: {self.namespace} {key}")
+                return generate()
+
+    async def arun(self, key: str, generate: Callable[[], Awaitable[Any]],
+                   fetch: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """run()의 비동기 버전 - 리더를 기다리는 동안 이벤트 루프를 막지 않음 (generate/fetch는 코루틴 함수)"""
+        lock_key = self._cache_key('lock', key)
+        result_key = self._cache_key('result', key)
+        token = new_token()
+        deadline = time.monotonic() + self.wait_seconds
+        cached = sync_to_async(self._lookup)
+
+        while True:
+            result = await cached(result_key, None)
+            if result is None and fetch is not None:
+                result = await fetch()
+            if result is not None:
+                return result
+
+            if await sync_to_async(self._acquire)(lock_key, token):
+                try:
+                    result = await cached(result_key, None)
+                    if result is not None:
+                        return result
+                    result = await generate()
+                    await sync_to_async(self._publish)(result_key, result)
+                    return result
+                finally:
+                    await sync_to_async(self._release)(lock_key, token)
+
+            delay = self.poll_interval
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_poll_interval)
+                result = await cached(result_key, None)
+                if result is not None:
+                    return result
+                if not await sync_to_async(self._is_locked)(lock_key):
+                    break
+            else:
+                print(f"single-flight 대기 시간 초과, 직접 생성: {self.namespace} {key}")
+                return await generate()
+
+    def try_lead(self, key: str) -> Optional[int]:
+        """스트리밍처럼 run()으로 감쌀 수 없는 생성용 - 리스를 얻으면 토큰, 다른 리더가 있으면 None"""
+        token = new_token()
+        return token if self._acquire(self._cache_key('lock', key), token) else None
+
+    def complete(self, key: str, token: int, result: Any = None) -> None:
+        """try_lead로 얻은 리스를 해제 (결과가 있으면 대기 중인 요청이 받도록 먼저 공유)"""
+        self._publish(self._cache_key('result', key), result)
+        self._release(self._cache_key('lock', key), token)
+
+    @staticmethod
+    def is_shareable(result: Any) -> bool:
+        """없거나 생성 실패인 결과는 다른 요청에 공유하지 않음"""
+        return result is not None and not (isinstance(result, dict) and result.get('is_error'))
+
+    def _publish(self, result_key: str, result: Any) -> None:
+        if not self.is_shareable(result):
+            return
+        try:
+            cache.set(result_key, result, self.result_ttl)
+        except Exception as e:
+            print(f"single-flight 결과 저장 오류: {e}")
+
+    def _lookup(self, result_key: str, fetch: Optional[Callable[[], Any]]) -> Any:
+        try:
+            result = cache.get(result_key)
+        except Exception as e:
+            print(f"single-flight 캐시 조회 오류: {e}")
+            result = None
+        if result is None and fetch is not None:
+            result = fetch()
+        return result
+
+    def _acquire(self, lock_key: str, token: int) -> bool:
+        try:
+            return cache.add(lock_key, token, self.lease_seconds)
+        except Exception as e:
+            # 캐시 장애 시에는 중복 생성을 감수하고 요청을 처리
+            print(f"single-flight 리스 획득 오류: {e}")
+            return True
+
+    @staticmethod
+    def _is_locked(lock_key: str) -> bool:
+        try:
+            return cache.get(lock_key) is not None
+        except Exception:
+            return False
+
+    @staticmethod
+    def _release(lock_key: str, token: int) -> None:
+        """내 토큰일 때만 리스 삭제 - 리스가 만료돼 다른 리더가 잡은 경우 그 리스를 지우지 않음"""
+        try:
+            client = _redis_client()
+            if client is not None:
+                client.eval(RELEASE_SCRIPT, 1, cache.make_and_validate_key(lock_key), str(token))
+            elif cache.get(lock_key) == token:
+                # Redis가 아닌 캐시(로컬 개발용 LocMem 등)는 원자적 비교 삭제가 없어 조회 후 삭제
+                cache.delete(lock_key)
+        except Exception as e:
+            print(f"single-flight 리스 해제 오류: {e}")
+
+
+def _redis_client():
+    """기본 캐시가 Redis면 쓰기용 redis 클라이언트 (Django RedisCache / django-redis), 아니면 None"""
+    backend = getattr(cache, '_cache', None)
+    if hasattr(backend, 'get_client'):
+        return backend.get_client(write=True)
+    client = getattr(cache, 'client', None)
+    if hasattr(client, 'get_client'):
+        return client.get_client(write=True)
+    return None
@@ -0,0 +1,194 @@
+import hashlib
+import re
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Min, Q
+from ..models import News, StoryBand, StorySketch
+
+HASH_MASK = (1 << 64) - 1
+GOLDEN_RATIO = 0x9E3779B97F4A7C15
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class MinHashLSH:
+    """제목+본문 앞부분의 문자 shingle로 MinHash 서명과 LSH 밴드 해시를 계산
+
+    shingle마다 해시를 한 번만 계산하는 one-permutation MinHash를 사용한다
+    (해시 상위 비트로 버킷을 고르고 버킷별 최솟값을 서명으로 삼음, 빈 버킷은 오른쪽 버킷 값으로 채움).
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 4, content_chars: int = 300):
+        assert num_perm % bands == 0 and num_perm & (num_perm - 1) == 0
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.content_chars = content_chars
+        self._bucket_shift = 64 - (num_perm.bit_length() - 1)
+        self._value_mask = (1 << self._bucket_shift) - 1
+
+    def shingles(self, title: str, content: str) -> set:
+        text = WHITESPACE_PATTERN.sub(' ', f"{title} {(content or '')[:self.content_chars]}".lower()).strip()
+        size = self.shingle_size
+        if len(text) <= size:
+            return {text}
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def signature(self, title: str, content: str) -> List[int]:
+        shift, value_mask = self._bucket_shift, self._value_mask
+        empty = value_mask + 1
+        signature = [empty] * self.num_perm
+        for shingle in self.shingles(title, content):
+            h = (zlib.crc32(shingle.encode('utf-8')) * GOLDEN_RATIO) & HASH_MASK
+            bucket, value = h >> shift, h & value_mask
+            if value < signature[bucket]:
+                signature[bucket] = value
+
+        if empty in signature and len(set(signature)) > 1:
+            # densification: 빈 버킷은 가장 가까운 오른쪽(순환) 버킷 값 + 거리 오프셋으로 채움
+            size = self.num_perm
+            filled = list(signature)
+            for i in range(size):
+                if signature[i] != empty:
+                    continue
+                distance = 1
+                while signature[(i + distance) % size] == empty:
+                    distance += 1
+                filled[i] = signature[(i + distance) % size] + distance * empty
+            signature = filled
+        return signature
+
+    def band_hashes(self, signature: List[int]) -> List[int]:
+        """밴드별 (밴드 번호, 서명 조각) 해시 - 한 밴드라도 같으면 유사 기사 후보"""
+        rows = self.rows
+        hashes = []
+        for band in range(self.bands):
+            key = f"{band}:{','.join(map(str, signature[band * rows:(band + 1) * rows]))}"
+            digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+            hashes.append(int.from_bytes(digest, 'big') >> 1)  # BigIntegerField(signed)에 맞게 63비트
+        return hashes
+
+    @staticmethod
+    def sketch(signature: List[int]) -> bytes:
+        """후보 검증용으로 저장하는 서명 (값마다 하위 32비트만 보관)"""
+        return array('I', [value & 0xFFFFFFFF for value in signature]).tobytes()
+
+    @staticmethod
+    def similarity(sketch_a: bytes, sketch_b: bytes) -> float:
+        """같은 위치 값이 일치하는 비율 = 추정 Jaccard 유사도"""
+        a, b = array('I', sketch_a), array('I', sketch_b)
+        return sum(1 for x, y in zip(a, b) if x == y) / len(a) if len(a) == len(b) else 0.0
+
+
+class StoryClusterService:
+    """수집 시 기사를 LSH로 기존 스토리 클러스터에 배정 (통신사 전재/재배포 기사 묶기)
+
+    밴드 해시가 겹친 후보 클러스터는 대표 기사의 서명과 추정 Jaccard 유사도를 비교해 확정한다.
+    클러스터 id는 그 스토리의 첫 기사 id이므로 story_cluster == id 인 행이 대표 기사다.
+    """
+
+    def __init__(self, lsh: Optional[MinHashLSH] = None, threshold: Optional[float] = None,
+                 batch_size: int = 1000):
+        self.lsh = lsh or MinHashLSH(
+            bands=getattr(settings, 'STORY_CLUSTER_BANDS', 16),
+            content_chars=getattr(settings, 'STORY_CLUSTER_CONTENT_CHARS', 300)
+        )
+        self.threshold = threshold or getattr(settings, 'STORY_CLUSTER_THRESHOLD', 0.5)
+        self.batch_size = batch_size
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'STORY_CLUSTER_ENABLED', True)
+
+    def assign_clusters(self, band_table: Dict[int, int], sketches: Dict[int, bytes],
+                        items: Iterable[Tuple[int, List[int], List[int]]]) -> Dict[int, int]:
+        """(news_id, 서명, 밴드 해시)를 id 순으로 받아 클러스터 배정
+
+        band_table(밴드 해시 -> 클러스터)과 sketches(클러스터 -> 대표 기사 서명)도 함께 갱신한다.
+        """
+        assignments = {}
+        for news_id, signature, band_hashes in items:
+            sketch = self.lsh.sketch(signature)
+            cluster_id = news_id
+            for candidate in sorted({band_table[h] for h in band_hashes if h in band_table}):
+                other = sketches.get(candidate)
+                if other is not None and self.lsh.similarity(sketch, other) >= self.threshold:
+                    cluster_id = candidate
+                    break
+            if cluster_id == news_id:
+                sketches[news_id] = sketch
+            for h in band_hashes:
+                band_table.setdefault(h, cluster_id)
+            assignments[news_id] = cluster_id
+        return assignments
+
+    def assign(self, news_list: List[News]) -> Dict[int, int]:
+        """뉴스 묶음의 story_cluster를 계산해 저장하고 {news_id: cluster_id} 반환"""
+        items = []
+        for news in sorted(news_list, key=lambda news: news.id):
+            signature = self.lsh.signature(news.title, news.content)
+            items.append((news.id, signature, self.lsh.band_hashes(signature)))
+        if not items:
+            return {}
+
+        hash_list = list({h for _, _, band_hashes in items for h in band_hashes})
+        band_table = {}
+        for i in range(0, len(hash_list), self.batch_size):
+            band_table.update(
+                StoryBand.objects.filter(band_hash__in=hash_list[i:i + self.batch_size])
+                .values_list('band_hash', 'cluster_id')
+            )
+        cluster_list = list(set(band_table.values()))
+        sketches = {}
+        for i in range(0, len(cluster_list), self.batch_size):
+            sketches.update(
+                (cluster_id, bytes(sketch)) for cluster_id, sketch in
+                StorySketch.objects.filter(cluster_id__in=cluster_list[i:i + self.batch_size])
+                .values_list('cluster_id', 'signature')
+            )
+        known_hashes = set(band_table)
+        known_clusters = set(sketches)
+
+        assignments = self.assign_clusters(band_table, sketches, items)
+
+        with transaction.atomic():
+            StoryBand.objects.bulk_create(
+                [StoryBand(band_hash=h, cluster_id=c) for h, c in band_table.items() if h not in known_hashes],
+                batch_size=self.batch_size,
+                ignore_conflicts=True
+            )
+            StorySketch.objects.bulk_create(
+                [StorySketch(cluster_id=c, signature=sketch) for c, sketch in sketches.items()
+                 if c not in known_clusters],
+                batch_size=self.batch_size,
+                ignore_conflicts=True
+            )
+            # 새 스토리의 첫 기사(대부분)는 story_cluster = id 한 번으로, 나머지는 클러스터별로 갱신
+            by_cluster = {}
+            for news_id, cluster_id in assignments.items():
+                by_cluster.setdefault(cluster_id, []).append(news_id)
+            new_story_ids = [news_id for news_id, cluster_id in assignments.items() if news_id == cluster_id]
+            for i in range(0, len(new_story_ids), self.batch_size):
+                News.objects.filter(id__in=new_story_ids[i:i + self.batch_size]).update(story_cluster=F('id'))
+            for cluster_id, news_ids in by_cluster.items():
+                news_ids = [news_id for news_id in news_ids if news_id != cluster_id]
+                if news_ids:
+                    News.objects.filter(id__in=news_ids).update(story_cluster=cluster_id)
+        return assignments
+
+    @staticmethod
+    def collapse(queryset):
+        """클러스터별로 필터 결과 안에서 가장 먼저 저장된 기사(최소 id)만 남김 (배정되지 않은 기사는 모두 유지)
+
+        클러스터의 첫 기사(story_cluster == id)가 날짜/검색 필터 밖이어도 스토리가 통째로 빠지지 않도록
+        같은 필터를 적용한 하위 쿼리에서 대표 기사를 고른다.
+        """
+        first_ids = (queryset.filter(story_cluster__isnull=False)
+                     .order_by()
+                     .values('story_cluster')
+                     .annotate(first_id=Min('id'))
+                     .values('first_id'))
+        return queryset.filter(Q(story_cluster__isnull=True) | Q(id__in=first_ids))
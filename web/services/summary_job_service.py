@@ -0,0 +1,149 @@
+import os
+import socket
+from datetime import timedelta
+from typing import Dict, Optional
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F, Q
+from django.urls import reverse
+from django.utils import timezone
+from ..models import SummaryJob
+from .summary_service import SummaryService
+
+
+class SummaryJobService:
+    """DB 기반 요약 작업 큐 - API는 작업을 등록하고 별도 프로세스 워커가 처리"""
+
+    @staticmethod
+    def is_async_requested(request) -> bool:
+        """요청 파라미터(async=1) 또는 설정(SUMMARY_ASYNC_JOBS)으로 비동기 모드 결정"""
+        value = request.GET.get('async', '').strip()
+        if value:
+            return value in ('1', 'true')
+        return getattr(settings, 'SUMMARY_ASYNC_JOBS', False)
+
+    @staticmethod
+    def make_key(kind: str, params: Dict) -> str:
+        values = ':'.join(f"{name}={params.get(name) or ''}" for name in sorted(params))
+        return f"{kind}:{values}"[:255]
+
+    def enqueue(self, kind: str, params: Dict) -> SummaryJob:
+        """같은 요약 작업이 대기/실행 중이면 그 작업을, 아니면 새 작업을 반환
+
+        대기/실행 중인 작업은 active_key가 unique라 여러 요청이 동시에 등록해도 하나만 만들어진다.
+        """
+        key = self.make_key(kind, params)
+        for _ in range(3):
+            try:
+                job, _ = SummaryJob.objects.get_or_create(
+                    active_key=key, defaults={'kind': kind, 'key': key, 'params': params}
+                )
+                return job
+            except IntegrityError:
+                # 다른 요청이 먼저 만든 작업이 조회 직전에 끝난 경우 - 다시 시도
+                continue
+        raise RuntimeError('요약 작업을 등록하지 못했습니다.')
+
+    @staticmethod
+    def worker_id() -> str:
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def claim(self, worker_id: Optional[str] = None) -> Optional[SummaryJob]:
+        """가장 오래된 대기 작업을 조건부 UPDATE로 선점 (여러 워커가 동시에 실행해도 안전)"""
+        worker_id = worker_id or self.worker_id()
+        self.requeue_stale()
+
+        candidates = SummaryJob.objects.filter(
+            Q(run_after__isnull=True) | Q(run_after__lte=timezone.now()),
+            status=SummaryJob.PENDING
+        ).order_by('created_at', 'id').values_list('id', flat=True)[:10]
+
+        for job_id in candidates:
+            claimed = SummaryJob.objects.filter(id=job_id, status=SummaryJob.PENDING).update(
+                status=SummaryJob.RUNNING,
+                locked_by=worker_id,
+                locked_at=timezone.now(),
+                attempts=F('attempts') + 1
+            )
+            if claimed:
+                return SummaryJob.objects.get(id=job_id)
+        return None
+
+    def requeue_stale(self) -> int:
+        """타임아웃이 지난 실행 중 작업은 재시도 횟수 내에서 다시 대기 상태로"""
+        timeout = getattr(settings, 'SUMMARY_JOB_TIMEOUT_SECONDS', 300)
+        max_attempts = getattr(settings, 'SUMMARY_JOB_MAX_ATTEMPTS', 3)
+        stale = SummaryJob.objects.filter(
+            status=SummaryJob.RUNNING,
+            locked_at__lt=timezone.now() - timedelta(seconds=timeout)
+        )
+        stale.filter(attempts__gte=max_attempts).update(
+            status=SummaryJob.FAILED, active_key=None, error='작업 시간 초과'
+        )
+        return stale.filter(~Q(attempts__gte=max_attempts)).update(status=SummaryJob.PENDING)
+
+    def run(self, job: SummaryJob) -> SummaryJob:
+        """작업을 실행하고 결과를 저장
+
+        실패하면 SUMMARY_JOB_MAX_ATTEMPTS회까지 지수 백오프 후 다시 대기 상태로 돌린다.
+        결과는 이 워커가 아직 작업을 잡고 있을 때만 기록 (시간 초과로 다른 워커에 넘어갔으면 버림)
+        """
+        summary_service = SummaryService()
+        params = job.params
+        try:
+            if job.kind == SummaryJob.KIND_QUICK_SUMMARY:
+                result = summary_service.get_saved_quick_summary(params['query']) \
+                    or summary_service.generate_quick_summary(params['query'])
+            else:
+                period_start = summary_service.get_period_start(
+                    params.get('date'), params['group_by'], params.get('start_date')
+                )
+                result = summary_service.get_saved_summary(
+                    params['query'], period_start, params['group_by'], not params.get('date')
+                ) \
+                    or summary_service.generate_summary(
+                        params['query'], params.get('date'), params['group_by'],
+                        params.get('start_date'), params.get('end_date')
+                    )
+            if result.get('is_error'):
+                raise RuntimeError('요약 생성에 실패했습니다.')
+            changes = {'status': SummaryJob.DONE, 'active_key': None, 'result': result, 'error': ''}
+        except Exception as e:
+            print(f"요약 작업 {job.id} 오류 ({job.attempts}회차): {e}")
+            changes = {'error': str(e)}
+            if job.attempts < getattr(settings, 'SUMMARY_JOB_MAX_ATTEMPTS', 3):
+                changes['status'] = SummaryJob.PENDING
+                changes['run_after'] = timezone.now() + timedelta(seconds=self.retry_delay(job.attempts))
+            else:
+                changes['status'] = SummaryJob.FAILED
+                changes['active_key'] = None
+
+        updated = SummaryJob.objects.filter(
+            pk=job.pk, status=SummaryJob.RUNNING, locked_by=job.locked_by
+        ).update(updated_at=timezone.now(), **changes)
+        if not updated:
+            print(f"요약 작업 {job.id}: 다른 워커로 넘어가 결과를 기록하지 않음")
+            job.refresh_from_db()
+            return job
+        for field, value in changes.items():
+            setattr(job, field, value)
+        return job
+
+    @staticmethod
+    def retry_delay(attempts: int) -> float:
+        """n번째 실패 후 재시도까지 대기 시간 (지수 백오프, 상한 있음)"""
+        base = getattr(settings, 'SUMMARY_JOB_RETRY_SECONDS', 10)
+        return min(base * 2 ** (attempts - 1), getattr(settings, 'SUMMARY_JOB_RETRY_MAX_SECONDS', 300))
+
+    @staticmethod
+    def to_response(job: SummaryJob) -> Dict:
+        data = {
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': reverse('web:get_summary_job_api', args=[job.id]),
+        }
+        if job.status == SummaryJob.DONE:
+            data['result'] = job.result
+        elif job.status == SummaryJob.FAILED:
+            data['error'] = job.error
+        return data
@@ -0,0 +1,130 @@
+import threading
+from typing import Callable, Dict, Iterable, Set
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
+from ..models import News, NewsSummary, DailySummary, QuickSummary
+from .rollup_service import NewsRollupService
+
+GROUP_BY_CHOICES = ['1day', '1week', '1month']
+
+# 스레드(요청)별로 커밋을 기다리는 저장된 뉴스 묶음과 그 묶음의 on_commit 콜백
+_pending = threading.local()
+
+
+class SummaryRefreshService:
+    """새 뉴스가 들어온 (검색어, 기간)의 요약만 stale로 표시하고 백그라운드 갱신을 예약
+
+    stale 요약은 갱신이 끝날 때까지 그대로 응답하고, 갱신은 이전 요약 + 새 기사만으로 프롬프트를 만든다
+    (SummaryService.refresh_summary / refresh_quick_summary, DailyIssueService.refresh_summary).
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, 'SUMMARY_REFRESH_ENABLED', True)
+
+    @staticmethod
+    def summary_queries() -> Set[str]:
+        """아직 stale이 아닌 저장된 요약의 검색어 (세 요약 테이블에서 한 번씩 DISTINCT 조회)"""
+        queries = set()
+        for model, field in ((NewsSummary, 'keyword'), (DailySummary, 'query'), (QuickSummary, 'keyword')):
+            queries.update(model.objects.filter(is_stale=False).values_list(field, flat=True).distinct())
+        return {query for query in queries if query and query.strip()}
+
+    def touched_periods(self, news_list: Iterable[News]) -> Dict[str, Set]:
+        """저장된 요약의 검색어별로 이번 뉴스 묶음이 걸리는 날짜 집합
+
+        검색은 keyword__icontains(또는 같은 의미의 색인 조회)이므로 검색어가 뉴스 keyword 값의 부분 문자열이면
+        걸린다. 묶음의 keyword 값을 한 문자열로 이어 검색어마다 한 번씩 포함 여부를 본 뒤, 걸린 검색어만 날짜를 모은다.
+        """
+        news_list = list(news_list)
+        keywords = [(news.keyword or '').lower() for news in news_list]
+        haystack = '\n'.join(keywords)
+        if not haystack.strip():
+            return {}
+
+        touched = {}
+        for query in self.summary_queries():
+            needle = query.lower()
+            if needle not in haystack:
+                continue
+            days = {news.date for news, keyword in zip(news_list, keywords) if needle in keyword}
+            if days:
+                touched[query] = days
+        return touched
+
+    def mark_stale(self, news_list: Iterable[News]) -> int:
+        """새 뉴스 묶음이 영향을 주는 요약만 stale로 표시하고 표시한 요약 수를 반환"""
+        if not self.is_enabled():
+            return 0
+        touched = self.touched_periods(news_list)
+        if not touched:
+            return 0
+
+        news_filter = Q()
+        daily_filter = Q()
+        for query, days in touched.items():
+            for group_by in GROUP_BY_CHOICES:
+                periods = {NewsRollupService.period_start(day, group_by) for day in days}
+                news_filter |= Q(keyword=query, group_by=group_by, date__in=periods)
+                daily_filter |= Q(query=query, group_by=group_by, date__in=periods)
+
+        rows = list(NewsSummary.objects.filter(news_filter, is_overall=False, is_stale=False))
+        # 전체 요약은 저장된 범위(date~end_date, end_date가 없으면 오늘까지) 안에 새 뉴스가 있으면 stale
+        rows += [
+            summary for summary in NewsSummary.objects.filter(keyword__in=list(touched), is_overall=True, is_stale=False)
+            if any(summary.date <= day and (summary.end_date is None or day <= summary.end_date)
+                   for day in touched[summary.keyword])
+        ]
+        rows += list(DailySummary.objects.filter(daily_filter, is_stale=False))
+        rows += list(QuickSummary.objects.filter(keyword__in=list(touched), is_stale=False))
+
+        # 행 단위 save로 post_save 캐시 무효화 시그널을 그대로 사용 (영향받는 요약 수만큼만 실행)
+        for row in rows:
+            row.is_stale = True
+            row.save(update_fields=['is_stale'])
+        return len(rows)
+
+    @classmethod
+    def mark_stale_on_commit(cls, news: News) -> None:
+        """post_save용 - 트랜잭션 안에서 저장된 뉴스를 모아 커밋 시 한 번에 mark_stale (autocommit이면 즉시)
+
+        묶음은 그 묶음을 반영할 on_commit 콜백과 함께 보관하고, 콜백이 더 이상 등록돼 있지 않으면
+        (커밋됐거나 롤백돼 버려짐) 새 묶음을 시작한다. 롤백된 뉴스가 다음 트랜잭션으로 넘어가지 않는다.
+        """
+        db = transaction.get_connection()
+        if not db.in_atomic_block:
+            cls().mark_stale([news])
+            return
+
+        flush = getattr(_pending, 'flush', None)
+        if flush is None or not any(entry[1] is flush for entry in db.run_on_commit):
+            news_list = _pending.news = []
+            flush = _pending.flush = lambda: cls().mark_stale(news_list)
+            transaction.on_commit(flush)
+        _pending.news.append(news)
+
+    @staticmethod
+    def schedule(kind: str, key, refresh: Callable[[], object]) -> bool:
+        """stale 요약 갱신을 백그라운드 스레드로 시작 (같은 요약은 리스 기간 동안 한 번만)"""
+        if not getattr(settings, 'SUMMARY_REFRESH_ENABLED', True):
+            return False
+        try:
+            lease_seconds = getattr(settings, 'SUMMARY_REFRESH_LEASE_SECONDS', 300)
+            if not cache.add(f"summary_refresh:{kind}:{key}", True, lease_seconds):
+                return False
+        except Exception as e:
+            print(f"요약 갱신 예약 오류: {e}")
+            return False
+
+        def run():
+            try:
+                refresh()
+            except Exception as e:
+                print(f"요약 갱신 오류 ({kind}, {key}): {e}")
+            finally:
+                connection.close()
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
@@ -0,0 +1,725 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max, Min
+from django.db.models.functions import Substr
+from ..models import NewsSummary, DailySummary, QuickSummary, SummaryJob
+from .llm_service import AsyncLLMService, LLMService
+from .article_sampler import ArticleSampler
+from .news_filter import get_news_filter
+from .single_flight import SingleFlight
+from .cache_service import news_summary_cache, quick_summary_cache
+from .summary_refresh_service import SummaryRefreshService
+from .daily_issue_service import DailyIssueService
+from .summary_stream import PartialJSONReader, sse_event
+
+SUMMARY_FIELDS = ('background', 'core_content', 'conclusion')
+
+EMPTY_SUMMARY = {
+    'background': '검색된 뉴스가 없습니다.',
+    'core_content': '검색된 뉴스가 없습니다.',
+    'conclusion': '검색된 뉴스가 없습니다.',
+    'is_empty': True
+}
+
+EMPTY_QUICK_SUMMARY = {
+    'summary': '관련 뉴스가 없습니다.',
+    'news_count': 0,
+    'date_range': '',
+    'is_empty': True
+}
+
+
+class SummaryService:
+    """3단 요약 / 간단 요약의 조회와 생성 (API 뷰와 요약 작업 워커가 공유)"""
+
+    @staticmethod
+    def get_period_start(date: Optional[str], group_by: str, start_date: Optional[str] = None):
+        """요약 저장 기준이 되는 기간 시작일 (전체 요약이면 start_date 또는 None)"""
+        if date:
+            try:
+                date_obj = datetime.strptime(date, '%Y-%m-%d').date()
+            except ValueError:
+                return None
+            if group_by == '1week':
+                return date_obj - timedelta(days=date_obj.weekday())
+            if group_by == '1month':
+                return date_obj.replace(day=1)
+            return date_obj
+
+        if start_date:
+            try:
+                return datetime.strptime(start_date, '%Y-%m-%d').date()
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def _parse_date(value: Optional[str]):
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+        except ValueError:
+            return None
+
+    @classmethod
+    def get_saved_summary(cls, query: str, period_start, group_by: str, is_overall: bool = False) -> Optional[Dict]:
+        """저장된 3단 요약 조회 (LRU/Redis 캐시 경유) - stale이면 그대로 반환하고 갱신은 백그라운드로
+
+        is_overall이면 period_start를 시작일로 요청한 전체 요약 (같은 날짜의 기간 요약과 구분).
+        """
+        def load():
+            saved_summary = NewsSummary.objects.filter(
+                keyword=query,
+                date=period_start,
+                group_by=group_by,
+                is_overall=is_overall
+            ).first()
+            if not saved_summary:
+                return None
+            return {
+                'background': saved_summary.background,
+                'core_content': saved_summary.core_content,
+                'conclusion': saved_summary.conclusion,
+                'cached': True,
+                'stale': saved_summary.is_stale
+            }
+
+        cache_key = news_summary_cache.make_key(query, period_start, group_by, is_overall)
+        summary = news_summary_cache.get_or_load(cache_key, load)
+        if summary and summary.get('stale'):
+            SummaryRefreshService.schedule(
+                'news_summary', cache_key, lambda: cls().refresh_summary(query, period_start, group_by, is_overall)
+            )
+        return summary
+
+    @staticmethod
+    def _summary_flight_key(query: str, date: Optional[str], group_by: str,
+                            start_date: Optional[str], end_date: Optional[str], period_start) -> str:
+        return f"{query}_{period_start}_{group_by}_{date}_{start_date}_{end_date}"
+
+    def generate_summary(self, query: str, date: Optional[str], group_by: str,
+                         start_date: Optional[str], end_date: Optional[str], hierarchical: bool = True) -> Dict:
+        """같은 요약을 동시에 요청해도 LLM 호출은 한 번만 하도록 single-flight로 생성
+
+        hierarchical=False면 주/월/전체 요약도 하위 요약 없이 기사 샘플로 바로 생성한다.
+        """
+        period_start = self.get_period_start(date, group_by, start_date)
+        return SingleFlight('news_summary').run(
+            self._summary_flight_key(query, date, group_by, start_date, end_date, period_start),
+            generate=lambda: self._generate_summary(
+                query, date, group_by, start_date, end_date, period_start, hierarchical
+            ),
+            fetch=lambda: self.get_saved_summary(query, period_start, group_by, not date) if period_start else None
+        )
+
+    def _generate_summary(self, query: str, date: Optional[str], group_by: str,
+                          start_date: Optional[str], end_date: Optional[str], period_start,
+                          hierarchical: bool = True) -> Dict:
+        """뉴스를 조회해 3단 요약을 생성하고 기간이 있으면 NewsSummary에 저장 (생성 실패는 저장하지 않음)"""
+        news_list, last_news_id = self._summary_news(query, date, group_by, start_date, end_date)
+
+        summary = None
+        if last_news_id is not None and hierarchical and self.is_hierarchical(date, group_by):
+            # 주/월/전체 요약은 저장된 하위 기간 요약을 합쳐서 생성 (원문 기사를 다시 읽지 않음)
+            summary = self._generate_hierarchical_summary(query, date, group_by, start_date, end_date)
+
+        if summary is None:
+            # 기간 전체에 고르게 분포한 기사를 프롬프트 예산만큼만 조회 (본문은 SQL에서 자름)
+            news_data = ArticleSampler().sample(news_list) if last_news_id is not None else []
+
+            if not news_data:
+                return dict(EMPTY_SUMMARY)
+
+            llm_service = LLMService()
+            summary = llm_service.generate_structured_summary(
+                news_data,
+                search_keyword=query,
+                is_overall=not bool(date)
+            )
+
+        if not summary.get('is_error'):
+            self._save_summary(query, period_start, group_by, summary, last_news_id, not date, end_date)
+        return summary
+
+    def stream_summary(self, query: str, date: Optional[str], group_by: str,
+                       start_date: Optional[str], end_date: Optional[str]) -> Iterator[str]:
+        """generate_summary의 SSE 버전 - LLM 출력을 필드별 delta 이벤트로 전달하고 끝나면 저장 후 done
+
+        저장된 요약이 있으면 바로 done, 같은 요약을 다른 요청이 생성 중이면 그 결과를 기다려 done만 보낸다.
+        """
+        period_start = self.get_period_start(date, group_by, start_date)
+        if period_start:
+            saved_summary = self.get_saved_summary(query, period_start, group_by, not date)
+            if saved_summary:
+                yield sse_event('done', saved_summary)
+                return
+        yield sse_event('start', {'cached': False})
+
+        flight = SingleFlight('news_summary')
+        flight_key = self._summary_flight_key(query, date, group_by, start_date, end_date, period_start)
+        token = flight.try_lead(flight_key)
+        if token is None:
+            yield sse_event('done', self.generate_summary(query, date, group_by, start_date, end_date))
+            return
+
+        summary = None
+        try:
+            news_list, last_news_id = self._summary_news(query, date, group_by, start_date, end_date)
+            chunks = None
+            if last_news_id is not None and self.is_hierarchical(date, group_by):
+                child_list = self._collect_child_summaries(query, date, group_by, start_date, end_date)
+                if len(child_list) == 1:
+                    summary = {field: child_list[0][field] for field in SUMMARY_FIELDS}
+                elif child_list:
+                    chunks = LLMService().stream_reduce_summaries(
+                        child_list, search_keyword=query, is_overall=not bool(date)
+                    )
+
+            if summary is None and chunks is None:
+                news_data = ArticleSampler().sample(news_list) if last_news_id is not None else []
+                if not news_data:
+                    yield sse_event('done', EMPTY_SUMMARY)
+                    return
+                chunks = LLMService().stream_structured_summary(
+                    news_data, search_keyword=query, is_overall=not bool(date)
+                )
+
+            if chunks is not None:
+                reader = PartialJSONReader(SUMMARY_FIELDS)
+                for chunk in chunks:
+                    for field, text in reader.feed(chunk):
+                        yield sse_event('delta', {'field': field, 'text': text})
+                summary = reader.result()
+                if summary is None:
+                    raise ValueError('스트리밍 응답에서 요약 JSON을 읽지 못했습니다.')
+
+            self._save_summary(query, period_start, group_by, summary, last_news_id, not date, end_date)
+            yield sse_event('done', {**summary, 'cached': False})
+
+        except Exception as e:
+            print(f"요약 스트리밍 오류: {e}")
+            summary = None
+            yield sse_event('error', {'error': '요약 생성 중 오류가 발생했습니다.'})
+        finally:
+            flight.complete(flight_key, token, summary)
+
+    @staticmethod
+    def _summary_news(query: str, date: Optional[str], group_by: str,
+                      start_date: Optional[str], end_date: Optional[str]):
+        """요약 대상 뉴스 QuerySet과 그중 가장 큰 id (뉴스가 없으면 None)"""
+        news_list = get_news_filter(
+            query=query,
+            selected_date=date if not (start_date and end_date) else None,
+            start_date=start_date,
+            end_date=end_date,
+            group_by=group_by
+        )
+        return news_list, news_list.aggregate(last_id=Max('id'))['last_id']
+
+    @staticmethod
+    def _save_summary(query: str, period_start, group_by: str, summary: Dict, last_news_id,
+                      is_overall: bool = False, end_date: Optional[str] = None) -> None:
+        """기간이 있는 요약만 저장 - 전체 요약은 갱신할 때 같은 범위로 다시 조회하도록 끝 날짜도 저장"""
+        if not period_start:
+            return
+        try:
+            with transaction.atomic():
+                NewsSummary.objects.create(
+                    keyword=query,
+                    date=period_start,
+                    group_by=group_by,
+                    is_overall=is_overall,
+                    end_date=SummaryService._parse_date(end_date) if is_overall else None,
+                    background=summary['background'],
+                    core_content=summary['core_content'],
+                    conclusion=summary['conclusion'],
+                    last_news_id=last_news_id
+                )
+        except IntegrityError:
+            pass  # 다른 워커가 먼저 저장한 경우 (unique_together)
+
+    @staticmethod
+    def is_hierarchical(date: Optional[str], group_by: str) -> bool:
+        """주/월 기간 요약과 전체 요약은 하위 기간 요약으로 구성 (SUMMARY_HIERARCHICAL)"""
+        if not getattr(settings, 'SUMMARY_HIERARCHICAL', True):
+            return False
+        return not date or group_by in ('1week', '1month')
+
+    def _child_periods(self, query: str, date: Optional[str], group_by: str,
+                       start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, List]:
+        """상위 요약을 구성할 (하위 group_by, 뉴스가 있는 하위 기간 시작일 목록)
+
+        주/월 요약 -> 일별 요약, 전체 요약 -> 월별 요약(월별 요약은 다시 일별 요약으로 구성).
+        하위 기간이 너무 많으면 뉴스가 많은 기간부터 SUMMARY_HIERARCHY_MAX_CHILDREN개만 사용한다.
+        """
+        if date:
+            period_start = self.get_period_start(date, group_by)
+            range_start, range_end = DailyIssueService.get_period_range(period_start, group_by)
+            child_group_by = '1day'
+        else:
+            range_start, range_end = start_date, end_date
+            child_group_by = '1month'
+
+        counts = get_news_filter(
+            query=query,
+            group_by=child_group_by,
+            start_date=range_start,
+            end_date=range_end,
+            for_chart=True
+        )
+        max_children = getattr(settings, 'SUMMARY_HIERARCHY_MAX_CHILDREN', 31)
+        busiest = sorted(
+            [(DailyIssueService._as_date(item['period']), item['count']) for item in counts if item['count']],
+            key=lambda item: item[1],
+            reverse=True
+        )[:max_children]
+        return child_group_by, sorted(period for period, _ in busiest)
+
+    def _load_child_summaries(self, query: str, child_group_by: str, periods: List) -> Dict:
+        """이미 저장된 하위 요약 (일별은 NewsSummary가 없으면 호버 요약 DailySummary도 사용)"""
+        children = {
+            saved.date: {
+                'background': saved.background,
+                'core_content': saved.core_content,
+                'conclusion': saved.conclusion
+            }
+            for saved in NewsSummary.objects.filter(
+                keyword=query, group_by=child_group_by, date__in=periods, is_overall=False
+            )
+        }
+        if child_group_by == '1day':
+            missing = [period for period in periods if period not in children]
+            for daily in DailySummary.objects.filter(query=query, group_by='1day', date__in=missing):
+                children.setdefault(daily.date, {
+                    'background': '',
+                    'core_content': f"{daily.title_summary} - {daily.content_summary}",
+                    'conclusion': ''
+                })
+        return children
+
+    def _generate_hierarchical_summary(self, query: str, date: Optional[str], group_by: str,
+                                       start_date: Optional[str], end_date: Optional[str]) -> Optional[Dict]:
+        """하위 요약을 모아(map: 없는 것 일부만 병렬 생성) 하나의 3단 요약으로 합침(reduce)"""
+        child_list = self._collect_child_summaries(query, date, group_by, start_date, end_date)
+        if not child_list:
+            return None
+        if len(child_list) == 1:
+            return {field: child_list[0][field] for field in SUMMARY_FIELDS}
+        return LLMService().reduce_summaries(child_list, search_keyword=query, is_overall=not bool(date))
+
+    def _plan_children(self, query: str, date: Optional[str], group_by: str,
+                       start_date: Optional[str], end_date: Optional[str]) -> Optional[Tuple[str, Dict, List]]:
+        """계층 요약 계획 (하위 group_by, 저장된 하위 요약, 이번 요청에서 생성할 하위 기간)
+
+        없는 하위 요약을 요청 안에서 모두 만들면 요청 하나가 LLM을 수십 번 호출하게 되므로,
+        저장된 하위 요약이 SUMMARY_HIERARCHY_MIN_CACHED_RATIO 미만이고 없는 것이
+        SUMMARY_HIERARCHY_MAX_GENERATE개보다 많으면 None (기사 샘플 요약으로 대신함).
+        요청 안에서는 최대 SUMMARY_HIERARCHY_MAX_GENERATE개만 만들고, 작업 워커를 쓰는 설정이면
+        (SUMMARY_ASYNC_JOBS) 나머지는 요약 작업 큐에 등록해 다음 요청부터 계층 요약을 쓸 수 있게 한다.
+        """
+        child_group_by, periods = self._child_periods(query, date, group_by, start_date, end_date)
+        if not periods:
+            return None
+        children = self._load_child_summaries(query, child_group_by, periods)
+        missing = [period for period in periods if period not in children]
+
+        max_generate = getattr(settings, 'SUMMARY_HIERARCHY_MAX_GENERATE', 3)
+        min_cached_ratio = getattr(settings, 'SUMMARY_HIERARCHY_MIN_CACHED_RATIO', 0.8)
+        if len(missing) > max_generate and len(children) < len(periods) * min_cached_ratio:
+            self._enqueue_child_summaries(query, child_group_by, missing)
+            return None
+        self._enqueue_child_summaries(query, child_group_by, missing[max_generate:])
+        return child_group_by, children, missing[:max_generate]
+
+    @staticmethod
+    def _enqueue_child_summaries(query: str, child_group_by: str, periods: List) -> None:
+        """없는 하위 요약을 요약 작업으로 등록 (같은 작업이 대기/실행 중이면 새로 만들지 않음)
+
+        작업 워커가 없는 기본 설정(SUMMARY_ASYNC_JOBS=False)에서는 처리되지 않을 작업을 쌓지 않는다.
+        """
+        if not periods or not getattr(settings, 'SUMMARY_ASYNC_JOBS', False):
+            return
+        from .summary_job_service import SummaryJobService  # summary_job_service가 이 모듈을 import함
+
+        job_service = SummaryJobService()
+        try:
+            for period in periods:
+                job_service.enqueue(SummaryJob.KIND_SUMMARY, {
+                    'query': query,
+                    'date': period.strftime('%Y-%m-%d'),
+                    'group_by': child_group_by,
+                    'start_date': None,
+                    'end_date': None
+                })
+        except Exception as e:
+            print(f"하위 요약 작업 등록 오류 ({query}): {e}")
+
+    @staticmethod
+    def _usable_child(summary: Dict) -> Optional[Dict]:
+        """빈 요약과 생성 실패 요약은 상위 요약에 넣지 않음"""
+        if summary.get('is_empty') or summary.get('is_error'):
+            return None
+        return summary
+
+    def _collect_child_summaries(self, query: str, date: Optional[str], group_by: str,
+                                 start_date: Optional[str], end_date: Optional[str]) -> List[Dict]:
+        """상위 요약에 들어갈 하위 기간 요약 목록 (날짜순) - 빈 목록이면 기사 샘플 요약으로 대신함
+
+        요청 안에서 만드는 하위 요약은 다시 계층으로 나누지 않고 기사 샘플로 바로 생성한다.
+        """
+        plan = self._plan_children(query, date, group_by, start_date, end_date)
+        if plan is None:
+            return []
+        child_group_by, children, missing = plan
+
+        def generate(period):
+            try:
+                summary = self.generate_summary(
+                    query, period.strftime('%Y-%m-%d'), child_group_by, None, None, hierarchical=False
+                )
+                return period, self._usable_child(summary)
+            except Exception as e:
+                print(f"하위 요약 생성 오류 ({query}, {period}): {e}")
+                return period, None
+            finally:
+                connection.close()
+
+        if missing:
+            workers = getattr(settings, 'SUMMARY_HIERARCHY_WORKERS', 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for period, summary in executor.map(generate, missing):
+                    if summary:
+                        children[period] = summary
+
+        return self._child_list(children)
+
+    @staticmethod
+    def _child_list(children: Dict) -> List[Dict]:
+        return [
+            {
+                'period': period.strftime('%Y-%m-%d'),
+                'background': children[period]['background'],
+                'core_content': children[period]['core_content'],
+                'conclusion': children[period]['conclusion']
+            }
+            for period in sorted(children)
+        ]
+
+    async def agenerate_summary(self, query: str, date: Optional[str], group_by: str,
+                                start_date: Optional[str], end_date: Optional[str], hierarchical: bool = True) -> Dict:
+        """generate_summary의 비동기 버전 (DB 작업은 sync_to_async, LLM 호출은 AsyncOpenAI)"""
+        period_start = self.get_period_start(date, group_by, start_date)
+        return await SingleFlight('news_summary').arun(
+            self._summary_flight_key(query, date, group_by, start_date, end_date, period_start),
+            generate=lambda: self._agenerate_summary(
+                query, date, group_by, start_date, end_date, period_start, hierarchical
+            ),
+            fetch=(
+                lambda: sync_to_async(self.get_saved_summary)(query, period_start, group_by, not date)
+            ) if period_start else None
+        )
+
+    async def _agenerate_summary(self, query: str, date: Optional[str], group_by: str,
+                                 start_date: Optional[str], end_date: Optional[str], period_start,
+                                 hierarchical: bool = True) -> Dict:
+        news_list, last_news_id = await sync_to_async(self._summary_news)(query, date, group_by, start_date, end_date)
+
+        summary = None
+        if last_news_id is not None and hierarchical and self.is_hierarchical(date, group_by):
+            summary = await self._agenerate_hierarchical_summary(query, date, group_by, start_date, end_date)
+
+        if summary is None:
+            news_data = await sync_to_async(ArticleSampler().sample)(news_list) if last_news_id is not None else []
+            if not news_data:
+                return dict(EMPTY_SUMMARY)
+            summary = await AsyncLLMService().generate_structured_summary(
+                news_data,
+                search_keyword=query,
+                is_overall=not bool(date)
+            )
+
+        if not summary.get('is_error'):
+            await sync_to_async(self._save_summary)(
+                query, period_start, group_by, summary, last_news_id, not date, end_date
+            )
+        return summary
+
+    async def _agenerate_hierarchical_summary(self, query: str, date: Optional[str], group_by: str,
+                                              start_date: Optional[str], end_date: Optional[str]) -> Optional[Dict]:
+        """_generate_hierarchical_summary의 비동기 버전 - 없는 하위 요약은 asyncio.gather로 동시에 생성"""
+        plan = await sync_to_async(self._plan_children)(query, date, group_by, start_date, end_date)
+        if plan is None:
+            return None
+        child_group_by, children, missing = plan
+        semaphore = asyncio.Semaphore(getattr(settings, 'SUMMARY_HIERARCHY_WORKERS', 4))
+
+        async def generate(period):
+            async with semaphore:
+                try:
+                    summary = await self.agenerate_summary(
+                        query, period.strftime('%Y-%m-%d'), child_group_by, None, None, hierarchical=False
+                    )
+                    return period, self._usable_child(summary)
+                except Exception as e:
+                    print(f"하위 요약 생성 오류 ({query}, {period}): {e}")
+                    return period, None
+
+        for period, summary in await asyncio.gather(*(generate(period) for period in missing)):
+            if summary:
+                children[period] = summary
+
+        child_list = self._child_list(children)
+        if not child_list:
+            return None
+        if len(child_list) == 1:
+            return {field: child_list[0][field] for field in SUMMARY_FIELDS}
+        return await AsyncLLMService().reduce_summaries(child_list, search_keyword=query, is_overall=not bool(date))
+
+    def refresh_summary(self, query: str, period_start, group_by: str, is_overall: bool = False) -> bool:
+        """stale 3단 요약을 이전 요약 + 마지막 반영 이후의 새 기사만으로 갱신
+
+        전체 요약은 처음 생성할 때와 같은 날짜 범위(date~end_date)에서 새 기사를 찾는다.
+        """
+        saved = NewsSummary.objects.filter(
+            keyword=query, date=period_start, group_by=group_by, is_overall=is_overall
+        ).first()
+        if not saved or not saved.is_stale:
+            return False
+        # 갱신 중에 들어온 뉴스가 다시 stale로 표시할 수 있도록 먼저 해제
+        NewsSummary.objects.filter(pk=saved.pk).update(is_stale=False)
+
+        if saved.is_overall:
+            news_list = get_news_filter(query=query, start_date=saved.date, end_date=saved.end_date, group_by=group_by)
+        else:
+            news_list = get_news_filter(query=query, selected_date=period_start, group_by=group_by)
+        if saved.last_news_id:
+            news_list = news_list.filter(id__gt=saved.last_news_id)
+        last_news_id = news_list.aggregate(last_id=Max('id'))['last_id']
+        new_articles = ArticleSampler().sample(news_list)
+
+        if new_articles:
+            summary = LLMService().refresh_structured_summary(
+                {
+                    'background': saved.background,
+                    'core_content': saved.core_content,
+                    'conclusion': saved.conclusion
+                },
+                new_articles,
+                search_keyword=query
+            )
+            if summary is None:
+                NewsSummary.objects.filter(pk=saved.pk).update(is_stale=True)
+                return False
+            saved.background = summary['background']
+            saved.core_content = summary['core_content']
+            saved.conclusion = summary['conclusion']
+
+        saved.last_news_id = last_news_id or saved.last_news_id
+        saved.save(update_fields=['background', 'core_content', 'conclusion', 'last_news_id'])
+        return True
+
+    @classmethod
+    def get_saved_quick_summary(cls, query: str) -> Optional[Dict]:
+        """저장된 간단 요약 조회 (LRU/Redis 캐시 경유) - stale이면 그대로 반환하고 갱신은 백그라운드로"""
+        def load():
+            cached_summary = QuickSummary.objects.filter(keyword=query).first()
+            if not cached_summary:
+                return None
+            return {
+                'summary': cached_summary.summary,
+                'news_count': cached_summary.news_count,
+                'date_range': cached_summary.date_range,
+                'cached': True,
+                'stale': cached_summary.is_stale
+            }
+
+        cache_key = quick_summary_cache.make_key(query)
+        summary = quick_summary_cache.get_or_load(cache_key, load)
+        if summary and summary.get('stale'):
+            SummaryRefreshService.schedule('quick_summary', cache_key, lambda: cls().refresh_quick_summary(query))
+        return summary
+
+    def generate_quick_summary(self, query: str) -> Dict:
+        """같은 키워드의 간단 요약은 single-flight로 한 번만 생성"""
+        return SingleFlight('quick_summary').run(
+            query,
+            generate=lambda: self._generate_quick_summary(query),
+            fetch=lambda: self.get_saved_quick_summary(query)
+        )
+
+    async def agenerate_quick_summary(self, query: str) -> Dict:
+        """generate_quick_summary의 비동기 버전"""
+        return await SingleFlight('quick_summary').arun(
+            query,
+            generate=lambda: self._agenerate_quick_summary(query),
+            fetch=lambda: sync_to_async(self.get_saved_quick_summary)(query)
+        )
+
+    async def _agenerate_quick_summary(self, query: str) -> Dict:
+        inputs = await sync_to_async(self._quick_summary_inputs)(query)
+        if inputs is None:
+            return dict(EMPTY_QUICK_SUMMARY)
+        stats, date_range, news_data = inputs
+
+        result = await AsyncLLMService().generate_quick_summary(news_data, query)
+        if result.get('is_error'):
+            return result
+        return await sync_to_async(self._save_quick_summary)(query, result['summary'], stats, date_range)
+
+    def _generate_quick_summary(self, query: str) -> Dict:
+        """전체 기간 뉴스 중 시작/중간/최근 기사로 한 문장 요약을 생성하고 QuickSummary에 저장"""
+        inputs = self._quick_summary_inputs(query)
+        if inputs is None:
+            return dict(EMPTY_QUICK_SUMMARY)
+        stats, date_range, news_data = inputs
+
+        # LLM 서비스로 요약 생성
+        llm_service = LLMService()
+        result = llm_service.generate_quick_summary(news_data, query)
+        if result.get('is_error'):
+            return result  # 실패한 요약은 저장하지 않음
+        return self._save_quick_summary(query, result['summary'], stats, date_range)
+
+    def stream_quick_summary(self, query: str) -> Iterator[str]:
+        """generate_quick_summary의 SSE 버전 (이벤트 구성은 stream_summary와 같음)"""
+        saved_summary = self.get_saved_quick_summary(query)
+        if saved_summary:
+            yield sse_event('done', saved_summary)
+            return
+        yield sse_event('start', {'cached': False})
+
+        flight = SingleFlight('quick_summary')
+        token = flight.try_lead(query)
+        if token is None:
+            yield sse_event('done', self.generate_quick_summary(query))
+            return
+
+        response = None
+        try:
+            inputs = self._quick_summary_inputs(query)
+            if inputs is None:
+                yield sse_event('done', EMPTY_QUICK_SUMMARY)
+                return
+            stats, date_range, news_data = inputs
+
+            reader = PartialJSONReader(('summary',))
+            for chunk in LLMService().stream_quick_summary(news_data, query):
+                for field, text in reader.feed(chunk):
+                    yield sse_event('delta', {'field': field, 'text': text})
+            result = reader.result()
+            if result is None:
+                raise ValueError('스트리밍 응답에서 요약 JSON을 읽지 못했습니다.')
+
+            response = self._save_quick_summary(query, result['summary'], stats, date_range)
+            yield sse_event('done', response)
+
+        except Exception as e:
+            print(f"간단 요약 스트리밍 오류: {e}")
+            response = None
+            yield sse_event('error', {'error': '요약을 생성하는데 실패했습니다.'})
+        finally:
+            flight.complete(query, token, response)
+
+    @staticmethod
+    def _quick_summary_inputs(query: str) -> Optional[Tuple[Dict, str, List[Dict]]]:
+        """간단 요약 프롬프트 입력 (집계, 날짜 범위, 대표 뉴스) - 뉴스가 없으면 None"""
+        news_list = get_news_filter(query=query)
+
+        # 기간/건수는 한 번의 집계 쿼리로 (행을 메모리로 읽지 않음)
+        stats = news_list.aggregate(
+            first_date=Min('date'), last_date=Max('date'), total=Count('id'), last_id=Max('id')
+        )
+        total_news = stats['total']
+
+        if not total_news:
+            return None
+
+        # 날짜 범위 계산
+        date_range = f"{stats['first_date'].strftime('%Y-%m-%d')}~{stats['last_date'].strftime('%Y-%m-%d')}"
+
+        # 대표 뉴스 선택 (시작, 중간, 최근) - 제목/날짜/본문 앞 300자만 조회
+        samples = news_list.annotate(
+            content_prefix=Substr('content', 1, 300)  # 내용 길이 제한
+        ).values('title', 'date', 'content_prefix')
+        if total_news <= 5:
+            sample_news = list(samples)
+        else:
+            oldest_first = samples.order_by('date', 'id')
+            sample_news = [
+                oldest_first[0],
+                oldest_first[total_news // 2],
+                samples.order_by('-date', '-id')[0]
+            ]
+
+        news_data = [{
+            'title': news['title'],
+            'content': news['content_prefix'],
+            'date': news['date'].strftime('%Y-%m-%d')
+        } for news in sample_news]
+        return stats, date_range, news_data
+
+    @staticmethod
+    def _save_quick_summary(query: str, summary: str, stats: Dict, date_range: str) -> Dict:
+        # 요약 결과 저장 (keyword unique - 동시에 저장된 경우 무시)
+        try:
+            with transaction.atomic():
+                QuickSummary.objects.create(
+                    keyword=query,
+                    summary=summary,
+                    news_count=stats['total'],
+                    date_range=date_range,
+                    last_news_id=stats['last_id']
+                )
+        except IntegrityError:
+            pass
+
+        return {
+            'summary': summary,
+            'news_count': stats['total'],
+            'date_range': date_range,
+            'cached': False
+        }
+
+    def refresh_quick_summary(self, query: str) -> bool:
+        """stale 간단 요약을 이전 요약 + 마지막 반영 이후의 최근 기사(최대 5건)만으로 갱신"""
+        saved = QuickSummary.objects.filter(keyword=query).first()
+        if not saved or not saved.is_stale:
+            return False
+        QuickSummary.objects.filter(pk=saved.pk).update(is_stale=False)
+
+        news_list = get_news_filter(query=query)
+        stats = news_list.aggregate(
+            first_date=Min('date'), last_date=Max('date'), total=Count('id'), last_id=Max('id')
+        )
+        new_news = news_list.filter(id__gt=saved.last_news_id) if saved.last_news_id else news_list
+        samples = list(
+            new_news.annotate(content_prefix=Substr('content', 1, 300))
+            .values('title', 'date', 'content_prefix')
+            .order_by('-date', '-id')[:5]
+        )
+
+        if samples:
+            result = LLMService().refresh_quick_summary(
+                saved.summary,
+                [{
+                    'title': news['title'],
+                    'content': news['content_prefix'],
+                    'date': news['date'].strftime('%Y-%m-%d')
+                } for news in reversed(samples)],
+                query
+            )
+            if result is None:
+                QuickSummary.objects.filter(pk=saved.pk).update(is_stale=True)
+                return False
+            saved.summary = result['summary'][:100]
+
+        if stats['total']:
+            saved.news_count = stats['total']
+            saved.date_range = f"{stats['first_date'].strftime('%Y-%m-%d')}~{stats['last_date'].strftime('%Y-%m-%d')}"
+            saved.last_news_id = stats['last_id']
+        saved.save(update_fields=['summary', 'news_count', 'date_range', 'last_news_id', 'updated_at'])
+        return True
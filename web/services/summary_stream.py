@@ -0,0 +1,60 @@
+import json
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PARTIAL_ESCAPE_PATTERN = re.compile(r'\\u[0-9a-fA-F]{0,3}$')
+
+
+def sse_event(event: str, data: Dict) -> str:
+    """Server-Sent Events 한 건 (data는 한 줄 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+class PartialJSONReader:
+    """JSON 모드 스트리밍 응답에서 지정한 문자열 필드의 값을 도착하는 대로 추출
+
+    feed()는 필드별로 직전 호출 이후 새로 확정된 텍스트만 돌려주므로 화면에 이어 붙이면 되고,
+    스트림이 끝나면 result()가 전체 JSON을 파싱한 최종 결과(필드가 빠졌으면 None)를 돌려준다.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = list(fields)
+        self.buffer = ''
+        self.emitted = {field: 0 for field in self.fields}
+        self.patterns = {
+            field: re.compile(r'"%s"\s*:\s*"((?:[^"\\]|\\.)*)' % re.escape(field))
+            for field in self.fields
+        }
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        self.buffer += chunk
+        deltas = []
+        for field in self.fields:
+            value = self._partial_value(field)
+            if value is not None and len(value) > self.emitted[field]:
+                deltas.append((field, value[self.emitted[field]:]))
+                self.emitted[field] = len(value)
+        return deltas
+
+    def _partial_value(self, field: str) -> Optional[str]:
+        match = self.patterns[field].search(self.buffer)
+        if not match:
+            return None
+        raw = match.group(1)
+        try:
+            return json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            # \uXXXX 이스케이프가 조각 경계에서 잘린 경우 - 나머지가 도착하면 다음 feed에서 반영
+            try:
+                return json.loads(f'"{PARTIAL_ESCAPE_PATTERN.sub("", raw)}"')
+            except json.JSONDecodeError:
+                return None
+
+    def result(self) -> Optional[Dict]:
+        try:
+            parsed = json.loads(self.buffer)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(parsed, dict) or not all(parsed.get(field) for field in self.fields):
+            return None
+        return parsed
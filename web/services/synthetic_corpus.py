@@ -0,0 +1,166 @@
+import math
+import random
+from bisect import bisect_left
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 한국어 음절 조합 (초성/중성/종성) - 자주 쓰이는 자모 위주로 골라 실제 단어처럼 보이게 함
+CHOSEONG = [0, 2, 3, 5, 6, 7, 9, 11, 12, 14, 15, 16, 17, 18]
+JUNGSEONG = [0, 1, 4, 6, 8, 12, 13, 17, 18, 20]
+JONGSEONG = [0, 0, 0, 4, 8, 16, 17, 19, 21]
+
+PRESSES = [
+    '연합뉴스', '뉴시스', '뉴스1', '한국경제', '매일경제', '조선일보', '중앙일보', '동아일보', '한겨레',
+    '경향신문', '서울신문', '국민일보', '세계일보', '한국일보', '머니투데이', '이데일리', '아시아경제',
+    '파이낸셜뉴스', '헤럴드경제', '전자신문', 'KBS', 'MBC', 'SBS', 'YTN', 'JTBC'
+]
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+# 조사 (받침이 있을 때, 없을 때)
+PARTICLES = [('은', '는'), ('이', '가'), ('을', '를'), ('과', '와'), ('으로', '로'),
+             ('의', '의'), ('에', '에'), ('에서', '에서'), ('도', '도')]
+PREDICATES = [
+    '밝혔다', '전했다', '발표했다', '강조했다', '지적했다', '설명했다', '예정이다', '전망이다',
+    '나타났다', '확인됐다', '추진한다', '논의했다', '우려된다', '요구했다', '결정했다'
+]
+TITLE_ENDINGS = ['…', '', '', ' 논란', ' 가속', ' 본격화', ' 총력', ' 비상', ' 촉각', ' 급물살']
+LINK_PREFIX = 'https://synthetic.issuebeat.local'
+
+
+def zipf_weights(size: int, exponent: float) -> List[float]:
+    """순위 r의 가중치가 1 / r^exponent 인 누적 가중치 (random.choices의 cum_weights용)"""
+    return list(accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+
+
+class SyntheticCorpus:
+    """벤치마크용 합성 뉴스 코퍼스 (News 행 dict를 생성, seed가 같으면 같은 코퍼스)
+
+    - 어휘: 한국어 음절로 만든 2~4음절 명사 + 조사/서술어로 문장 구성
+    - 키워드 인기도: Zipf 분포 (소수 키워드가 대부분의 기사를 차지)
+    - 날짜: 키워드마다 몇 개의 이슈 시점(burst)이 있고, 기사 대부분이 그 주변(지수 감쇠)에 몰림
+    - 기사 일부는 같은 이슈의 재배포 기사(제목/본문 일부만 다름)라 유사 기사 클러스터도 만들어짐
+    """
+
+    def __init__(self, seed: int = 0, keywords: int = 5000, vocabulary: int = 30000,
+                 end_date: Optional[date] = None, days: int = 730, zipf_exponent: float = 1.1,
+                 burst_ratio: float = 0.7, burst_days: float = 3.0, duplicate_rate: float = 0.2,
+                 content_words: int = 120):
+        self.seed = seed
+        self.end_date = end_date or date.today()
+        self.days = days
+        self.burst_ratio = burst_ratio
+        self.burst_days = burst_days
+        self.duplicate_rate = duplicate_rate
+        self.content_words = content_words
+
+        rng = random.Random(f"corpus:{seed}")
+        self.vocabulary = self._build_vocabulary(rng, vocabulary)
+        self.vocabulary_weights = zipf_weights(len(self.vocabulary), 1.0)
+        self.keywords = self._build_keywords(rng, keywords)
+        self.keyword_weights = zipf_weights(len(self.keywords), zipf_exponent)
+        # 인기 키워드일수록 이슈 시점이 많음
+        self.bursts = [
+            sorted(rng.randrange(days) for _ in range(max(1, round(8 / rank ** 0.3))))
+            for rank in range(1, len(self.keywords) + 1)
+        ]
+
+    @staticmethod
+    def _syllable(rng: random.Random) -> str:
+        return chr(
+            0xAC00 + (rng.choice(CHOSEONG) * 21 + rng.choice(JUNGSEONG)) * 28 + rng.choice(JONGSEONG)
+        )
+
+    def _build_vocabulary(self, rng: random.Random, size: int) -> List[str]:
+        words = set()
+        while len(words) < size:
+            words.add(''.join(self._syllable(rng) for _ in range(rng.choice((2, 2, 2, 3, 3, 4)))))
+        # set 순회 순서는 프로세스마다(해시 시드) 달라지므로 정렬한 뒤 섞어야 같은 시드에서 같은 어휘가 나옴
+        words = sorted(words)
+        rng.shuffle(words)
+        return words
+
+    def _build_keywords(self, rng: random.Random, size: int) -> List[str]:
+        """키워드는 어휘와 겹치지 않는 2~3음절 단어 (일부는 '단어+단어' 복합어)"""
+        vocabulary = set(self.vocabulary)
+        keywords = []
+        seen = set()
+        while len(keywords) < size:
+            keyword = ''.join(self._syllable(rng) for _ in range(rng.choice((2, 3, 3))))
+            if rng.random() < 0.15:
+                keyword += ''.join(self._syllable(rng) for _ in range(2))
+            if keyword not in vocabulary and keyword not in seen:
+                seen.add(keyword)
+                keywords.append(keyword)
+        return keywords
+
+    def keyword_rank(self, rng: random.Random) -> int:
+        return bisect_left(self.keyword_weights, rng.random() * self.keyword_weights[-1])
+
+    def article_date(self, rng: random.Random, rank: int) -> date:
+        if rng.random() < self.burst_ratio:
+            offset = rng.choice(self.bursts[rank]) + int(rng.expovariate(1 / self.burst_days))
+        else:
+            offset = rng.randrange(self.days)
+        return self.end_date - timedelta(days=min(offset, self.days - 1))
+
+    @staticmethod
+    def _attach_particle(rng: random.Random, word: str) -> str:
+        with_final, without_final = rng.choice(PARTICLES)
+        has_final = (ord(word[-1]) - 0xAC00) % 28 != 0
+        return word + (with_final if has_final else without_final)
+
+    def _words(self, rng: random.Random, count: int) -> List[str]:
+        return rng.choices(self.vocabulary, cum_weights=self.vocabulary_weights, k=count)
+
+    def _sentence(self, rng: random.Random, keywords: List[str]) -> str:
+        words = self._words(rng, rng.randint(4, 9))
+        if keywords and rng.random() < 0.5:
+            words[rng.randrange(len(words))] = rng.choice(keywords)
+        parts = [self._attach_particle(rng, word) if rng.random() < 0.6 else word for word in words]
+        return ' '.join(parts) + ' ' + rng.choice(PREDICATES) + '.'
+
+    def _story(self, story_id: int, rank: int) -> Tuple[str, str, List[str]]:
+        """이슈(원문 기사) 하나의 제목, 본문, 키워드"""
+        rng = random.Random(f"story:{self.seed}:{story_id}")
+        keywords = [self.keywords[rank]]
+        for _ in range(rng.choice((0, 1, 1, 2, 3))):
+            related = self.keywords[self.keyword_rank(rng)]
+            if related not in keywords:
+                keywords.append(related)
+        title = f"{keywords[0]} {' '.join(self._words(rng, rng.randint(3, 6)))}{rng.choice(TITLE_ENDINGS)}"
+        target = max(10, int(rng.lognormvariate(math.log(self.content_words), 0.5)))
+        sentences = []
+        length = 0
+        while length < target:
+            sentence = self._sentence(rng, keywords)
+            sentences.append(sentence)
+            length += sentence.count(' ') + 1
+        return title[:100], ' '.join(sentences), keywords
+
+    def rows(self, count: int, start: int = 0) -> Iterator[Dict]:
+        """News 행 dict를 count개 생성 (start부터 번호를 매기므로 이어서 생성 가능)"""
+        for index in range(start, start + count):
+            rng = random.Random(f"article:{self.seed}:{index}")
+            story_id = index
+            if index and rng.random() < self.duplicate_rate:
+                # 최근 기사 중 하나를 다른 언론사가 재배포
+                story_id = rng.randrange(max(0, index - 1000), index)
+            story_rng = random.Random(f"rank:{self.seed}:{story_id}")
+            rank = self.keyword_rank(story_rng)
+            title, content, keywords = self._story(story_id, rank)
+            press = rng.choice(PRESSES)
+            if story_id != index:
+                title = f"[{press}] {title}"[:100]
+                sentences = content.split('. ')
+                content = '. '.join(sentences[:max(1, len(sentences) - rng.randint(0, 2))]).rstrip('.') + '.'
+
+            yield {
+                'date': self.article_date(story_rng, rank).isoformat(),
+                'title': title,
+                'press': press,
+                'author': f"{rng.choice(SURNAMES)}{''.join(self._syllable(rng) for _ in range(2))} 기자",
+                'content': content,
+                'keyword': ','.join(keywords),
+                'image': '',
+                'link': f"{LINK_PREFIX}/{self.seed}/{index}",
+            }
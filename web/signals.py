@@ -0,0 +1,140 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, pre_save, pre_delete, post_delete
+from django.dispatch import receiver
+from .models import News, NewsSummary, DailySummary, QuickSummary
+from .services.cache_service import news_summary_cache, quick_summary_cache, daily_summary_cache
+from .services.daily_issue_service import DailyIssueService
+from .services.keyword_index_service import KeywordIndexService
+from .services.metrics import record_query
+from .services.rollup_service import NewsRollupService
+from .services.search_engine import get_loaded_search_engine
+from .services.story_cluster_service import StoryClusterService
+from .services.summary_refresh_service import SummaryRefreshService
+
+
+@receiver(pre_save, sender=News)
+def fill_link_hash(sender, instance, **kwargs):
+    """link 중복 방지 해시 갱신 (마이그레이션에서 중복 link로 비워 둔 기존 행은 그대로 둠)"""
+    if instance.link and (instance.pk is None or instance.link_hash):
+        instance.link_hash = News.hash_link(instance.link)
+
+
+@receiver(pre_save, sender=News)
+def capture_previous_rollup(sender, instance, update_fields=None, **kwargs):
+    """수정 전 posting/날짜 기준의 집계 차감량을 저장해 둠"""
+    if not instance.pk or not NewsRollupService.is_enabled():
+        return
+    if update_fields is not None and not {'keyword', 'date'} & set(update_fields):
+        return
+    previous = News.objects.filter(pk=instance.pk).only('id', 'date').first()
+    if previous is not None:
+        instance._previous_rollup_deltas = NewsRollupService().collect_deltas([previous], sign=-1)
+
+
+@receiver(post_save, sender=News)
+def sync_keyword_index(sender, instance, created, update_fields=None, **kwargs):
+    """뉴스 저장 시 키워드 색인 동기화"""
+    if not KeywordIndexService.is_enabled():
+        return
+    if update_fields is not None and not {'keyword', 'date'} & set(update_fields):
+        return
+
+    service = KeywordIndexService()
+    if created:
+        service.index_batch([instance])
+    else:
+        service.index_news(instance)
+
+
+@receiver(post_save, sender=News)
+def sync_news_rollup(sender, instance, created, update_fields=None, **kwargs):
+    """뉴스 저장 시 일별 집계 동기화 (색인이 갱신된 뒤에 실행되도록 sync_keyword_index 다음에 연결)"""
+    if not NewsRollupService.is_enabled():
+        return
+    if update_fields is not None and not {'keyword', 'date'} & set(update_fields):
+        return
+
+    service = NewsRollupService()
+    deltas = service.collect_deltas([instance])
+    deltas.update(getattr(instance, '_previous_rollup_deltas', {}))
+    instance._previous_rollup_deltas = {}
+    service.apply_deltas(deltas)
+
+
+@receiver(pre_delete, sender=News)
+def remove_from_rollup(sender, instance, **kwargs):
+    """posting이 cascade 삭제되기 전에 집계에서 차감"""
+    if NewsRollupService.is_enabled():
+        service = NewsRollupService()
+        service.apply_deltas(service.collect_deltas([instance], sign=-1))
+
+
+@receiver(post_save, sender=News)
+def sync_search_engine(sender, instance, update_fields=None, **kwargs):
+    """이 프로세스에 로드된 전문 검색 엔진에 추가/수정된 뉴스를 커밋 후 반영
+
+    다른 프로세스의 엔진과 파일 색인은 build_search_index로 다시 만들어야 갱신된다.
+    """
+    engine = get_loaded_search_engine()
+    if engine is None:
+        return
+    if update_fields is not None and not {'title', 'content', 'date'} & set(update_fields):
+        return
+    transaction.on_commit(
+        lambda: engine.add_document(instance.id, instance.title, instance.content, instance.date)
+    )
+
+
+@receiver(post_delete, sender=News)
+def remove_from_search_engine(sender, instance, **kwargs):
+    engine = get_loaded_search_engine()
+    if engine is not None:
+        news_id = instance.id
+        transaction.on_commit(lambda: engine.remove_document(news_id))
+
+
+@receiver(post_save, sender=News)
+def assign_story_cluster(sender, instance, created, **kwargs):
+    """새 뉴스를 유사 기사 클러스터에 배정 (기존 뉴스는 assign_story_clusters로 일괄 배정)"""
+    if created and StoryClusterService.is_enabled():
+        instance.story_cluster = StoryClusterService().assign([instance])[instance.id]
+
+
+@receiver(post_save, sender=News)
+def mark_summaries_stale(sender, instance, update_fields=None, **kwargs):
+    """뉴스가 추가/수정된 (검색어, 기간)의 요약만 stale로 표시 - 조회 시 백그라운드로 갱신"""
+    if update_fields is not None and not {'keyword', 'date', 'title', 'content'} & set(update_fields):
+        return
+    SummaryRefreshService.mark_stale_on_commit(instance)
+
+
+@receiver(post_save, sender=NewsSummary)
+@receiver(post_delete, sender=NewsSummary)
+def invalidate_news_summary_cache(sender, instance, **kwargs):
+    news_summary_cache.invalidate(
+        news_summary_cache.make_key(instance.keyword, instance.date, instance.group_by, instance.is_overall)
+    )
+
+
+@receiver(post_save, sender=QuickSummary)
+@receiver(post_delete, sender=QuickSummary)
+def invalidate_quick_summary_cache(sender, instance, **kwargs):
+    quick_summary_cache.invalidate(quick_summary_cache.make_key(instance.keyword))
+
+
+@receiver(post_save, sender=DailySummary)
+@receiver(post_delete, sender=DailySummary)
+def invalidate_daily_summary_cache(sender, instance, **kwargs):
+    period_start, period_end = DailyIssueService.get_period_range(instance.date, instance.group_by)
+    daily_summary_cache.invalidate(
+        daily_summary_cache.make_key(instance.query, instance.group_by, period_start, period_end)
+    )
+
+
+@receiver(connection_created)
+def install_query_metrics(sender, connection, **kwargs):
+    """DB 연결마다 SQL 쿼리 수/시간 기록용 execute wrapper 설치 (재연결 시 중복 설치 방지)"""
+    if getattr(settings, 'METRICS_ENABLED', True) and record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
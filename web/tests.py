@@ -1,3 +1,860 @@
-from django.test import TestCase
+import os
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from unittest import mock
+import httpx
+import openai
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from .models import (
+    News, Keyword, KeywordDailyCount, SearchHistory, NewsSummary, DailySummary, QuickSummary, SummaryJob
+)
+from .services.autocomplete_service import AutocompleteService
+from .services.news_filter import get_news_filter
+from .services.keyword_index_service import KeywordIndexService
+from .services.news_ingest_service import NewsIngestService
+from .services.rollup_service import NewsRollupService
+from .services.search_counter_service import SearchCounter
+from .services.search_engine import NGramSearchEngine
+from .services.single_flight import SingleFlight
+from .services.llm_backends import LLMBackend
+from .services.llm_client import LLMClient
+from .services.llm_service import LLMService
+from .services.summary_service import SummaryService
+from .services.summary_job_service import SummaryJobService
+from .services.summary_refresh_service import SummaryRefreshService
+from .services.daily_issue_service import DailyIssueService
+from .services.story_cluster_service import StoryClusterService
 
-# Create your tests here.
+START = date(2025, 1, 1)
+END = date(2025, 12, 31)
+
+
+def create_news(day, keyword, title='제목', link=None, content='본문'):
+    return News.objects.create(
+        date=day,
+        title=title,
+        press='언론사',
+        author='기자',
+        content=content,
+        keyword=keyword,
+        image='',
+        link=link or f'https://news.example.com/{News.objects.count()}/{keyword}/{day}'
+    )
+
+
+def news_ids(**kwargs):
+    return list(get_news_filter(start_date=START, end_date=END, **kwargs).values_list('id', flat=True))
+
+
+def chart_rows(**kwargs):
+    rows = get_news_filter(start_date=START, end_date=END, for_chart=True, **kwargs)
+    return [(row['period'], row['count']) for row in rows if row['count']]
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=True, NEWS_ROLLUP_ENABLED=False, STORY_CLUSTER_ENABLED=False)
+class KeywordIndexParityTests(TestCase):
+    """키워드 색인 검색 결과가 LIKE 검색과 같아야 함"""
+
+    QUERIES = ['삼성', '전자', '반도체', 'lg', 'LG전자', '삼성 바', '전자,반', '없는키워드', '성전']
+
+    @classmethod
+    def setUpTestData(cls):
+        create_news(date(2025, 3, 1), '삼성전자,반도체')
+        create_news(date(2025, 3, 2), '삼성 바이오')
+        create_news(date(2025, 3, 2), 'LG전자, 배터리')
+        create_news(date(2025, 4, 5), '반도체,수출,삼성전자')
+        create_news(date(2024, 12, 31), '삼성전자')  # 기간 밖
+
+    def test_lookup_matches_like(self):
+        self.assertTrue(KeywordIndexService.lookup('삼성'))
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                indexed = news_ids(query=query)
+                with override_settings(KEYWORD_INDEX_ENABLED=False):
+                    like = news_ids(query=query)
+                self.assertEqual(indexed, like)
+
+    def test_chart_matches_like(self):
+        for group_by in ('1day', '1week', '1month'):
+            with self.subTest(group_by=group_by):
+                indexed = chart_rows(query='삼성', group_by=group_by)
+                with override_settings(KEYWORD_INDEX_ENABLED=False):
+                    like = chart_rows(query='삼성', group_by=group_by)
+                self.assertEqual(indexed, like)
+
+    def test_separator_query_falls_back_to_like(self):
+        self.assertIsNone(KeywordIndexService.lookup('삼성 바'))
+        self.assertEqual(len(news_ids(query='삼성 바')), 1)
+
+    def test_reindex_on_keyword_change(self):
+        news = News.objects.get(keyword='삼성 바이오')
+        news.keyword = '현대차'
+        news.save()
+        self.assertNotIn(news.id, news_ids(query='바이오'))
+        self.assertIn(news.id, news_ids(query='현대'))
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=True, NEWS_ROLLUP_ENABLED=True, STORY_CLUSTER_ENABLED=False)
+class NewsRollupTests(TestCase):
+    """일별 집계(KeywordDailyCount)가 저장/수정/삭제 후에도 원본 건수와 같아야 함"""
+
+    def assertRollupMatchesLive(self):
+        service = NewsRollupService()
+        for keyword_id in Keyword.objects.values_list('id', flat=True):
+            self.assertEqual(service.diff(keyword_id), {})
+
+    def test_save_update_delete(self):
+        first = create_news(date(2025, 5, 1), '금리,물가')
+        create_news(date(2025, 5, 1), '금리')
+        third = create_news(date(2025, 5, 20), '금리,환율')
+        self.assertRollupMatchesLive()
+
+        first.keyword = '환율'
+        first.save()
+        self.assertRollupMatchesLive()
+
+        third.date = date(2025, 6, 3)
+        third.save()
+        self.assertRollupMatchesLive()
+
+        third.delete()
+        self.assertRollupMatchesLive()
+
+    def test_chart_matches_live_counts(self):
+        for day in (date(2025, 5, 1), date(2025, 5, 1), date(2025, 5, 8), date(2025, 7, 1)):
+            create_news(day, '금리')
+        self.assertEqual(KeywordDailyCount.objects.filter(keyword__name='금리').count(), 3)
+        for group_by in ('1day', '1week', '1month'):
+            with self.subTest(group_by=group_by):
+                rolled_up = chart_rows(query='금리', group_by=group_by)
+                with override_settings(NEWS_ROLLUP_ENABLED=False):
+                    live = chart_rows(query='금리', group_by=group_by)
+                self.assertEqual(rolled_up, live)
+
+    def test_chart_counts_exact_keyword_when_query_matches_several(self):
+        create_news(date(2025, 5, 1), '삼성')
+        create_news(date(2025, 5, 1), '삼성,삼성전자')  # 부분 일치 키워드 두 개를 가진 기사
+        create_news(date(2025, 5, 2), '삼성전자')
+        self.assertEqual(len(KeywordIndexService.lookup('삼성')), 2)
+
+        with mock.patch.object(NewsRollupService, 'chart_counts', wraps=NewsRollupService().chart_counts) as chart_counts:
+            rolled_up = chart_rows(query='삼성')
+        self.assertEqual(chart_counts.call_args.args[0], Keyword.objects.get(name='삼성').id)
+        self.assertEqual(rolled_up, [(date(2025, 5, 1), 2)])
+
+        # 목록은 그대로 부분 일치, 정확히 같은 키워드가 없으면 차트도 원본에서 중복 없이 센다
+        self.assertEqual(len(news_ids(query='삼성')), 3)
+        self.assertEqual(chart_rows(query='성전'), [(date(2025, 5, 1), 1), (date(2025, 5, 2), 1)])
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=False, NEWS_ROLLUP_ENABLED=False, STORY_CLUSTER_ENABLED=False,
+                   SUMMARY_REFRESH_ENABLED=False, AUTOCOMPLETE_TITLE_WORD_STARTS=True)
+class AutocompleteIndexTests(TestCase):
+    """자동완성 색인은 기본 설정에서도 키워드를 포함하고 제목은 어절 시작으로도 찾음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_news(date(2025, 3, 1), '반도체,수출', title='삼성전자 반도체 수출 증가')
+        create_news(date(2025, 3, 2), '반도체', title='반도체 업황 회복')
+        SearchHistory.objects.create(keyword='반도체 전망', count=1)
+
+    def test_keywords_without_keyword_index(self):
+        index = AutocompleteService.build_index()
+        self.assertEqual(index.complete('반도', limit=1), ['반도체 전망'])
+        self.assertIn('반도체', index.complete('반도'))
+        self.assertIn('수출', index.complete('ㅅㅊ'))
+
+    @override_settings(KEYWORD_INDEX_ENABLED=True)
+    def test_keywords_from_keyword_table(self):
+        KeywordIndexService().index_batch(News.objects.all())
+        self.assertEqual(AutocompleteService.build_index().scores['반도체'], 2)
+
+    def test_title_matches_from_word_start(self):
+        index = AutocompleteService.build_index()
+        self.assertIn('삼성전자 반도체 수출 증가', index.complete('반도체 수', limit=10))
+        self.assertIn('삼성전자 반도체 수출 증가', index.complete('수출 증'))
+        self.assertEqual(index.complete('업황'), ['반도체 업황 회복'])
+        with override_settings(AUTOCOMPLETE_TITLE_WORD_STARTS=False):
+            self.assertEqual(AutocompleteService.build_index().complete('업황'), [])
+
+
+@override_settings(STORY_CLUSTER_ENABLED=False, NEWS_PAGE_SIZE_MAX=100)
+class NewsCursorPaginationTests(TestCase):
+    """뉴스 목록 API의 커서 페이지네이션과 페이지 파라미터 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # 같은 날짜가 여러 건이어도 (date, id) 순서로 빠짐없이 이어져야 함
+        for offset in (0, 0, 0, 1, 1, 2, 3):
+            create_news(date(2025, 8, 10) - timedelta(days=offset), '페이지')
+
+    def get(self, **params):
+        params = {'query': '페이지', 'start_date': '2025-01-01', 'end_date': '2025-12-31', **params}
+        return self.client.get(reverse('web:get_news_api'), params)
+
+    def test_cursor_walks_every_item_once(self):
+        expected = list(News.objects.order_by('-date', '-id').values_list('id', flat=True))
+        seen = []
+        cursor = ''
+        for _ in range(10):
+            response = self.get(cursor=cursor, page_size=3, fields='id')
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            seen.extend(item['id'] for item in data['news_list'])
+            if not data['has_next']:
+                self.assertIsNone(data['next_cursor'])
+                break
+            cursor = data['next_cursor']
+        self.assertEqual(seen, expected)
+
+    def test_exact_last_page_has_no_next(self):
+        response = self.get(cursor='', page_size=7)
+        data = response.json()
+        self.assertEqual(len(data['news_list']), 7)
+        self.assertFalse(data['has_next'])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_empty_result(self):
+        data = self.get(cursor='', query='없는키워드').json()
+        self.assertEqual(data['news_list'], [])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_invalid_page_params(self):
+        for params in ({'page_size': 0}, {'page_size': -1}, {'page': 0}, {'page_size': 'abc'},
+                       {'page_size': 0, 'cursor': ''}):
+            with self.subTest(params=params):
+                self.assertEqual(self.get(**params).status_code, 400)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.get(cursor='잘못된커서').status_code, 400)
+
+    @override_settings(NEWS_PAGE_SIZE_MAX=2)
+    def test_page_size_is_capped(self):
+        data = self.get(cursor='', page_size=50).json()
+        self.assertEqual(len(data['news_list']), 2)
+        self.assertTrue(data['has_next'])
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=True, NEWS_ROLLUP_ENABLED=True, STORY_CLUSTER_ENABLED=False)
+class NewsIngestTests(TestCase):
+    """같은 파일을 다시 적재해도 뉴스와 집계가 중복되지 않아야 함"""
+
+    ROWS = [
+        {'date': '2025.09.01', 'title': '기사1', 'keyword': ['태풍', '피해'], 'link': 'https://a.example.com/1'},
+        {'date': '20250902', 'title': '기사2', 'keyword': '태풍', 'link': 'https://a.example.com/2'},
+        {'date': '2025-09-02T09:00:00', 'title': '기사2 중복', 'keyword': '태풍', 'link': 'https://a.example.com/2'},
+        {'date': '2025-09-03', 'title': '', 'keyword': '태풍', 'link': 'https://a.example.com/3'},
+    ]
+
+    def ingest(self):
+        service = NewsIngestService(batch_size=2)
+        for _ in service.ingest(service.normalize(self.ROWS)):
+            pass
+        return service.stats
+
+    def test_ingest_twice(self):
+        first = self.ingest()
+        self.assertEqual((first['created'], first['duplicates'], first['invalid']), (2, 1, 1))
+
+        second = self.ingest()
+        self.assertEqual((second['created'], second['duplicates']), (0, 3))
+        self.assertEqual(News.objects.count(), 2)
+
+        keyword = Keyword.objects.get(name='태풍')
+        self.assertEqual(keyword.news.count(), 2)
+        self.assertEqual(NewsRollupService().diff(keyword.id), {})
+
+    def test_search_engine_updated_only_after_commit(self):
+        engine = NGramSearchEngine()
+        with mock.patch('web.services.news_ingest_service.get_loaded_search_engine', return_value=engine):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.ingest()
+                self.assertEqual(len(engine), 0)
+            self.assertEqual(len(engine), 2)
+
+            # 롤백된 배치는 엔진에 남지 않음
+            rows = [{'date': '2025-09-04', 'title': '기사4', 'keyword': '태풍', 'link': 'https://a.example.com/4'}]
+            service = NewsIngestService(batch_size=2)
+            with self.captureOnCommitCallbacks(execute=True), \
+                    mock.patch.object(SummaryRefreshService, 'mark_stale', side_effect=RuntimeError('실패')):
+                with self.assertRaises(RuntimeError):
+                    for _ in service.ingest(service.normalize(rows)):
+                        pass
+            self.assertEqual(len(engine), 2)
+            self.assertEqual(engine.search_ids('기사4'), [])
+
+
+@override_settings(STORY_CLUSTER_ENABLED=False)
+class StoryCollapseTests(TestCase):
+    """collapse=1 목록은 필터 결과 안에서 스토리별 첫 기사를 남겨야 함"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.story = [
+            create_news(date(2024, 12, 30), '지진'),       # 스토리 첫 기사 (기간 밖)
+            create_news(date(2025, 2, 1), '지진,여진'),
+            create_news(date(2025, 2, 2), '지진,여진'),
+        ]
+        cls.other_story = [
+            create_news(date(2025, 2, 3), '폭설'),         # 검색어와 무관한 첫 기사
+            create_news(date(2025, 2, 4), '폭설,지진'),
+        ]
+        cls.unclustered = create_news(date(2025, 2, 5), '지진')
+        News.objects.filter(id__in=[news.id for news in cls.story]).update(story_cluster=cls.story[0].id)
+        News.objects.filter(id__in=[news.id for news in cls.other_story]).update(story_cluster=cls.other_story[0].id)
+
+    def test_collapse_under_date_and_query_filter(self):
+        collapsed = news_ids(query='지진', collapse_duplicates=True)
+        self.assertCountEqual(collapsed, [self.story[1].id, self.other_story[1].id, self.unclustered.id])
+
+    def test_collapse_under_selected_date(self):
+        collapsed = list(
+            get_news_filter(query='여진', selected_date='2025-02-02', collapse_duplicates=True)
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(collapsed, [self.story[2].id])
+
+    def test_collapse_keeps_story_leader_when_in_range(self):
+        queryset = News.objects.filter(story_cluster=self.story[0].id)
+        self.assertEqual(list(StoryClusterService.collapse(queryset).values_list('id', flat=True)), [self.story[0].id])
+
+
+class SearchCounterTests(TestCase):
+    """검색 횟수 반영은 기존 행에 합산되고 키워드 행을 중복으로 만들지 않아야 함"""
+
+    def test_apply_merges_increments(self):
+        SearchCounter.apply({'날씨': 2, '환율': 1})
+        SearchCounter.apply({'날씨': 3, '주가': 1})
+        counts = dict(SearchHistory.objects.values_list('keyword', 'count'))
+        self.assertEqual(counts, {'날씨': 5, '환율': 1, '주가': 1})
+
+    @override_settings(SEARCH_COUNTER_BUFFERED=True)
+    def test_flush_merges_buffered_records(self):
+        counter = SearchCounter()
+        with mock.patch.object(SearchCounter, '_start_flusher'):
+            for keyword in ('날씨', '날씨', '환율'):
+                counter.record(keyword)
+            self.assertEqual(counter.flush(), 3)
+            counter.record('날씨')
+            self.assertEqual(counter.flush(), 1)
+        self.assertEqual(counter.flush(), 0)
+        self.assertEqual(SearchHistory.objects.filter(keyword='날씨').count(), 1)
+        self.assertEqual(SearchHistory.objects.get(keyword='날씨').count, 3)
+
+    @override_settings(SEARCH_COUNTER_BUFFERED=True)
+    def test_failed_flush_keeps_increments(self):
+        counter = SearchCounter()
+        with mock.patch.object(SearchCounter, '_start_flusher'):
+            counter.record('날씨')
+            with mock.patch.object(SearchCounter, 'apply', side_effect=RuntimeError('db down')):
+                self.assertEqual(counter.flush(), 0)
+            counter.record('날씨')
+            self.assertEqual(counter.flush(), 2)
+        self.assertEqual(SearchHistory.objects.get(keyword='날씨').count, 2)
+
+
+class SingleFlightTests(SimpleTestCase):
+    """같은 키의 생성은 한 번만, 생성 실패 결과는 공유하지 않아야 함"""
+
+    ERROR = {'summary': '요약 생성 중 오류가 발생했습니다.', 'is_error': True}
+
+    def setUp(self):
+        cache.clear()
+        self.flight = SingleFlight('test', wait_seconds=5, poll_interval=0.01)
+
+    def test_result_is_shared(self):
+        self.assertEqual(self.flight.run('key', generate=lambda: {'summary': '첫 요약'}), {'summary': '첫 요약'})
+        self.assertEqual(self.flight.run('key', generate=lambda: {'summary': '다른 요약'}), {'summary': '첫 요약'})
+
+    def test_failed_leader_is_not_cached(self):
+        self.assertEqual(self.flight.run('key', generate=lambda: dict(self.ERROR)), self.ERROR)
+        self.assertEqual(self.flight.run('key', generate=lambda: {'summary': '재시도'}), {'summary': '재시도'})
+
+    def test_waiter_retries_after_failed_leader(self):
+        leader_started = threading.Event()
+        release_leader = threading.Event()
+        calls = []
+
+        def failing_generate():
+            calls.append('leader')
+            leader_started.set()
+            release_leader.wait(5)
+            return dict(self.ERROR)
+
+        def succeeding_generate():
+            calls.append('waiter')
+            return {'summary': '재시도'}
+
+        results = {}
+        leader = threading.Thread(target=lambda: results.setdefault(
+            'leader', self.flight.run('key', generate=failing_generate)))
+        leader.start()
+        leader_started.wait(5)
+        waiter = threading.Thread(target=lambda: results.setdefault(
+            'waiter', self.flight.run('key', generate=succeeding_generate)))
+        waiter.start()
+        release_leader.set()
+        leader.join(5)
+        waiter.join(5)
+
+        self.assertEqual(calls, ['leader', 'waiter'])
+        self.assertTrue(results['leader']['is_error'])
+        self.assertEqual(results['waiter'], {'summary': '재시도'})
+
+    def test_complete_does_not_share_error(self):
+        token = self.flight.try_lead('key')
+        self.assertIsNotNone(token)
+        self.flight.complete('key', token, dict(self.ERROR))
+        self.assertEqual(self.flight.run('key', generate=lambda: {'summary': '새 요약'}), {'summary': '새 요약'})
+
+
+class NGramSearchEngineTests(SimpleTestCase):
+    """BM25 순위, 날짜 범위, 수정/삭제 반영"""
+
+    def setUp(self):
+        self.engine = NGramSearchEngine()
+        self.engine.add_document(1, '반도체 수출 증가', '반도체 업황 회복으로 반도체 수출이 늘었다', date(2025, 3, 1))
+        self.engine.add_document(2, '환율 동향', '반도체 업계도 환율 영향을 받는다', date(2025, 3, 2))
+        self.engine.add_document(3, '증시 마감', '코스피가 소폭 올랐다', date(2025, 4, 1))
+
+    def test_bm25_ranks_by_term_frequency_and_title(self):
+        results = self.engine.search('반도체')
+        self.assertEqual([news_id for news_id, _ in results], [1, 2])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual(self.engine.search('없는말'), [])
+
+    def test_date_range_filters_before_limit(self):
+        self.assertEqual(self.engine.search_ids('반도체', limit=1, start_date=date(2025, 3, 2)), [2])
+        self.assertEqual(self.engine.daily_counts('반도체'), {date(2025, 3, 1): 1, date(2025, 3, 2): 1})
+
+    def test_update_and_delete_replace_postings(self):
+        self.engine.add_document(2, '환율 동향', '달러 강세가 이어졌다', date(2025, 3, 2))
+        self.assertEqual(self.engine.search_ids('반도체'), [1])
+        self.assertEqual(self.engine.search_ids('달러'), [2])
+
+        self.assertTrue(self.engine.remove_document(1))
+        self.assertFalse(self.engine.remove_document(1))
+        self.assertEqual(self.engine.search_ids('반도체'), [])
+        self.assertEqual(len(self.engine), 2)
+
+    def test_save_and_load_keep_deletions(self):
+        self.engine.remove_document(1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'search_index.bin')
+            self.engine.save(path)
+            loaded = NGramSearchEngine.load(path)
+        self.assertEqual(loaded.search_ids('반도체'), [2])
+        loaded.add_document(2, '환율', '달러', date(2025, 3, 2))
+        self.assertEqual(loaded.search_ids('반도체'), [])
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=False, NEWS_ROLLUP_ENABLED=False, STORY_CLUSTER_ENABLED=False,
+                   SUMMARY_REFRESH_ENABLED=False)
+class SearchEngineSyncTests(TestCase):
+    """로드된 전문 검색 엔진은 뉴스 저장/수정/삭제를 커밋 후에 반영"""
+
+    def test_save_update_delete_after_commit(self):
+        engine = NGramSearchEngine()
+        with mock.patch('web.signals.get_loaded_search_engine', return_value=engine):
+            with self.captureOnCommitCallbacks(execute=True):
+                news = create_news(date(2025, 3, 1), '반도체', title='반도체 수출')
+                self.assertEqual(engine.search_ids('반도체'), [])  # 커밋 전에는 반영하지 않음
+            self.assertEqual(engine.search_ids('반도체'), [news.id])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                news.title = '환율 동향'
+                news.save()
+            self.assertEqual(engine.search_ids('반도체'), [])
+            self.assertEqual(engine.search_ids('환율'), [news.id])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                news.delete()
+            self.assertEqual(engine.search_ids('환율'), [])
+
+
+def create_summary(keyword, day, group_by='1day', **kwargs):
+    return NewsSummary.objects.create(
+        keyword=keyword, date=day, group_by=group_by,
+        background='배경', core_content='내용', conclusion='결론', **kwargs
+    )
+
+
+@override_settings(STORY_CLUSTER_ENABLED=False, SUMMARY_REFRESH_ENABLED=True)
+class SummaryStaleMarkingTests(TestCase):
+    """새 뉴스가 걸리는 검색어/기간의 요약만 커밋 후 stale로 표시"""
+
+    DAY = date(2025, 3, 12)  # 수요일
+
+    def stale(self, summary):
+        summary.refresh_from_db()
+        return summary.is_stale
+
+    def test_marks_touched_periods_only(self):
+        day = create_summary('삼성', self.DAY)
+        week = create_summary('삼성', self.DAY - timedelta(days=2), '1week')
+        month = create_summary('삼성', self.DAY.replace(day=1), '1month')
+        other_day = create_summary('삼성', self.DAY + timedelta(days=1))
+        other_query = create_summary('현대', self.DAY)
+        spaced_query = create_summary('삼성 전자', self.DAY)
+        hover = DailySummary.objects.create(date=self.DAY, query='전자', title_summary='t', content_summary='c',
+                                            news_count=1)
+        quick = QuickSummary.objects.create(keyword='삼성', summary='s', date_range='')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_news(self.DAY, '삼성 전자,반도체')
+
+        for summary in (day, week, month, spaced_query, hover, quick):
+            self.assertTrue(self.stale(summary), summary)
+        for summary in (other_day, other_query):
+            self.assertFalse(self.stale(summary), summary)
+
+    def test_overall_summary_marked_within_its_range(self):
+        in_range = create_summary('삼성', date(2025, 1, 1), is_overall=True, end_date=date(2025, 6, 30))
+        open_ended = create_summary('삼성', date(2025, 2, 1), is_overall=True)
+        before = create_summary('삼성', date(2024, 1, 1), is_overall=True, end_date=date(2024, 12, 31))
+        same_start_day = create_summary('삼성', date(2025, 1, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_news(self.DAY, '삼성')
+
+        self.assertTrue(self.stale(in_range))
+        self.assertTrue(self.stale(open_ended))
+        self.assertFalse(self.stale(before))
+        self.assertFalse(self.stale(same_start_day))
+
+    def test_rolled_back_news_is_not_carried_over(self):
+        rolled_back = create_summary('현대', self.DAY)
+        committed = create_summary('기아', self.DAY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    create_news(self.DAY, '현대')
+                    raise RuntimeError('rollback')
+            except RuntimeError:
+                pass
+            create_news(self.DAY, '기아')
+
+        self.assertFalse(self.stale(rolled_back))
+        self.assertTrue(self.stale(committed))
+
+
+@override_settings(STORY_CLUSTER_ENABLED=False, SUMMARY_REFRESH_ENABLED=False)
+class SummaryRefreshTests(TestCase):
+    """stale 요약은 저장된 기간(전체 요약은 저장된 날짜 범위)의 새 기사만으로 갱신"""
+
+    def refresh(self, summary):
+        refreshed = {'background': '새 배경', 'core_content': '새 내용', 'conclusion': '새 결론'}
+        with mock.patch.object(LLMService, 'refresh_structured_summary', return_value=refreshed) as refresh:
+            result = SummaryService().refresh_summary(summary.keyword, summary.date, summary.group_by,
+                                                      summary.is_overall)
+        summary.refresh_from_db()
+        return result, refresh
+
+    def test_overall_refresh_uses_saved_range(self):
+        old = create_news(date(2025, 1, 5), '금리')
+        summary = create_summary('금리', date(2025, 1, 1), is_overall=True, end_date=date(2025, 6, 30),
+                                 last_news_id=old.id, is_stale=True)
+        in_range = create_news(date(2025, 4, 1), '금리')
+        create_news(date(2025, 7, 1), '금리')  # 범위 밖 (id는 더 큼)
+
+        result, refresh = self.refresh(summary)
+
+        self.assertTrue(result)
+        self.assertEqual(refresh.call_count, 1)
+        self.assertEqual(len(refresh.call_args.args[1]), 1)
+        self.assertEqual(summary.last_news_id, in_range.id)
+        self.assertEqual(summary.background, '새 배경')
+        self.assertFalse(summary.is_stale)
+
+    def test_period_refresh_uses_its_period(self):
+        old = create_news(date(2025, 4, 1), '금리')
+        summary = create_summary('금리', date(2025, 4, 1), '1month', last_news_id=old.id, is_stale=True)
+        in_month = create_news(date(2025, 4, 20), '금리')
+        create_news(date(2025, 5, 2), '금리')
+
+        result, refresh = self.refresh(summary)
+
+        self.assertTrue(result)
+        self.assertEqual(len(refresh.call_args.args[1]), 1)
+        self.assertEqual(summary.last_news_id, in_month.id)
+
+    def test_overall_and_period_rows_are_separate(self):
+        create_summary('금리', date(2025, 1, 1))
+        create_summary('금리', date(2025, 1, 1), is_overall=True, end_date=date(2025, 6, 30))
+        self.assertEqual(NewsSummary.objects.filter(keyword='금리', date=date(2025, 1, 1)).count(), 2)
+
+
+@override_settings(KEYWORD_INDEX_ENABLED=False, NEWS_ROLLUP_ENABLED=False, STORY_CLUSTER_ENABLED=False,
+                   SUMMARY_REFRESH_ENABLED=False, SUMMARY_HIERARCHICAL=True,
+                   SUMMARY_HIERARCHY_MAX_GENERATE=3, SUMMARY_HIERARCHY_MIN_CACHED_RATIO=0.8)
+class HierarchicalSummaryTests(TestCase):
+    """월 요약은 저장된 일별 요약을 합쳐서 만들고, 없는 일별 요약은 제한된 수만 만들거나 작업 큐에 등록"""
+
+    DAYS = [date(2025, 3, day) for day in range(1, 11)]
+
+    def setUp(self):
+        cache.clear()
+        for day in self.DAYS:
+            create_news(day, '반도체')
+
+    def plan(self):
+        return SummaryService()._plan_children('반도체', '2025-03-01', '1month', None, None)
+
+    def test_month_summary_reduces_saved_daily_summaries(self):
+        for day in self.DAYS:
+            create_summary('반도체', day)
+        reduced = {'background': '월 배경', 'core_content': '월 내용', 'conclusion': '월 결론'}
+        with mock.patch.object(LLMService, 'reduce_summaries', return_value=reduced) as reduce, \
+                mock.patch.object(LLMService, 'generate_structured_summary') as flat:
+            summary = SummaryService().generate_summary('반도체', '2025-03-01', '1month', None, None)
+
+        self.assertEqual(summary['background'], '월 배경')
+        self.assertEqual(len(reduce.call_args.args[0]), len(self.DAYS))
+        flat.assert_not_called()
+        self.assertTrue(NewsSummary.objects.filter(keyword='반도체', group_by='1month',
+                                                   date=date(2025, 3, 1)).exists())
+
+    def test_generates_at_most_max_generate_children(self):
+        for day in self.DAYS[:8]:
+            create_summary('반도체', day)
+        with override_settings(SUMMARY_HIERARCHY_MAX_GENERATE=1):
+            child_group_by, children, missing = self.plan()
+
+        self.assertEqual(child_group_by, '1day')
+        self.assertEqual(len(children), 8)
+        self.assertEqual(missing, self.DAYS[8:9])
+        self.assertFalse(SummaryJob.objects.exists())
+
+    def test_too_many_missing_children_falls_back_without_jobs(self):
+        create_summary('반도체', self.DAYS[0])
+        self.assertIsNone(self.plan())
+        self.assertFalse(SummaryJob.objects.exists())
+
+    @override_settings(SUMMARY_ASYNC_JOBS=True)
+    def test_missing_children_are_queued_when_async_jobs_enabled(self):
+        create_summary('반도체', self.DAYS[0])
+        self.assertIsNone(self.plan())
+        self.plan()  # 같은 하위 요약 작업은 다시 만들지 않음
+
+        queued = SummaryJob.objects.filter(status=SummaryJob.PENDING)
+        self.assertEqual(queued.count(), len(self.DAYS) - 1)
+        self.assertEqual({job.params['group_by'] for job in queued}, {'1day'})
+
+
+@override_settings(SUMMARY_JOB_MAX_ATTEMPTS=2, SUMMARY_JOB_RETRY_SECONDS=10, SUMMARY_JOB_TIMEOUT_SECONDS=300)
+class SummaryJobQueueTests(TestCase):
+    """요약 작업 큐의 중복 등록 방지, 선점, 실패 재시도와 선점 만료"""
+
+    PARAMS = {'query': '금리', 'date': '2025-03-01', 'group_by': '1day', 'start_date': None, 'end_date': None}
+    RESULT = {'background': '배경', 'core_content': '내용', 'conclusion': '결론'}
+
+    def setUp(self):
+        self.service = SummaryJobService()
+
+    def run_job(self, job, result):
+        with mock.patch.object(SummaryService, 'get_saved_summary', return_value=None), \
+                mock.patch.object(SummaryService, 'generate_summary', return_value=result):
+            return self.service.run(job)
+
+    def test_enqueue_reuses_active_job(self):
+        first = self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS)
+        self.assertEqual(self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS).id, first.id)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SummaryJob.objects.create(kind=first.kind, key=first.key, active_key=first.key, params=self.PARAMS)
+
+        job = self.service.claim('worker-1')
+        self.run_job(job, self.RESULT)
+        # 끝난 작업은 다시 요청하면 새 작업으로 등록
+        self.assertNotEqual(self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS).id, first.id)
+
+    def test_claim_is_exclusive(self):
+        self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS)
+        job = self.service.claim('worker-1')
+        self.assertEqual((job.status, job.locked_by, job.attempts), (SummaryJob.RUNNING, 'worker-1', 1))
+        self.assertIsNone(self.service.claim('worker-2'))
+
+    def test_error_result_is_retried_with_backoff_then_failed(self):
+        job = self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS)
+        failed = {**self.RESULT, 'is_error': True}
+
+        job = self.run_job(self.service.claim('worker-1'), failed)
+        self.assertEqual(job.status, SummaryJob.PENDING)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=5))
+        self.assertIsNone(self.service.claim('worker-1'))  # 백오프 중에는 선점하지 않음
+
+        SummaryJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        job = self.run_job(self.service.claim('worker-1'), failed)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.active_key), (SummaryJob.FAILED, 2, None))
+
+    def test_expired_lease_discards_late_result(self):
+        self.service.enqueue(SummaryJob.KIND_SUMMARY, self.PARAMS)
+        slow = self.service.claim('worker-1')
+        SummaryJob.objects.filter(id=slow.id).update(locked_at=timezone.now() - timedelta(seconds=600))
+        taken = self.service.claim('worker-2')
+        self.assertEqual(taken.id, slow.id)
+
+        job = self.run_job(slow, self.RESULT)
+        self.assertEqual((job.status, job.locked_by), (SummaryJob.RUNNING, 'worker-2'))
+        job = self.run_job(taken, self.RESULT)
+        self.assertEqual(job.status, SummaryJob.DONE)
+        self.assertEqual(job.result, self.RESULT)
+
+
+class MetricsEndpointTests(SimpleTestCase):
+    """/metrics는 허용 IP 또는 Bearer 토큰으로만 조회 가능"""
+
+    def get(self, **extra):
+        return self.client.get(reverse('web:metrics'), **extra)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.5'], METRICS_TOKEN='')
+    def test_allowed_ip(self):
+        self.assertEqual(self.get(REMOTE_ADDR='10.0.0.5').status_code, 200)
+        self.assertEqual(self.get(REMOTE_ADDR='203.0.113.7').status_code, 404)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN='secret')
+    def test_bearer_token(self):
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer wrong').status_code, 404)
+        self.assertEqual(self.get().status_code, 404)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN='')
+    def test_denied_without_token_or_ip(self):
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer ').status_code, 404)
+
+
+def chat_response(content):
+    return mock.Mock(choices=[mock.Mock(message=mock.Mock(content=content))], usage=None)
+
+
+class ScriptedBackend(LLMBackend):
+    """호출 순서대로 정해 둔 (지연 초, 응답 또는 예외)를 돌려주는 테스트 백엔드"""
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            delay, outcome = self.steps[min(self.calls, len(self.steps) - 1)]
+            self.calls += 1
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def stream(self, **kwargs):
+        return self.create(**kwargs)
+
+    async def acreate(self, **kwargs):
+        return self.create(**kwargs)
+
+
+def connection_error():
+    return openai.APIConnectionError(request=httpx.Request('POST', 'https://llm.example.com'))
+
+
+@override_settings(LLM_MAX_RETRIES=2, LLM_BACKOFF_BASE_SECONDS=0.01, LLM_BACKOFF_MAX_SECONDS=0.05,
+                   LLM_DEADLINE_SECONDS=5, LLM_HEDGE_AFTER_SECONDS=None)
+class LLMClientTests(SimpleTestCase):
+    """LLM 호출 재시도(백오프, 기한)와 hedged request"""
+
+    MESSAGES = [{'role': 'user', 'content': '요약해 주세요'}]
+
+    def chat(self, client):
+        return client.chat(model='test-model', messages=self.MESSAGES, max_tokens=10)
+
+    def test_retryable_error_is_retried(self):
+        ok = chat_response('완료')
+        backend = ScriptedBackend((0, connection_error()), (0, ok))
+        self.assertIs(self.chat(LLMClient(backend)), ok)
+        self.assertEqual(backend.calls, 2)
+
+    def test_gives_up_after_max_retries_and_on_client_errors(self):
+        backend = ScriptedBackend((0, connection_error()))
+        with self.assertRaises(openai.APIConnectionError):
+            self.chat(LLMClient(backend))
+        self.assertEqual(backend.calls, 3)
+
+        backend = ScriptedBackend((0, ValueError('잘못된 요청')))
+        with self.assertRaises(ValueError):
+            self.chat(LLMClient(backend))
+        self.assertEqual(backend.calls, 1)
+
+    @override_settings(LLM_BACKOFF_BASE_SECONDS=10, LLM_BACKOFF_MAX_SECONDS=10)
+    def test_retry_delay_is_clamped_to_deadline(self):
+        client = LLMClient(ScriptedBackend((0, None)))
+        delay = client._retry_delay(connection_error(), 0, time.monotonic() + 0.2)
+        self.assertIsNotNone(delay)
+        self.assertLessEqual(delay, 0.2)
+        self.assertIsNone(client._retry_delay(connection_error(), 0, time.monotonic() - 0.1))
+
+    @override_settings(LLM_HEDGE_AFTER_SECONDS=0.05)
+    def test_slow_primary_is_hedged(self):
+        fast = chat_response('빠른 응답')
+        backend = ScriptedBackend((1.0, chat_response('느린 응답')), (0, fast))
+        started = time.monotonic()
+        self.assertIs(self.chat(LLMClient(backend)), fast)
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertEqual(backend.calls, 2)
+
+    @override_settings(LLM_REQUESTS_PER_MINUTE=60, LLM_TOKENS_PER_MINUTE=60)
+    def test_hedge_check_keeps_buckets_when_either_is_short(self):
+        client = LLMClient(ScriptedBackend((0, None)))
+        self.assertFalse(client._can_hedge(1000))  # 토큰 부족 - 요청 수는 그대로
+        self.assertTrue(client.requests.try_reserve(60))
+
+        client = LLMClient(ScriptedBackend((0, None)))
+        client.requests.try_reserve(60)
+        self.assertFalse(client._can_hedge(10))  # 요청 수 부족 - 차감한 토큰은 돌려줌
+        self.assertTrue(client.tokens.try_reserve(60))
+
+
+@override_settings(STORY_CLUSTER_ENABLED=False, SUMMARY_REFRESH_ENABLED=False)
+class HoverSummaryRefreshTests(TestCase):
+    """stale 호버 요약은 기존 요약 + 새 기사만으로 LLMService의 공용 프롬프트를 거쳐 갱신"""
+
+    def test_refresh_with_previous_summary_and_new_articles(self):
+        old = create_news(date(2025, 3, 3), '환율', title='이전 기사')
+        saved = DailySummary.objects.create(
+            date=date(2025, 3, 3), query='환율', group_by='1day', title_summary='이전 제목',
+            content_summary='이전 내용', news_count=1, last_news_id=old.id, is_stale=True
+        )
+        new = create_news(date(2025, 3, 3), '환율', title='새 기사')
+        client = mock.Mock()
+        client.chat.return_value = chat_response('- 제목 요약: 새 제목\n- 내용 요약: 새 내용')
+
+        with mock.patch('web.services.llm_service.get_llm_client', return_value=client):
+            self.assertTrue(DailyIssueService().refresh_summary(saved.id))
+
+        prompt = client.chat.call_args.kwargs['messages'][1]['content']
+        self.assertIn('- 제목 요약: 이전 제목', prompt)
+        self.assertIn('새 기사', prompt)
+        self.assertNotIn('이전 기사', prompt)
+        saved.refresh_from_db()
+        self.assertEqual((saved.title_summary, saved.content_summary), ('새 제목', '새 내용'))
+        self.assertEqual((saved.news_count, saved.last_news_id), (2, new.id))
+
+    def test_failed_refresh_keeps_summary_stale(self):
+        saved = DailySummary.objects.create(
+            date=date(2025, 3, 3), query='환율', group_by='1day', title_summary='이전 제목',
+            content_summary='이전 내용', news_count=0, is_stale=True
+        )
+        create_news(date(2025, 3, 3), '환율')
+        client = mock.Mock()
+        client.chat.return_value = chat_response('한 줄 응답')
+
+        with mock.patch('web.services.llm_service.get_llm_client', return_value=client):
+            self.assertFalse(DailyIssueService().refresh_summary(saved.id))
+
+        saved.refresh_from_db()
+        self.assertTrue(saved.is_stale)
+        self.assertEqual(saved.title_summary, '이전 제목')
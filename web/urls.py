@@ -13,6 +13,7 @@ urlpatterns = [
     # v2 뉴스 검색 관련 API
     path('api/v2/news/chart/', views.news_count_chart_api, name='news_count_chart_api'),
     path('api/v2/news/summary/', views.get_summary_api, name='get_summary_api'),
+    path('api/v2/news/summary/stream/', views.stream_summary_api, name='stream_summary_api'),
     path('api/v2/news/', views.get_news_api, name='get_news_api'),
 
     # 추가 기능 API
@@ -21,4 +22,15 @@ urlpatterns = [
     path('api/v2/news/hover-summary/<str:date>/', views.get_hover_summary, name='get_hover_summary'),
     path('api/news/<int:news_id>', views.news_detail_api, name='news_detail_api'),
     path('api/v2/news/quick-summary/', views.get_quick_summary_api, name='get_quick_summary_api'),
+    path('api/v2/news/quick-summary/stream/', views.stream_quick_summary_api, name='stream_quick_summary_api'),
+    path('api/v2/jobs/<int:job_id>/', views.get_summary_job_api, name='get_summary_job_api'),
+
+    # LLM 호출 API의 비동기 버전 (ASGI 서버에서 사용 - 예: uvicorn Issuebeat.asgi:application)
+    path('api/v2/async/news/summary/', views.get_summary_api_async, name='get_summary_api_async'),
+    path('api/v2/async/news/quick-summary/', views.get_quick_summary_api_async, name='get_quick_summary_api_async'),
+    path('api/v2/async/news/hover-summary/<str:date>/', views.get_hover_summary_async,
+         name='get_hover_summary_async'),
+
+    # Prometheus 메트릭
+    path('metrics', views.metrics, name='metrics'),
 ]
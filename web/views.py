@@ -2,15 +2,25 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.shortcuts import render
-from django.http import JsonResponse
-from django.db.models import Q, Count
-from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
-from datetime import datetime, timedelta
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db.models import Q
+from django.db.models.functions import Substr
+from datetime import datetime
+import base64
+import hmac
 from django.core.paginator import Paginator
-from .models import News, SearchHistory, NewsSummary, DailySummary, QuickSummary
-from .services.llm_service import LLMService
+from .models import News, SearchHistory, DailySummary, SummaryJob
 from .services.daily_issue_service import DailyIssueService
+from .services.metrics import registry as metrics_registry
+from .services.search_engine import get_search_engine
+from .services.autocomplete_service import AutocompleteService
+from .services.news_filter import get_news_filter
+from .services.search_counter_service import search_counter
+from .services.summary_service import SummaryService
+from .services.summary_job_service import SummaryJobService
 
 
 def splash(request):
@@ -31,85 +41,10 @@ def search_view(request):
     if not query:
         return render(request, 'web/search.html')
 
-    search_history, created = SearchHistory.objects.get_or_create(
-        keyword=query,
-        defaults={'count': 1}
-    )
-    if not created:
-        search_history.count += 1
-        search_history.save()
+    search_counter.record(query)
 
     return render(request, 'web/search.html', {'query': query})
 
-def get_news_filter(query, group_by='1day', start_date=None, end_date=None, selected_date=None, for_chart=False):
-    """
-    뉴스 데이터를 필터링하고 집계하는 공통 함수
-    """
-    # 1. 날짜 파라미터 처리
-    if isinstance(start_date, str) and start_date:  # 빈 문자열 체크 추가
-        try:
-            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-        except ValueError:
-            start_date = None
-            
-    if isinstance(end_date, str) and end_date:  # 빈 문자열 체크 추가
-        try:
-            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-        except ValueError:
-            end_date = None
-            
-    if isinstance(selected_date, str) and selected_date:  # 빈 문자열 체크 추가
-        try:
-            selected_date = datetime.strptime(selected_date, '%Y-%m-%d').date()
-        except ValueError:
-            selected_date = None
-
-    # 2. 기본 날짜 범위 설정
-    if not end_date:
-        end_date = datetime.now().date()
-    if not start_date:
-        start_date = end_date - timedelta(days=365)
-
-    # 3. 기본 쿼리셋 생성 (검색어 필터링)
-    queryset = News.objects.filter(
-        Q(keyword__icontains=query)
-    )
-
-    # 4. 선택된 날짜가 있는 경우 날짜 범위 계산
-    if selected_date:
-        if group_by == '1week':
-            start_date = selected_date - timedelta(days=selected_date.weekday())
-            end_date = start_date + timedelta(days=6)
-        elif group_by == '1month':
-            start_date = selected_date.replace(day=1)
-            if selected_date.month == 12:
-                end_date = selected_date.replace(year=selected_date.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                end_date = selected_date.replace(month=selected_date.month + 1, day=1) - timedelta(days=1)
-        else:
-            start_date = end_date = selected_date
-
-    # 5. 날짜 필터 적용
-    queryset = queryset.filter(date__range=[start_date, end_date])
-
-    # 6. 차트 데이터를 위한 집계가 필요한 경우
-    if for_chart:
-        trunc_map = {
-            '1day': TruncDay,
-            '1week': TruncWeek,
-            '1month': TruncMonth
-        }
-        trunc_func = trunc_map.get(group_by, TruncDay)
-        return (queryset
-                .annotate(period=trunc_func('date'))
-                .values('period')
-                .annotate(count=Count('id'))
-                .order_by('period'))
-
-    # 7. 일반 쿼리셋 반환 (최신순 정렬)
-    return queryset.order_by('-date')
-
-
 @api_view(['GET'])
 def get_trending_keywords_api(request):
     """트렌딩 키워드 API"""
@@ -141,6 +76,22 @@ def get_search_suggestions_api(request):
         return JsonResponse({'suggestions': []})
 
     try:
+        # 메모리 자동완성 색인 (초성/자모 단위 접두어 매칭 - 제목은 어절 시작부터, 인기도 순)
+        if AutocompleteService.is_enabled():
+            suggestions = AutocompleteService.complete(query)
+            if suggestions is not None:
+                return JsonResponse({'suggestions': suggestions})
+
+        search_engine = get_search_engine()
+        if search_engine is not None:
+            # 전문 검색 백엔드: BM25 상위 문서의 제목을 관련도 순으로
+            news_ids = search_engine.search_ids(query, limit=20)
+            titles = dict(News.objects.filter(id__in=news_ids).values_list('id', 'title'))
+            suggestions = list(dict.fromkeys(
+                titles[news_id] for news_id in news_ids if news_id in titles
+            ))[:5]
+            return JsonResponse({'suggestions': suggestions})
+
         suggestions = News.objects.filter(
             title__icontains=query
         ).values_list('title', flat=True).distinct()[:5]
@@ -174,6 +125,9 @@ def news_count_chart_api(request):
             for item in chart_data
         ]
 
+        # 호버 요약이 필요한 상위 기간을 백그라운드에서 미리 생성
+        DailyIssueService.schedule_precompute(query, group_by, start_date, end_date)
+
         return Response(response_data)
 
     except Exception as e:
@@ -183,25 +137,90 @@ def news_count_chart_api(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+def _encode_cursor(news):
+    """(date, id) 위치를 불투명한 커서 문자열로 인코딩"""
+    raw = f"{news.date.strftime('%Y-%m-%d')}:{news.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def _decode_cursor(cursor):
+    """커서 문자열을 (date, id)로 디코딩 - 잘못된 값이면 ValueError"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    date_str, news_id = base64.urlsafe_b64decode(padded.encode()).decode().split(':')
+    return datetime.strptime(date_str, '%Y-%m-%d').date(), int(news_id)
+
+NEWS_LIST_FIELDS = ('id', 'title', 'content', 'press', 'date', 'link')
+
+def _parse_news_projection(request):
+    """fields=title,date,... / snippet=N 파라미터를 (필드 목록, 본문 미리보기 길이)로 변환"""
+    fields_param = request.GET.get('fields', '').strip()
+    fields = [f for f in fields_param.split(',') if f in NEWS_LIST_FIELDS] if fields_param else []
+    fields = list(dict.fromkeys(fields)) or list(NEWS_LIST_FIELDS)
+
+    try:
+        snippet = int(request.GET.get('snippet', 0))
+    except ValueError:
+        snippet = 0
+    return fields, snippet if snippet > 0 else None
+
+def _parse_page_params(request):
+    """page/page_size 파라미터 검증 - 1 미만이거나 정수가 아니면 ValueError, page_size는 최대값으로 제한"""
+    page = int(request.GET.get('page', 1))
+    page_size = int(request.GET.get('page_size', 10))
+    if page < 1 or page_size < 1:
+        raise ValueError('page와 page_size는 1 이상이어야 합니다.')
+    return page, min(page_size, getattr(settings, 'NEWS_PAGE_SIZE_MAX', 100))
+
+def _apply_news_projection(queryset, fields, snippet):
+    """필요한 컬럼만 조회하고 본문은 DB에서 잘라서 가져옴 (id, date는 정렬/커서용으로 항상 포함)"""
+    db_fields = {'id', 'date'} | set(fields)
+    if snippet and 'content' in fields:
+        db_fields.discard('content')
+        queryset = queryset.annotate(content_snippet=Substr('content', 1, snippet))
+    return queryset.only(*db_fields)
+
+def _serialize_news(news, fields=NEWS_LIST_FIELDS, snippet=None):
+    data = {}
+    for field in fields:
+        if field == 'date':
+            data['date'] = news.date.strftime('%Y-%m-%d')
+        elif field == 'content' and snippet:
+            data['content'] = news.content_snippet
+        else:
+            data[field] = getattr(news, field)
+    return data
+
 @api_view(['GET'])
 def get_news_api(request):
-    """뉴스 목록 API"""
+    """뉴스 목록 API (page/page_size 또는 cursor 기반, fields/snippet으로 필요한 컬럼만 조회, collapse=1이면 유사 기사 묶음)"""
     try:
         query = request.GET.get('query', '').strip()
         date = request.GET.get('date', '').strip() or None
         group_by = request.GET.get('group_by', '1day').strip()
         start_date = request.GET.get('start_date', '').strip() or None
         end_date = request.GET.get('end_date', '').strip() or None
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 10))
+        try:
+            page, page_size = _parse_page_params(request)
+        except ValueError:
+            return Response(
+                {'error': '잘못된 페이지 파라미터입니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        collapse = request.GET.get('collapse', '').strip() in ('1', 'true')
 
         news_list = get_news_filter(
             query=query,
             selected_date=date if not (start_date and end_date) else None,
             start_date=start_date,
             end_date=end_date,
-            group_by=group_by
+            group_by=group_by,
+            collapse_duplicates=collapse
         )
+        fields, snippet = _parse_news_projection(request)
+        news_list = _apply_news_projection(news_list, fields, snippet)
+
+        # cursor 파라미터가 있으면 (date, id) keyset 페이지네이션 - 깊은 페이지도 비용 일정
+        if 'cursor' in request.GET:
+            return _get_news_page_by_cursor(request, news_list, page_size, fields, snippet)
 
         paginator = Paginator(news_list, page_size)
         try:
@@ -218,17 +237,10 @@ def get_news_api(request):
 
         return Response({
             'news_list': [
-                {
-                    'id': news.id,
-                    'title': news.title,
-                    'content': news.content,
-                    'press': news.press,
-                    'date': news.date.strftime('%Y-%m-%d'),
-                    'link': news.link
-                }
+                _serialize_news(news, fields, snippet)
                 for news in current_page.object_list
             ],
-            'total_count': news_list.count(),
+            'total_count': paginator.count,
             'current_page': page,
             'total_pages': paginator.num_pages,
             'has_next': current_page.has_next(),
@@ -242,9 +254,41 @@ def get_news_api(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+def _get_news_page_by_cursor(request, news_list, page_size, fields, snippet):
+    """커서 이후의 page_size건 반환 - total_count는 with_total=1일 때만 계산"""
+    cursor = request.GET.get('cursor', '').strip()
+    with_total = request.GET.get('with_total', '').strip() in ('1', 'true')
+
+    total_count = news_list.count() if with_total else None
+
+    if cursor:
+        try:
+            cursor_date, cursor_id = _decode_cursor(cursor)
+        except (ValueError, UnicodeDecodeError):
+            return Response(
+                {'error': '잘못된 커서입니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        news_list = news_list.filter(
+            Q(date__lt=cursor_date) | Q(date=cursor_date, id__lt=cursor_id)
+        )
+
+    # 한 건 더 가져와서 다음 페이지 존재 여부 판단 (COUNT 없이)
+    items = list(news_list[:page_size + 1])
+    has_next = len(items) > page_size
+    items = items[:page_size]
+
+    return Response({
+        'news_list': [_serialize_news(news, fields, snippet) for news in items],
+        'total_count': total_count,
+        'next_cursor': _encode_cursor(items[-1]) if has_next and items else None,
+        'has_next': has_next,
+        'has_previous': bool(cursor)
+    })
+
 @api_view(['GET'])
 def get_summary_api(request):
-    """뉴스 요약 API"""
+    """뉴스 요약 API (비동기 모드면 작업 등록 후 202 반환)"""
     try:
         query = request.GET.get('query', '').strip()
         date = request.GET.get('date', '').strip() or None
@@ -252,88 +296,84 @@ def get_summary_api(request):
         start_date = request.GET.get('start_date', '').strip() or None
         end_date = request.GET.get('end_date', '').strip() or None
 
-        if date:
-            try:
-                date_obj = datetime.strptime(date, '%Y-%m-%d').date()
-                if group_by == '1week':
-                    period_start = date_obj - timedelta(days=date_obj.weekday())
-                elif group_by == '1month':
-                    period_start = date_obj.replace(day=1)
-                else:
-                    period_start = date_obj
-            except ValueError:
-                period_start = None
-        else:
-            period_start = None
-            if start_date:
-                try:
-                    period_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-                except ValueError:
-                    period_start = None
-
-        cache_key = f"{query}_{period_start}_{group_by}"
-        saved_summary = NewsSummary.objects.filter(
-            keyword=query,
-            date=period_start,
-            group_by=group_by
-        ).first()
+        summary_service = SummaryService()
+        period_start = summary_service.get_period_start(date, group_by, start_date)
 
+        saved_summary = summary_service.get_saved_summary(query, period_start, group_by, not date)
         if saved_summary:
-            return Response({
-                'background': saved_summary.background,
-                'core_content': saved_summary.core_content,
-                'conclusion': saved_summary.conclusion,
-                'cached': True
+            return Response(saved_summary)
+
+        job_service = SummaryJobService()
+        if job_service.is_async_requested(request):
+            job = job_service.enqueue(SummaryJob.KIND_SUMMARY, {
+                'query': query,
+                'date': date,
+                'group_by': group_by,
+                'start_date': start_date,
+                'end_date': end_date
             })
+            return Response(job_service.to_response(job), status=status.HTTP_202_ACCEPTED)
 
-        news_list = get_news_filter(
-            query=query,
-            selected_date=date if not (start_date and end_date) else None,
-            start_date=start_date,
-            end_date=end_date,
-            group_by=group_by
-        )
+        summary = summary_service.generate_summary(query, date, group_by, start_date, end_date)
+        return Response(summary)
 
-        if not news_list.exists():
-            return Response({
-                'background': '검색된 뉴스가 없습니다.',
-                'core_content': '검색된 뉴스가 없습니다.',
-                'conclusion': '검색된 뉴스가 없습니다.',
-                'is_empty': True
-            })
+    except Exception as e:
+        print(f"요약 생성 오류: {e}")
+        return Response({
+            'background': '요약 생성 중 오류가 발생했습니다.',
+            'core_content': '요약 생성 중 오류가 발생했습니다.',
+            'conclusion': '요약 생성 중 오류가 발생했습니다.',
+            'is_error': True
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        news_data = [{
-            'title': news.title,
-            'content': news.content[:10000]
-        } for news in news_list[:10000:2]]
+def event_stream_response(events):
+    """SSE 응답 - 프록시(nginx) 버퍼링과 캐시를 끄고 이벤트를 바로 내보냄"""
+    response = StreamingHttpResponse(events, content_type='text/event-stream; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
-        llm_service = LLMService()
-        summary = llm_service.generate_structured_summary(
-            news_data,
-            search_keyword=query,
-            is_overall=not bool(date)
-        )
+async def get_summary_api_async(request):
+    """뉴스 요약 API의 비동기 버전 (ASGI에서 LLM 응답을 기다리는 동안 워커 스레드를 점유하지 않음)"""
+    try:
+        query = request.GET.get('query', '').strip()
+        date = request.GET.get('date', '').strip() or None
+        group_by = request.GET.get('group_by', '1day').strip()
+        start_date = request.GET.get('start_date', '').strip() or None
+        end_date = request.GET.get('end_date', '').strip() or None
 
-        if period_start and not saved_summary:
-            NewsSummary.objects.create(
-                keyword=query,
-                date=period_start,
-                group_by=group_by,
-                background=summary['background'],
-                core_content=summary['core_content'],
-                conclusion=summary['conclusion']
-            )
+        summary_service = SummaryService()
+        period_start = summary_service.get_period_start(date, group_by, start_date)
 
-        return Response(summary)
+        saved_summary = await sync_to_async(summary_service.get_saved_summary)(
+            query, period_start, group_by, not date
+        )
+        if saved_summary:
+            return JsonResponse(saved_summary)
+
+        summary = await summary_service.agenerate_summary(query, date, group_by, start_date, end_date)
+        return JsonResponse(summary)
 
     except Exception as e:
         print(f"요약 생성 오류: {e}")
-        return Response({
+        return JsonResponse({
             'background': '요약 생성 중 오류가 발생했습니다.',
             'core_content': '요약 생성 중 오류가 발생했습니다.',
             'conclusion': '요약 생성 중 오류가 발생했습니다.',
             'is_error': True
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        }, status=500)
+
+def stream_summary_api(request):
+    """뉴스 요약 스트리밍 API (SSE: start -> delta* -> done | error)"""
+    query = request.GET.get('query', '').strip()
+    date = request.GET.get('date', '').strip() or None
+    group_by = request.GET.get('group_by', '1day').strip()
+    start_date = request.GET.get('start_date', '').strip() or None
+    end_date = request.GET.get('end_date', '').strip() or None
+
+    return event_stream_response(
+        SummaryService().stream_summary(query, date, group_by, start_date, end_date)
+    )
 
 @api_view(['GET'])
 def get_hover_summary(request, date):
@@ -380,6 +420,37 @@ def get_hover_summary(request, date):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
     
+async def get_hover_summary_async(request, date):
+    """차트 호버 요약 API의 비동기 버전"""
+    try:
+        query = request.GET.get('query', '').strip()
+        group_by = request.GET.get('group_by', '1day').strip()
+        date_obj = datetime.strptime(date, '%Y-%m-%d').date()
+
+        issue_service = DailyIssueService()
+        start_date, end_date = issue_service.get_period_range(date_obj, group_by)
+        news_list = await sync_to_async(get_news_filter)(
+            query=query,
+            start_date=start_date,
+            end_date=end_date,
+            group_by=group_by
+        )
+        summary_data = await issue_service.aget_cached_summary(
+            date=date_obj,
+            query=query,
+            group_by=group_by,
+            news_list=news_list
+        )
+
+        return JsonResponse({
+            'date': f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
+            **summary_data
+        })
+
+    except Exception as e:
+        print(f"호버 요약 조회 오류: {e}")
+        return JsonResponse({'error': '요약을 불러오는데 실패했습니다.'}, status=500)
+
 # 뉴스 팝업 창 위한 목록 저장 api
 def news_detail_api(request, news_id):
     try:
@@ -409,69 +480,69 @@ def get_quick_summary_api(request):
         query = request.GET.get('query', '').strip()
 
         # 캐시된 요약 확인
-        cached_summary = QuickSummary.objects.filter(keyword=query).first()
+        summary_service = SummaryService()
+        cached_summary = summary_service.get_saved_quick_summary(query)
         if cached_summary:
-            return Response({
-                'summary': cached_summary.summary,
-                'news_count': cached_summary.news_count,
-                'date_range': cached_summary.date_range,
-                'cached': True
-            })
+            return Response(cached_summary)
 
-        # 전체 기간의 뉴스 데이터 조회
-        news_list = list(get_news_filter(query=query))  # QuerySet을 list로 변환
-        
-        if not news_list:
-            return Response({
-                'summary': '관련 뉴스가 없습니다.',
-                'news_count': 0,
-                'date_range': '',
-                'is_empty': True
-            })
+        job_service = SummaryJobService()
+        if job_service.is_async_requested(request):
+            job = job_service.enqueue(SummaryJob.KIND_QUICK_SUMMARY, {'query': query})
+            return Response(job_service.to_response(job), status=status.HTTP_202_ACCEPTED)
 
-        # 날짜 범위 계산
-        sorted_news = sorted(news_list, key=lambda x: x.date)
-        first_news = sorted_news[0]
-        last_news = sorted_news[-1]
-        date_range = f"{first_news.date.strftime('%Y-%m-%d')}~{last_news.date.strftime('%Y-%m-%d')}"
+        return Response(summary_service.generate_quick_summary(query))
 
-        # 대표 뉴스 선택 (시작, 중간, 최근)
-        total_news = len(news_list)
-        if total_news <= 5:
-            sample_news = news_list
-        else:
-            middle_index = total_news // 2
-            indices = [0, middle_index, total_news-1]  # 시작, 중간, 끝 인덱스
-            sample_news = [sorted_news[i] for i in indices]
-
-        # LLM 서비스로 요약 생성
-        llm_service = LLMService()
-        news_data = [{
-            'title': news.title,
-            'content': news.content[:300],  # 내용 길이 제한
-            'date': news.date.strftime('%Y-%m-%d')
-        } for news in sample_news]
-
-        result = llm_service.generate_quick_summary(news_data, query)
-
-        # 요약 결과 저장
-        QuickSummary.objects.create(
-            keyword=query,
-            summary=result['summary'],
-            news_count=total_news,
-            date_range=date_range
+    except Exception as e:
+        print(f"Quick summary 생성 오류: {e}")
+        return Response(
+            {'error': '요약을 생성하는데 실패했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-        return Response({
-            'summary': result['summary'],
-            'news_count': total_news,
-            'date_range': date_range,
-            'cached': False
-        })
+async def get_quick_summary_api_async(request):
+    """간단 요약 API의 비동기 버전"""
+    try:
+        query = request.GET.get('query', '').strip()
+        summary_service = SummaryService()
+
+        cached_summary = await sync_to_async(summary_service.get_saved_quick_summary)(query)
+        if cached_summary:
+            return JsonResponse(cached_summary)
+
+        return JsonResponse(await summary_service.agenerate_quick_summary(query))
 
     except Exception as e:
         print(f"Quick summary 생성 오류: {e}")
+        return JsonResponse({'error': '요약을 생성하는데 실패했습니다.'}, status=500)
+
+def stream_quick_summary_api(request):
+    """간단 요약 스트리밍 API (SSE: start -> delta* -> done | error)"""
+    query = request.GET.get('query', '').strip()
+    return event_stream_response(SummaryService().stream_quick_summary(query))
+
+@api_view(['GET'])
+def get_summary_job_api(request, job_id):
+    """요약 작업 상태 조회 API (완료되면 result 포함)"""
+    try:
+        job = SummaryJob.objects.get(id=job_id)
+    except SummaryJob.DoesNotExist:
         return Response(
-            {'error': '요약을 생성하는데 실패했습니다.'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+            {'error': '작업을 찾을 수 없습니다.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(SummaryJobService().to_response(job))
+
+def _metrics_access_allowed(request) -> bool:
+    """허용 IP(METRICS_ALLOWED_IPS)에서 왔거나 Bearer 토큰(METRICS_TOKEN)이 맞는 요청만 허용"""
+    if request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ['127.0.0.1', '::1']):
+        return True
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    return bool(token) and hmac.compare_digest(authorization.encode(), f'Bearer {token}'.encode())
+
+
+def metrics(request):
+    """Prometheus 수집용 메트릭 (METRICS_DIR가 있으면 모든 워커 프로세스 합산)"""
+    if not getattr(settings, 'METRICS_ENABLED', True) or not _metrics_access_allowed(request):
+        raise Http404
+    return HttpResponse(metrics_registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')